@@ -0,0 +1,48 @@
+"""store the attendance archive cutoff and newest date in table_versions
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-03-19 00:00:00.000000
+
+Both dates are seeded from the newest archived row, so databases archived
+before this revision keep reading (and protecting) their archive.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a2b3c4d5e6f7"
+down_revision: Union[str, None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NAMES = ("attendance_archive_cutoff", "attendance_archive_newest")
+
+attendance_archive = sa.table("attendance_archive", sa.column("date", sa.Date))
+table_versions = sa.table(
+    "table_versions",
+    sa.column("name", sa.String),
+    sa.column("version", sa.Integer),
+)
+
+
+def upgrade() -> None:
+    # Stored as YYYYMMDD; 0 while the archive is empty.
+    newest = op.get_bind().execute(
+        sa.select(sa.func.max(attendance_archive.c.date))
+    ).scalar()
+    version = newest.year * 10000 + newest.month * 100 + newest.day if newest else 0
+    op.bulk_insert(table_versions, [{"name": name, "version": version} for name in NAMES])
+
+    # Offboarding archives recent days, so date-range reads union the
+    # archive much more often.
+    op.create_index(
+        "ix_attendance_archive_date", "attendance_archive", ["date"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attendance_archive_date", table_name="attendance_archive")
+    op.execute(table_versions.delete().where(table_versions.c.name.in_(NAMES)))
@@ -0,0 +1,30 @@
+"""add (table_name, table_id) index on auth
+
+Revision ID: a6b7c8d9e0f1
+Revises: f5a6b7c8d9e0
+Create Date: 2026-03-08 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a6b7c8d9e0f1"
+down_revision: Union[str, None] = "f5a6b7c8d9e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Login by email and password changes resolve Auth from its owner row.
+    op.create_index(
+        "ix_auth_table_name_table_id",
+        "auth",
+        ["table_name", "table_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_table_name_table_id", table_name="auth")
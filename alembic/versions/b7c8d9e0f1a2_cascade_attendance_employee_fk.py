@@ -0,0 +1,51 @@
+"""cascade attendance rows when their employee is deleted
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-03-10 00:00:00.000000
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b7c8d9e0f1a2"
+down_revision: Union[str, None] = "a6b7c8d9e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = "fk_attendance_employee_id_users"
+# Lets batch mode (SQLite) address the FK created unnamed by the initial
+# migration; other backends report the generated name via the inspector.
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _employee_fk_name() -> Optional[str]:
+    inspector = sa.inspect(op.get_bind())
+    for fk in inspector.get_foreign_keys("attendance"):
+        if fk["constrained_columns"] == ["employee_id"] and fk["referred_table"] == "users":
+            return fk["name"]
+    return None
+
+
+def _recreate_fk(ondelete: Optional[str]) -> None:
+    fk_name = _employee_fk_name() or FK_NAME
+    with op.batch_alter_table(
+        "attendance", naming_convention=NAMING_CONVENTION
+    ) as batch_op:
+        batch_op.drop_constraint(fk_name, type_="foreignkey")
+        batch_op.create_foreign_key(
+            FK_NAME, "users", ["employee_id"], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    # Deleting an employee no longer loads and deletes each attendance row
+    # through the ORM; the database removes them.
+    _recreate_fk("CASCADE")
+
+
+def downgrade() -> None:
+    _recreate_fk(None)
@@ -0,0 +1,47 @@
+"""tombstone departed employees' archived attendance with their employee_id
+
+Revision ID: c4d5e6f7a8b9
+Revises: a2b3c4d5e6f7
+Create Date: 2026-03-20 00:00:00.000000
+
+Archived rows are keyed by the raw users.id, which can be reused once the
+highest id is deleted (SQLite rowids, MySQL before 8.0 after a restart).
+Offboarding now stamps the rows with the employee's employee_id string and
+reads join users only to unstamped rows. Rows already orphaned get an
+empty stamp, so a future user with their id does not inherit them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, None] = "a2b3c4d5e6f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+attendance_archive = sa.table(
+    "attendance_archive",
+    sa.column("employee_id", sa.Integer),
+    sa.column("employee_code", sa.String),
+)
+users = sa.table("users", sa.column("id", sa.Integer))
+
+
+def upgrade() -> None:
+    op.add_column(
+        "attendance_archive",
+        sa.Column("employee_code", sa.String(length=255), nullable=True),
+    )
+    op.execute(
+        attendance_archive.update()
+        .where(
+            ~sa.exists().where(users.c.id == attendance_archive.c.employee_id)
+        )
+        .values(employee_code="")
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("attendance_archive", "employee_code")
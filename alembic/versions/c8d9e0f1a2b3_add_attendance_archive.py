@@ -0,0 +1,106 @@
+"""add attendance archive table
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-03-12 00:00:00.000000
+
+Set ATTENDANCE_ARCHIVE_PARTITIONED=true when upgrading a MySQL database to
+partition the archive by month, from the oldest recorded attendance to a
+year ahead, plus a catch-all partition.
+"""
+import os
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c8d9e0f1a2b3"
+down_revision: Union[str, None] = "b7c8d9e0f1a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _partitioning_requested() -> bool:
+    value = os.getenv("ATTENDANCE_ARCHIVE_PARTITIONED", "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def _partition_by_month() -> None:
+    bind = op.get_bind()
+    oldest = bind.execute(sa.text("SELECT MIN(date) FROM attendance")).scalar()
+    today = date.today()
+    month = (oldest or today).replace(day=1)
+    last = date(today.year + 1, today.month, 1)
+
+    partitions = []
+    while month <= last:
+        upper = _next_month(month)
+        partitions.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{upper.isoformat()}')"
+        )
+        month = upper
+    partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    op.execute(
+        "ALTER TABLE attendance_archive PARTITION BY RANGE COLUMNS(date) ("
+        + ", ".join(partitions)
+        + ")"
+    )
+
+
+def upgrade() -> None:
+    # Old attendance moves here so the hot table stays small and its
+    # indexes stay in memory.
+    op.create_table(
+        "attendance_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint("id", "date"),
+    )
+    op.create_index(
+        "ix_attendance_archive_employee_id_date",
+        "attendance_archive",
+        ["employee_id", "date"],
+        unique=False,
+    )
+    if _partitioning_requested() and op.get_bind().dialect.name == "mysql":
+        _partition_by_month()
+
+
+def downgrade() -> None:
+    # Move archived rows back so no attendance is lost. Rows that cannot go
+    # back (their employee was offboarded, so the foreign key rejects them,
+    # or the day was re-marked in the hot table) stay behind in
+    # attendance_archive_departed, which this downgrade does not drop.
+    restorable = (
+        "FROM attendance_archive a "
+        "WHERE EXISTS (SELECT 1 FROM users u WHERE u.id = a.employee_id) "
+        "AND NOT EXISTS (SELECT 1 FROM attendance t "
+        "WHERE t.employee_id = a.employee_id AND t.date = a.date)"
+    )
+    op.execute(
+        "INSERT INTO attendance (id, employee_id, date, status) "
+        "SELECT a.id, a.employee_id, a.date, a.status " + restorable
+    )
+    op.execute(
+        "DELETE FROM attendance_archive WHERE EXISTS ("
+        "SELECT 1 FROM attendance t WHERE t.id = attendance_archive.id "
+        "AND t.date = attendance_archive.date)"
+    )
+    op.drop_index(
+        "ix_attendance_archive_employee_id_date", table_name="attendance_archive"
+    )
+    remaining = op.get_bind().execute(
+        sa.text("SELECT COUNT(*) FROM attendance_archive")
+    ).scalar()
+    if remaining:
+        op.rename_table("attendance_archive", "attendance_archive_departed")
+    else:
+        op.drop_table("attendance_archive")
@@ -0,0 +1,56 @@
+"""add unique (employee_id, date) index on attendance
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+revision: str = "d3e4f5a6b7c8"
+down_revision: Union[str, None] = "c2d3e4f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remove duplicates recorded before the constraint existed, keeping the
+    # earliest row per (employee_id, date). The derived table lets MySQL
+    # delete from the table it is selecting from.
+    removed = op.get_bind().execute(
+        sa.text(
+            "DELETE FROM attendance WHERE id NOT IN ("
+            "SELECT keep_id FROM ("
+            "SELECT MIN(id) AS keep_id FROM attendance "
+            "GROUP BY employee_id, date"
+            ") AS keep_rows)"
+        )
+    ).rowcount
+    if removed:
+        logger.warning(
+            "Removed %d duplicate attendance rows, keeping the earliest row "
+            "per (employee_id, date).",
+            removed,
+        )
+    op.create_index(
+        "ix_attendance_employee_id_date",
+        "attendance",
+        ["employee_id", "date"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    # The composite index also backs the employee_id foreign key, so give
+    # the FK its own index before dropping it.
+    op.create_index(
+        "ix_attendance_employee_id", "attendance", ["employee_id"], unique=False
+    )
+    op.drop_index("ix_attendance_employee_id_date", table_name="attendance")
@@ -0,0 +1,35 @@
+"""add table_versions change counters
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-03-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d9e0f1a2b3c4"
+down_revision: Union[str, None] = "c8d9e0f1a2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bumped on every write to a table whose listing is served with an ETag.
+    table_versions = op.create_table(
+        "table_versions",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(
+        table_versions,
+        [{"name": "departments", "version": 0}, {"name": "users", "version": 0}],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("table_versions")
@@ -0,0 +1,108 @@
+"""replace users.department names with a departments foreign key
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-03-16 00:00:00.000000
+
+Department names used by employees but missing from the departments table
+are created first, so no assignment is lost.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e0f1a2b3c4d5"
+down_revision: Union[str, None] = "d9e0f1a2b3c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = "fk_users_department_id_departments"
+INDEX_NAME = "ix_users_department_id"
+
+users = sa.table(
+    "users",
+    sa.column("id", sa.Integer),
+    sa.column("department", sa.String),
+    sa.column("department_id", sa.Integer),
+)
+departments = sa.table(
+    "departments",
+    sa.column("id", sa.Integer),
+    sa.column("name", sa.String),
+    sa.column("is_active", sa.Boolean),
+)
+
+
+def _name_key(dialect: str, name: str) -> str:
+    # MySQL compares names case-insensitively and ignores trailing spaces,
+    # so "QA" and "qa " must become a single department there.
+    return name.rstrip().casefold() if dialect == "mysql" else name
+
+
+def _create_missing_departments() -> None:
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    known = {
+        _name_key(dialect, name)
+        for name in bind.execute(sa.select(departments.c.name)).scalars()
+    }
+    missing = {}
+    used = bind.execute(
+        sa.select(users.c.department)
+        .where(users.c.department.isnot(None), users.c.department != "")
+        .distinct()
+    ).scalars()
+    for name in used:
+        if _name_key(dialect, name) not in known:
+            missing.setdefault(_name_key(dialect, name), name)
+    if missing:
+        op.bulk_insert(
+            departments,
+            [{"name": name, "is_active": True} for name in sorted(missing.values())],
+        )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("department_id", sa.Integer(), nullable=True))
+
+    _create_missing_departments()
+    op.execute(
+        sa.update(users)
+        .values(
+            department_id=sa.select(departments.c.id)
+            .where(departments.c.name == users.c.department)
+            .scalar_subquery()
+        )
+        .where(users.c.department.isnot(None), users.c.department != "")
+    )
+
+    # Department filters and report joins go through this index; renaming a
+    # department no longer touches employee rows.
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.create_index(INDEX_NAME, ["department_id"], unique=False)
+        batch_op.create_foreign_key(FK_NAME, "departments", ["department_id"], ["id"])
+        batch_op.drop_column("department")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("department", sa.String(length=255), nullable=True))
+
+    op.execute(
+        sa.update(users)
+        .values(
+            department=sa.select(departments.c.name)
+            .where(departments.c.id == users.c.department_id)
+            .scalar_subquery()
+        )
+        .where(users.c.department_id.isnot(None))
+    )
+
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_constraint(FK_NAME, type_="foreignkey")
+        batch_op.drop_index(INDEX_NAME)
+        batch_op.drop_column("department_id")
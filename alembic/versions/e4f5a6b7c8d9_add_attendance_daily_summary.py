@@ -0,0 +1,48 @@
+"""add attendance daily summary table and date index
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-03-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, None] = "d3e4f5a6b7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Org-wide reports filter on a date range across all employees.
+    op.create_index("ix_attendance_date", "attendance", ["date"], unique=False)
+
+    op.create_table(
+        "attendance_daily_summary",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        # Bounded length for MySQL indexed column
+        sa.Column("department", sa.String(length=191), nullable=False),
+        sa.Column("present_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("absent_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_attendance_daily_summary_date_department",
+        "attendance_daily_summary",
+        ["date", "department"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_attendance_daily_summary_date_department",
+        table_name="attendance_daily_summary",
+    )
+    op.drop_table("attendance_daily_summary")
+    op.drop_index("ix_attendance_date", table_name="attendance")
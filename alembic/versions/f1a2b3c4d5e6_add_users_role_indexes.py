@@ -0,0 +1,33 @@
+"""add role-leading composite indexes on users
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2026-03-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, None] = "e0f1a2b3c4d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Employee and user listings filter on role and order/seek by id.
+    op.create_index("ix_users_role_id", "users", ["role", "id"], unique=False)
+    # Active employees of a department (bulk attendance marking).
+    op.create_index(
+        "ix_users_role_is_active_department_id",
+        "users",
+        ["role", "is_active", "department_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_role_is_active_department_id", table_name="users")
+    op.drop_index("ix_users_role_id", table_name="users")
@@ -1,12 +1,19 @@
 from fastapi import APIRouter
 
+from app.config import get_settings
+from app.api.v1.async_router import router as async_router
 from app.api.v1.attendance_router import router as attendance_router
 from app.api.v1.auth_router import router as auth_router
 from app.api.v1.employee_router import router as employee_router
 from app.api.v1.department_router import router as department_router
+from app.api.v1.report_router import router as report_router
 
 api_router = APIRouter()
+if get_settings().async_db_enabled:
+    # Registered first so these take precedence over the sync routes below.
+    api_router.include_router(async_router)
 api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
 api_router.include_router(employee_router, prefix="/employees", tags=["employees"])
 api_router.include_router(attendance_router, prefix="/attendance", tags=["attendance"])
 api_router.include_router(department_router, prefix="/departments", tags=["departments"])
+api_router.include_router(report_router, prefix="/reports", tags=["reports"])
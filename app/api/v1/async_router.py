@@ -0,0 +1,122 @@
+"""
+Async variants of the busiest routes, served from AsyncSession when
+ASYNC_DB_ENABLED is set.
+
+They are mounted ahead of the sync routers with identical paths and
+contracts, so they take over those URLs without any client change. The
+sync routes stay in the OpenAPI schema as the documented contract.
+"""
+
+from datetime import date
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.api.v1.auth_router import get_current_user_async
+from app.api.v1.department_router import departments_etag
+from app.api.v1.employee_router import employees_etag
+from app.database import async_crud
+from app.database.async_session import get_async_db
+from app.service.attendance_service import (
+    bulk_records,
+    bulk_response,
+    check_bulk_payload,
+    compact_page,
+    validate_attendance,
+)
+from app.utils.http_cache import conditional
+from app.utils.pagination import attendance_page, employee_page
+
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/employees/", response_model=schemas.EmployeePage)
+async def list_employees(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[int] = None,
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    include_total: bool = True,
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = employees_etag(await async_crud.get_table_version(db, "users"))
+    not_modified = conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    filters = {"department": department, "city": city, "is_active": is_active}
+    rows = await async_crud.get_employees(
+        db, limit=limit + 1, after=after, **filters
+    )
+    total = (
+        await async_crud.count_employees(db, **filters) if include_total else None
+    )
+    return employee_page(rows, limit, total)
+
+
+@router.post("/attendance", response_model=schemas.Attendance, status_code=201)
+async def mark_attendance(
+    attendance: schemas.AttendanceCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    validate_attendance(attendance)
+    return await async_crud.mark_attendance(db, attendance)
+
+
+@router.post("/attendance/bulk", response_model=schemas.AttendanceBulkResponse)
+async def mark_attendance_bulk(
+    payload: schemas.AttendanceBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    check_bulk_payload(payload)
+    department_employee_ids = (
+        await async_crud.get_employee_ids_by_department(db, payload.department)
+        if payload.department is not None
+        else []
+    )
+    records = bulk_records(payload, department_employee_ids)
+    return bulk_response(await async_crud.mark_attendance_bulk(db, records))
+
+
+# Only integer ids, so sync-only siblings such as /attendance/export still
+# fall through to the sync router.
+@router.get(
+    "/attendance/{employee_id:int}",
+    response_model=Union[schemas.AttendancePage, schemas.AttendanceCompact],
+)
+async def get_attendance(
+    employee_id: int,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    after: Optional[date] = None,
+    limit: int = Query(366, ge=1, le=1000),
+    compact: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+):
+    window = {"start": start, "end": end, "after": after, "limit": limit + 1}
+    if compact:
+        rows = await async_crud.get_attendance_days(db, employee_id, **window)
+        return compact_page(employee_id, rows, limit)
+    rows = await async_crud.get_attendance_for_employee(db, employee_id, **window)
+    return attendance_page(rows, limit)
+
+
+@router.get("/departments/", response_model=List[schemas.Department])
+async def list_departments(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: schemas.CurrentUser = Depends(get_current_user_async),
+):
+    version = await async_crud.get_table_version(db, "departments")
+    not_modified = conditional(
+        request, response, departments_etag(version), vary="Authorization"
+    )
+    if not_modified is not None:
+        return not_modified
+    return await async_crud.get_departments(db, version)
@@ -1,25 +1,144 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app import schemas
+from app.api.v1.auth_router import get_current_admin, get_current_user
 from app.database import crud, get_db
+from app.service.attendance_service import (
+    bulk_records,
+    bulk_response,
+    check_bulk_payload,
+    compact_page,
+    validate_attendance,
+)
+from app.utils.export import export_response
+from app.utils.pagination import attendance_page
 
 router = APIRouter()
 
+# Batches moved per POST /archive request; the CLI has no limit.
+ARCHIVE_REQUEST_MAX_BATCHES = 10
+
 
 @router.post("", response_model=schemas.Attendance, status_code=201)
 def mark_attendance(
     attendance: schemas.AttendanceCreate, db: Session = Depends(get_db)
 ):
-    if not all([attendance.employee_id, attendance.date, attendance.status]):
-        raise HTTPException(status_code=422, detail="All fields are required.")
-    if attendance.status not in ["Present", "Absent"]:
+    validate_attendance(attendance)
+    return crud.mark_attendance(db, attendance)
+
+
+@router.post("/bulk", response_model=schemas.AttendanceBulkResponse)
+def mark_attendance_bulk(
+    payload: schemas.AttendanceBulkCreate, db: Session = Depends(get_db)
+):
+    """
+    Mark attendance for a batch of employees and/or a whole department.
+
+    Each record gets its own result (created, updated, duplicate, archived,
+    employee_not_found or invalid_status); valid rows are stored even if
+    others are rejected.
+    """
+    check_bulk_payload(payload)
+    department_employee_ids = (
+        crud.get_employee_ids_by_department(db, payload.department)
+        if payload.department is not None
+        else []
+    )
+    records = bulk_records(payload, department_employee_ids)
+    return bulk_response(crud.mark_attendance_bulk(db, records))
+
+
+@router.get(
+    "/export",
+    responses={
+        200: {"content": {"text/csv": {}, "application/x-ndjson": {}}}
+    },
+)
+def export_attendance(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    department: Optional[str] = None,
+    employee_id: Optional[int] = None,
+    current_user: schemas.CurrentUser = Depends(get_current_user),
+):
+    """
+    Stream attendance for a date range as CSV or NDJSON, ordered by date.
+    """
+    if start > end:
+        raise HTTPException(status_code=422, detail="'from' must not be after 'to'.")
+    return export_response(
+        crud.iter_attendance,
+        crud.ATTENDANCE_EXPORT_FIELDS,
+        format,
+        f"attendance_{start}_{end}",
+        start,
+        end,
+        department=department,
+        employee_id=employee_id,
+    )
+
+
+@router.post("/archive", response_model=schemas.AttendanceArchiveResult)
+def archive_attendance(
+    before: Optional[date] = Query(
+        None, description="Defaults to today minus ATTENDANCE_ARCHIVE_AFTER_DAYS."
+    ),
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_admin),
+):
+    """
+    Move attendance dated before `before` into the archive table. Reads of
+    archived ranges keep working; they union the archive transparently, but
+    archived days can no longer be marked.
+
+    At most ARCHIVE_REQUEST_MAX_BATCHES batches are moved per request;
+    `complete` is false when rows may remain (call again, or run
+    `python -m app.archive`).
+    """
+    horizon = crud.archive_horizon()
+    before = before or horizon
+    if before > horizon:
         raise HTTPException(
-            status_code=422, detail="Status must be 'Present' or 'Absent'."
+            status_code=422,
+            detail=f"'before' must be on or before {horizon}.",
         )
-    return crud.mark_attendance(db, attendance)
+    archived = crud.archive_attendance(
+        db, before, max_batches=ARCHIVE_REQUEST_MAX_BATCHES
+    )
+    return {
+        "before": before,
+        "archived": archived,
+        "complete": archived < ARCHIVE_REQUEST_MAX_BATCHES * crud.ARCHIVE_BATCH_SIZE,
+    }
+
 
+@router.get(
+    "/{employee_id}",
+    response_model=Union[schemas.AttendancePage, schemas.AttendanceCompact],
+)
+def get_attendance(
+    employee_id: int,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    after: Optional[date] = Query(None, description="Last date of the previous page."),
+    limit: int = Query(366, ge=1, le=1000),
+    compact: bool = Query(
+        False, description="Return parallel date/status-code arrays."
+    ),
+    db: Session = Depends(get_db),
+):
+    if compact:
+        rows = crud.get_attendance_days(
+            db, employee_id, start=start, end=end, after=after, limit=limit + 1
+        )
+        return compact_page(employee_id, rows, limit)
 
-@router.get("/{employee_id}", response_model=list[schemas.Attendance])
-def get_attendance(employee_id: int, db: Session = Depends(get_db)):
-    return crud.get_attendance_for_employee(db, employee_id)
+    rows = crud.get_attendance_for_employee(
+        db, employee_id, start=start, end=end, after=after, limit=limit + 1
+    )
+    return attendance_page(rows, limit)
@@ -1,26 +1,28 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app import models, schemas
-from app.database import crud, get_db
-from app.service.auth_service import AuthServiceFactory
+from app import schemas
+from app.database import async_crud, crud, get_db
+from app.database.async_session import get_async_db
+from app.service.auth_service import get_auth_service
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
-auth_service = AuthServiceFactory.create()
 
 
 @router.post("/login", response_model=schemas.LoginResponse)
-def login_for_access_token(
+async def login_for_access_token(
     payload: schemas.LoginRequest,
     db: Session = Depends(get_db),
 ):
-    user = auth_service.authenticate_user(
+    user = await get_auth_service().authenticate_user_async(
         db, payload.username, payload.password
     )
     if not user:
@@ -29,12 +31,7 @@ def login_for_access_token(
             detail="Incorrect username or password.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = auth_service.create_access_token(
-        data={"sub": str(user.id), "type": "access"}
-    )
-    refresh_token = auth_service.create_refresh_token(
-        data={"sub": str(user.id), "type": "refresh"}
-    )
+    access_token, refresh_token = get_auth_service().create_token_pair(user)
     return schemas.LoginResponse(
         access_token=access_token,
         refresh_token=refresh_token,
@@ -57,6 +54,7 @@ def refresh_access_token(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    auth_service = get_auth_service()
     try:
         token_data = jwt.decode(
             payload.refresh_token,
@@ -75,13 +73,10 @@ def refresh_access_token(
     user = crud.get_user(db, user_id)
     if user is None or not user.is_active:
         raise credentials_exception
+    if token_data.get("ver", 0) != user.token_version:
+        raise credentials_exception
 
-    access_token = auth_service.create_access_token(
-        data={"sub": str(user.id), "type": "access"}
-    )
-    refresh_token = auth_service.create_refresh_token(
-        data={"sub": str(user.id), "type": "refresh"}
-    )
+    access_token, refresh_token = auth_service.create_token_pair(user)
     return schemas.LoginResponse(
         access_token=access_token,
         refresh_token=refresh_token,
@@ -90,56 +85,119 @@ def refresh_access_token(
     )
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> models.User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _access_token_claims(token: str) -> dict:
+    """
+    Decode and validate an access token, returning its claims with `sub`
+    already parsed to an int user id.
+    """
+    auth_service = get_auth_service()
     try:
         payload = jwt.decode(
             token, auth_service.secret_key, algorithms=[auth_service.algorithm]
         )
+        # Refresh tokens must not be accepted as access tokens.
+        if payload.get("type", "access") != "access":
+            raise _credentials_exception()
         subject = payload.get("sub")
         if subject is None:
-            raise credentials_exception
-        user_id = int(subject)
+            raise _credentials_exception()
+        payload["sub"] = int(subject)
     except (JWTError, ValueError):
-        raise credentials_exception
-    user = crud.get_user(db, user_id)
-    if user is None or not user.is_active:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    return payload
+
+
+def _principal(claims: dict, token_version: Optional[int]) -> schemas.CurrentUser:
+    # None means the user is gone or inactive; a version mismatch means the
+    # token was revoked (e.g. role change, deactivation, password change).
+    if token_version is None or claims.get("ver", 0) != token_version:
+        raise _credentials_exception()
+    return schemas.CurrentUser(
+        id=claims["sub"],
+        role=claims.get("role"),
+        is_active=True,
+        token_version=token_version,
+    )
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> schemas.CurrentUser:
+    """
+    Authorise a request from its access-token claims. The only state checked
+    against the database is the user's token_version, which is cached
+    briefly, so most requests do not touch the users table.
+    """
+    claims = _access_token_claims(token)
+    return _principal(claims, crud.get_token_version(db, claims["sub"]))
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> schemas.CurrentUser:
+    """
+    `get_current_user` for routes running on the async database stack.
+    """
+    claims = _access_token_claims(token)
+    return _principal(
+        claims, await async_crud.get_token_version(db, claims["sub"])
+    )
+
+
+def get_current_admin(
+    current_user: schemas.CurrentUser = Depends(get_current_user),
+) -> schemas.CurrentUser:
+    """
+    `get_current_user` restricted to admins, for destructive bulk operations.
+    The role comes from the token; changing it revokes older tokens.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required.",
+        )
+    return current_user
 
 
 @router.get("/me", response_model=schemas.User)
 def read_current_user(
-    current_user: models.User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
-    return current_user
+    user = crud.get_user_cached(db, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
 
 
-@router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
-def change_password(
+@router.post("/change-password", response_model=schemas.LoginResponse)
+async def change_password(
     payload: schemas.ChangePasswordRequest,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
     """
     Allow the currently authenticated user to change their own password.
+
+    All previously issued tokens are revoked; a fresh pair for the current
+    session is returned.
     """
     # Find the Auth row linked to this user.
-    auth = (
-        db.query(models.Auth)
-        .filter(
-            models.Auth.table_name == models.User.__tablename__,
-            models.Auth.table_id == current_user.id,
-        )
-        .first()
-    )
+    auth = await run_in_threadpool(crud.get_auth_for_user, db, current_user.id)
     if not auth:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -147,7 +205,7 @@ def change_password(
         )
 
     # Verify current password.
-    if not auth_service.verify_password(
+    if not await get_auth_service().verify_password_async(
         payload.current_password, auth.password_hash
     ):
         raise HTTPException(
@@ -155,18 +213,25 @@ def change_password(
             detail="Current password is incorrect.",
         )
 
-    # Update to the new password.
-    auth.password_hash = auth_service.get_password_hash(payload.new_password)
-    db.add(auth)
-    db.commit()
+    # Update to the new password and revoke outstanding tokens.
+    password_hash = await get_auth_service().get_password_hash_async(
+        payload.new_password
+    )
+    user = await run_in_threadpool(crud.set_password, db, auth, password_hash)
 
-    return
+    access_token, refresh_token = get_auth_service().create_token_pair(user)
+    return schemas.LoginResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        user=user,
+    )
 
 
 @router.get("/users", response_model=List[schemas.User])
 def list_users(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
     # For now, any authenticated user can list users.
     return crud.get_users(db)
@@ -177,24 +242,24 @@ def list_users(
     response_model=schemas.User,
     status_code=status.HTTP_201_CREATED,
 )
-def create_user(
+async def create_user(
     user_in: schemas.UserCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
-    if crud.get_user_by_username(db, user_in.username):
+    if await run_in_threadpool(crud.get_user_by_username, db, user_in.username):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Username already registered.",
         )
-    if crud.get_user_by_email(db, user_in.email):
+    if await run_in_threadpool(crud.get_user_by_email, db, user_in.email):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered.",
         )
 
-    password_hash = auth_service.get_password_hash(user_in.password)
-    user = crud.create_user(db, user_in, password_hash)
+    password_hash = await get_auth_service().get_password_hash_async(user_in.password)
+    user = await run_in_threadpool(crud.create_user, db, user_in, password_hash)
     return user
 
 
@@ -203,7 +268,7 @@ def update_user(
     user_id: int,
     user_in: schemas.UserUpdate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
     return crud.update_user(db, user_id, user_in)
 
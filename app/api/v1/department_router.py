@@ -1,29 +1,44 @@
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
-from app import models, schemas
+from app import schemas
 from app.database import crud, get_db
 from app.api.v1.auth_router import get_current_user
+from app.utils.http_cache import conditional, weak_etag
 
 
 router = APIRouter(tags=["departments"])
 
 
+def departments_etag(version: int) -> str:
+    return weak_etag("departments", version)
+
+
 @router.get("/", response_model=List[schemas.Department])
 def list_departments(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
-    return crud.get_departments(db)
+    # The list is the same for every user, but only authenticated callers
+    # may see it, so shared caches must key it by Authorization.
+    version = crud.get_table_version(db, "departments")
+    not_modified = conditional(
+        request, response, departments_etag(version), vary="Authorization"
+    )
+    if not_modified is not None:
+        return not_modified
+    return crud.get_departments_cached(db, version)
 
 
 @router.post("/", response_model=schemas.Department, status_code=201)
 def create_department(
     department_in: schemas.DepartmentCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
     return crud.create_department(db, department_in)
 
@@ -33,7 +48,7 @@ def update_department(
     department_id: int,
     department_in: schemas.DepartmentUpdate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
     return crud.update_department(db, department_id, department_in)
 
@@ -42,8 +57,6 @@ def update_department(
 def delete_department(
     department_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
 ):
     return crud.delete_department(db, department_id)
-
-
@@ -1,25 +1,147 @@
-from fastapi import APIRouter, Depends, HTTPException
+import io
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app import schemas
 from app.database import crud, get_db
-from app.service.auth_service import AuthServiceFactory
+from app.api.v1.auth_router import get_current_admin, get_current_user
+from app.service.auth_service import get_auth_service
+from app.service.employee_import import import_employees
+from app.utils.export import export_response
+from app.utils.http_cache import conditional, weak_etag
+from app.utils.pagination import employee_page
 
 router = APIRouter(tags=["employees"])
-auth_service = AuthServiceFactory.create()
 
 
 @router.post("/", response_model=schemas.Employee, status_code=201)
-def create_employee(
+async def create_employee(
     employee: schemas.EmployeeCreate, db: Session = Depends(get_db)
 ):
-    password_hash = auth_service.get_password_hash(employee.password)
-    return crud.create_employee(db, employee, password_hash)
+    password_hash = await get_auth_service().get_password_hash_async(employee.password)
+    return await run_in_threadpool(crud.create_employee, db, employee, password_hash)
+
+
+def employees_etag(version: int) -> str:
+    # Caches key responses by URL, so one version covers every page/filter.
+    return weak_etag("employees", version)
+
+
+@router.get("/", response_model=schemas.EmployeePage)
+def list_employees(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[int] = Query(None, description="Last id of the previous page."),
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    include_total: bool = Query(
+        True, description="Set to false to skip the COUNT query."
+    ),
+    db: Session = Depends(get_db),
+):
+    etag = employees_etag(crud.get_table_version(db, "users"))
+    not_modified = conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    # Fetch one extra row to know whether another page exists.
+    rows = crud.get_employees(
+        db,
+        limit=limit + 1,
+        after=after,
+        department=department,
+        city=city,
+        is_active=is_active,
+    )
+    total = (
+        crud.count_employees(
+            db, department=department, city=city, is_active=is_active
+        )
+        if include_total
+        else None
+    )
+    return employee_page(rows, limit, total)
+
+
+@router.get(
+    "/export",
+    responses={
+        200: {"content": {"text/csv": {}, "application/x-ndjson": {}}}
+    },
+)
+def export_employees(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    current_user: schemas.CurrentUser = Depends(get_current_user),
+):
+    """
+    Stream every employee matching the filters as CSV or NDJSON.
+    """
+    return export_response(
+        crud.iter_employees,
+        crud.EMPLOYEE_EXPORT_FIELDS,
+        format,
+        "employees",
+        department=department,
+        city=city,
+        is_active=is_active,
+    )
+
+
+@router.post("/import", response_model=schemas.EmployeeImportResult)
+async def import_employees_csv(
+    file: UploadFile = File(..., description="CSV with an EmployeeCreate header."),
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_admin),
+):
+    """
+    Create employees in bulk from a CSV upload. Admins only. Valid rows
+    are created; invalid or duplicate rows are reported with their line
+    number.
+    """
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    return await import_employees(db, lines)
+
+
+@router.post("/offboard", response_model=schemas.EmployeeOffboardResult)
+def offboard_employees(
+    payload: schemas.EmployeeOffboard,
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_admin),
+):
+    return crud.delete_employees(db, payload.employee_ids)
+
+
+@router.get("/by-code/{employee_code}", response_model=schemas.Employee)
+def get_employee_by_code(employee_code: str, db: Session = Depends(get_db)):
+    employee = crud.get_employee_by_empid_cached(db, employee_code)
+    if employee is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return employee
 
 
-@router.get("/", response_model=list[schemas.Employee])
-def list_employees(db: Session = Depends(get_db)):
-    return crud.get_employees(db)
+@router.get("/{employee_id}", response_model=schemas.Employee)
+def get_employee(employee_id: int, db: Session = Depends(get_db)):
+    employee = crud.get_employee_cached(db, employee_id)
+    if employee is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return employee
 
 
 @router.delete("/{employee_id}", response_model=schemas.Employee)
@@ -0,0 +1,94 @@
+from datetime import date
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.database import crud, get_db
+from app.api.v1.auth_router import get_current_admin, get_current_user
+from app.utils.export import export_response
+
+
+router = APIRouter(tags=["reports"])
+
+# Longest range one summary rebuild may recompute; larger backfills are
+# split into several calls.
+SUMMARY_REBUILD_MAX_DAYS = 366
+
+
+def _check_range(start: date, end: date) -> None:
+    if start > end:
+        raise HTTPException(
+            status_code=422, detail="'from' must not be after 'to'."
+        )
+
+
+@router.get(
+    "/attendance/employees",
+    response_model=List[schemas.EmployeeAttendanceReport],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+def employee_attendance_report(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    department: Optional[str] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
+) -> Union[List[dict], StreamingResponse]:
+    """
+    Per-employee present/absent totals and attendance rate for a date range.
+    Use format=ndjson to stream one JSON object per line for large orgs.
+    """
+    _check_range(start, end)
+    if format == "ndjson":
+        return export_response(
+            crud.iter_attendance_totals_by_employee,
+            crud.ATTENDANCE_REPORT_FIELDS,
+            format,
+            "attendance-report",
+            start,
+            end,
+            department,
+        )
+    return list(crud.iter_attendance_totals_by_employee(db, start, end, department))
+
+
+@router.get(
+    "/attendance/departments",
+    response_model=List[schemas.DepartmentAttendanceReport],
+)
+def department_attendance_report(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_user),
+):
+    """
+    Per-department present/absent totals and attendance rate for a date range.
+    """
+    _check_range(start, end)
+    return crud.get_attendance_totals_by_department(db, start, end)
+
+
+@router.post("/attendance/summary/rebuild")
+def rebuild_attendance_summary(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user: schemas.CurrentUser = Depends(get_current_admin),
+):
+    """
+    Recompute the materialized daily summary for a date range, e.g. after
+    turning on ATTENDANCE_SUMMARY_ENABLED for existing data. Admins only;
+    at most SUMMARY_REBUILD_MAX_DAYS days per call.
+    """
+    _check_range(start, end)
+    if (end - start).days + 1 > SUMMARY_REBUILD_MAX_DAYS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Rebuild at most {SUMMARY_REBUILD_MAX_DAYS} days per call.",
+        )
+    return {"rows": crud.rebuild_attendance_summary(db, start, end)}
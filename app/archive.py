@@ -0,0 +1,38 @@
+"""
+Move old attendance into the archive table.
+
+Usage:
+    python -m app.archive                 # older than ATTENDANCE_ARCHIVE_AFTER_DAYS
+    python -m app.archive --before 2025-01-01
+
+Meant to run periodically (e.g. nightly cron); each batch is its own
+transaction, so it can be interrupted and re-run safely.
+"""
+
+import argparse
+from datetime import date
+
+from app.database import SessionLocal, crud
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--before",
+        type=date.fromisoformat,
+        default=None,
+        help="Archive attendance dated before this day (YYYY-MM-DD).",
+    )
+    args = parser.parse_args()
+
+    before = args.before or crud.archive_horizon()
+    db = SessionLocal()
+    try:
+        moved = crud.archive_attendance(db, before)
+    finally:
+        db.close()
+    print(f"Archived {moved} attendance rows dated before {before}.")
+
+
+if __name__ == "__main__":
+    main()
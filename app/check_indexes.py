@@ -0,0 +1,111 @@
+"""
+Check that the user/employee lookups are served by indexes.
+
+Usage:
+    python -m app.check_indexes
+
+Runs each crud lookup below against DATABASE_URL (read-only, rolled back),
+EXPLAINs every SELECT it issues and exits with status 1 if any of them
+reads a table with a full scan. tests/test_index_usage.py runs the same
+checks against the test database; this command is for checking a real one.
+
+SQLite plans ignore table sizes, so the result is deterministic there. On
+MySQL the optimizer may prefer a full scan of a tiny table; run it against
+a database with realistic row counts.
+"""
+
+import sys
+from contextlib import contextmanager
+from typing import Callable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.database import SessionLocal, crud
+from app.utils.instrumentation import explain_statement
+
+# (description, crud call) pairs; arguments only need to be well-formed.
+CHECKS: Tuple[Tuple[str, Callable], ...] = (
+    ("get_users", lambda db: crud.get_users(db)),
+    ("get_employees", lambda db: crud.get_employees(db, limit=50)),
+    ("get_employees (next page)", lambda db: crud.get_employees(db, limit=50, after=100)),
+    (
+        "get_employees (department, active)",
+        lambda db: crud.get_employees(db, limit=50, department="HR", is_active=True),
+    ),
+    ("count_employees", lambda db: crud.count_employees(db)),
+    ("get_employee", lambda db: crud.get_employee(db, 1)),
+    ("get_employee_by_empid", lambda db: crud.get_employee_by_empid(db, "E0001")),
+    (
+        "get_employee_ids_by_department",
+        lambda db: crud.get_employee_ids_by_department(db, "HR"),
+    ),
+)
+
+
+@contextmanager
+def _capture_plans(plans: List[tuple]):
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        plan = explain_statement(conn, cursor, statement, parameters)
+        if plan is not None:
+            plans.append((statement, plan))
+
+    event.listen(Engine, "after_cursor_execute", _after)
+    try:
+        yield
+    finally:
+        event.remove(Engine, "after_cursor_execute", _after)
+
+
+def full_scans(plan: List[dict]) -> List[str]:
+    """
+    Describe the plan steps that read a whole table.
+    """
+    scans = []
+    for step in plan:
+        if "detail" in step:  # SQLite: "SCAN users" vs "SEARCH users USING ..."
+            if step["detail"].startswith("SCAN ") and "CONSTANT ROW" not in step["detail"]:
+                scans.append(step["detail"])
+        elif step.get("type") == "ALL":  # MySQL
+            scans.append(f"full scan of {step.get('table')}")
+    return scans
+
+
+def query_plans(call: Callable) -> List[tuple]:
+    """
+    Run `call(db)` in a rolled-back session and return (statement, plan)
+    for every SELECT it issued.
+    """
+    plans: List[tuple] = []
+    db = SessionLocal()
+    try:
+        with _capture_plans(plans):
+            call(db)
+    finally:
+        db.rollback()
+        db.close()
+    return plans
+
+
+def check() -> List[str]:
+    failures = []
+    for description, call in CHECKS:
+        plans = query_plans(call)
+        for statement, plan in plans:
+            for scan in full_scans(plan):
+                failures.append(f"{description}: {scan}\n  {' '.join(statement.split())}")
+        if not plans:
+            failures.append(f"{description}: issued no SELECT to check")
+    return failures
+
+
+def main() -> None:
+    failures = check()
+    for failure in failures:
+        print(failure)
+    print(f"{len(CHECKS)} lookups checked, {len(failures)} full scans.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
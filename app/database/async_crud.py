@@ -0,0 +1,92 @@
+"""
+Async counterparts of the hot `crud` functions for AsyncSession.
+
+These are thin wrappers, not natively async queries: each one runs the
+sync `crud` function through `AsyncSession.run_sync`, which executes the
+same ORM code in a greenlet. Queries, validation and error handling stay
+in one place and only the driver I/O is awaited on the event loop; the
+Python work of building statements and loading rows still runs on the
+event loop thread, as it would in a threadpool worker.
+
+Cached reads do their cache lookup here, with the async cache methods,
+and only pass the database read on a miss to `run_sync`: inside
+`run_sync`, a call to a network cache (Redis) would block the event loop.
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, schemas
+from app.database import crud
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[models.User]:
+    return await db.run_sync(crud.get_user, user_id)
+
+
+async def get_token_version(db: AsyncSession, user_id: int) -> Optional[int]:
+    return await crud.token_version_cache.get_or_load_async(
+        user_id, lambda: db.run_sync(crud.load_token_version, user_id)
+    )
+
+
+async def get_table_version(db: AsyncSession, name: str) -> int:
+    return await db.run_sync(crud.get_table_version, name)
+
+
+async def get_employees(db: AsyncSession, **filters) -> List[models.User]:
+    return await db.run_sync(crud.get_employees, **filters)
+
+
+async def count_employees(db: AsyncSession, **filters) -> int:
+    return await db.run_sync(crud.count_employees, **filters)
+
+
+async def get_employee(db: AsyncSession, employee_id: int):
+    return await db.run_sync(crud.get_employee, employee_id)
+
+
+async def get_employee_ids_by_department(
+    db: AsyncSession, department: str
+) -> List[int]:
+    return await db.run_sync(crud.get_employee_ids_by_department, department)
+
+
+async def mark_attendance(db: AsyncSession, attendance: schemas.AttendanceCreate):
+    return await db.run_sync(crud.mark_attendance, attendance)
+
+
+async def mark_attendance_bulk(
+    db: AsyncSession, records: List[schemas.AttendanceCreate]
+) -> List[dict]:
+    return await db.run_sync(crud.mark_attendance_bulk, records)
+
+
+async def get_attendance_for_employee(
+    db: AsyncSession, employee_id: int, **window
+) -> List[models.Attendance]:
+    return await db.run_sync(crud.get_attendance_for_employee, employee_id, **window)
+
+
+async def get_attendance_days(
+    db: AsyncSession, employee_id: int, **window
+) -> List[tuple]:
+    return await db.run_sync(crud.get_attendance_days, employee_id, **window)
+
+
+async def get_attendance_totals_by_department(
+    db: AsyncSession, start: date, end: date
+) -> List[dict]:
+    return await db.run_sync(crud.get_attendance_totals_by_department, start, end)
+
+
+async def get_departments(
+    db: AsyncSession, version: Optional[int] = None
+) -> List[dict]:
+    if version is None:
+        version = await get_table_version(db, models.Department.__tablename__)
+    return await crud.departments_cache.get_or_load_async(
+        version, lambda: db.run_sync(crud.get_department_dicts)
+    )
@@ -0,0 +1,66 @@
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.config import get_settings
+from app.database.pool_metrics import InstrumentedAsyncQueuePool, instrument_engine
+from app.utils.instrumentation import instrument_sql
+
+# Built on first use so the async driver is only required when
+# ASYNC_DB_ENABLED is set.
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        settings = get_settings()
+        _async_engine = create_async_engine(
+            settings.async_database_url,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+        instrument_engine(_async_engine.sync_engine, "async")
+        instrument_sql(_async_engine.sync_engine)
+        # Objects must stay readable after commit: lazy refreshes cannot run
+        # once control is back on the event loop.
+        _async_sessionmaker = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    get_async_engine()
+    async with _async_sessionmaker() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_sessionmaker = None
+
+
+def reset_async_engine_after_fork() -> None:
+    """
+    Forget an async engine inherited from the parent process; the worker
+    builds its own on first use.
+    """
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose(close=False)
+        _async_engine = None
+        _async_sessionmaker = None
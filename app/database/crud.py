@@ -1,17 +1,160 @@
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Iterator, List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import (
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.config import get_settings
+from app.database.routing import replica_read
+from app.utils.cache import Cache
+
+ATTENDANCE_STATUSES = ("Present", "Absent")
+# One-letter codes used by the compact attendance history response.
+ATTENDANCE_STATUS_CODES = {"Present": "P", "Absent": "A"}
+
+# Roles that can be assigned to application (non-employee) users.
+USER_ROLES = ("admin", "manager", "user")
+
+# Upper bound on values per IN (...) list in set-based lookups.
+IN_CLAUSE_CHUNK_SIZE = 1000
+
+# Rows fetched per round trip when streaming large report/export results.
+REPORT_BATCH_SIZE = 500
+
+# Attendance rows moved to the archive per transaction.
+ARCHIVE_BATCH_SIZE = 5000
+
+# table_versions rows holding archive dates as YYYYMMDD (0: none yet). They
+# only ever grow, and every worker reads them from the database:
+# - the cutoff: attendance dated on or before it is archived (or being
+#   archived), so marks for those days are rejected;
+# - the newest archived date (later than the cutoff once offboarding has
+#   archived departed employees' recent days): reads whose range starts
+#   after it skip the archive.
+ARCHIVE_CUTOFF = "attendance_archive_cutoff"
+ARCHIVE_NEWEST = "attendance_archive_newest"
+
+# Server-assigned employee codes: EMP-0001, EMP-0002, ...
+EMPLOYEE_CODE_PREFIX = "EMP-"
+
+
+# user id -> current token_version of an active user. Consulted on every
+# authenticated request in place of loading the user row.
+token_version_cache = Cache(
+    "token_version", ttl=get_settings().auth_cache_ttl_seconds
+)
+
+# Serialized rows for hot reads; writers delete the keys after committing.
+_users = Cache("user", ttl=get_settings().cache_ttl_seconds)
+_employees = Cache("employee", ttl=get_settings().cache_ttl_seconds)
+departments_cache = Cache("departments", ttl=get_settings().cache_ttl_seconds)
+
+
+@replica_read
+def get_table_version(db: Session, name: str) -> int:
+    """
+    Current change counter of a table (0 if it was never written), read by
+    primary key. List endpoints derive their ETag from it; it is read from
+    the same replica (and transaction) as the list, so the two agree.
+    """
+    version = (
+        db.query(models.TableVersion.version)
+        .filter(models.TableVersion.name == name)
+        .scalar()
+    )
+    return version or 0
+
+
+def bump_table_version(db: Session, name: str) -> None:
+    """
+    Increment a table's change counter inside the caller's transaction, so
+    the new ETag becomes visible exactly when the write commits.
+    """
+    result = db.execute(
+        update(models.TableVersion)
+        .where(models.TableVersion.name == name)
+        .values(version=models.TableVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.add(models.TableVersion(name=name, version=1))
 
 
 def get_user(db: Session, user_id: int) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.id == user_id).first()
 
 
+def _dump(schema, row) -> dict:
+    return schema.model_validate(row, from_attributes=True).model_dump(mode="json")
+
+
+def get_user_cached(db: Session, user_id: int) -> Optional[dict]:
+    """
+    The user as a `schemas.User` dict, read through the cache.
+    """
+    def load():
+        user = get_user(db, user_id)
+        return None if user is None else _dump(schemas.User, user)
+
+    return _users.get_or_load(user_id, load)
+
+
+def load_token_version(db: Session, user_id: int) -> Optional[int]:
+    """
+    Read the user's token_version from the database; None if the user does
+    not exist or is inactive.
+    """
+    row = (
+        db.query(models.User.token_version, models.User.is_active)
+        .filter(models.User.id == user_id)
+        .first()
+    )
+    if row is None or not row.is_active:
+        return None
+    return row.token_version
+
+
+def get_token_version(db: Session, user_id: int) -> Optional[int]:
+    """
+    Return the user's current token_version, or None if the user does not
+    exist or is inactive. Served from a short-TTL cache.
+    """
+    return token_version_cache.get_or_load(
+        user_id, lambda: load_token_version(db, user_id)
+    )
+
+
+def revoke_user_tokens(user: models.User) -> None:
+    """
+    Bump the user's token_version so every previously issued token is
+    rejected. Takes effect once the caller commits.
+    """
+    user.token_version = (user.token_version or 0) + 1
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    token_version_cache.delete(user_id)
+    _users.delete(user_id)
+
+
 def get_user_by_username(db: Session, username: str) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.username == username).first()
 
@@ -52,6 +195,34 @@ def create_user(
     return db_user
 
 
+def get_auth_for_user(db: Session, user_id: int) -> Optional[models.Auth]:
+    return (
+        db.query(models.Auth)
+        .filter(
+            models.Auth.table_name == models.User.__tablename__,
+            models.Auth.table_id == user_id,
+        )
+        .first()
+    )
+
+
+def set_password(
+    db: Session, auth: models.Auth, password_hash: str
+) -> models.User:
+    """
+    Store a new password hash and revoke the user's outstanding tokens.
+    Returns the refreshed user so new tokens can be issued.
+    """
+    auth.password_hash = password_hash
+    db.add(auth)
+    user = get_user(db, auth.table_id)
+    revoke_user_tokens(user)
+    db.commit()
+    db.refresh(user)
+    invalidate_user_cache(user.id)
+    return user
+
+
 def update_user(
     db: Session, user_id: int, user_in: schemas.UserUpdate
 ) -> models.User:
@@ -68,11 +239,30 @@ def update_user(
 
     update_data = user_in.dict(exclude_unset=True)
 
+    if "role" in update_data and update_data["role"] not in USER_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Role must be one of: {', '.join(USER_ROLES)}.",
+        )
+
+    # Role and active flag are embedded in issued tokens, so changing either
+    # must revoke them.
+    if any(
+        field in update_data and update_data[field] != getattr(user, field)
+        for field in ("role", "is_active")
+    ):
+        revoke_user_tokens(user)
+
+    if "department" in update_data:
+        name = update_data.pop("department")
+        update_data["department_id"] = _department_ids(db, {name}).get(name)
+
     for field, value in update_data.items():
         setattr(user, field, value)
 
     try:
         db.add(user)
+        bump_table_version(db, models.User.__tablename__)
         db.commit()
         db.refresh(user)
     except IntegrityError:
@@ -81,28 +271,150 @@ def update_user(
             status_code=status.HTTP_409_CONFLICT,
             detail="Username or email already exists.",
         )
+    invalidate_user_cache(user_id)
 
     return user
 
 
+@replica_read
 def get_users(db: Session) -> List[models.User]:
     """
-    Return all non-employee users (e.g. admins, managers, standard users).
+    Return all non-employee users ordered by id, whatever their role.
     Employees are represented by User rows with role='employee' and are
     excluded from this listing.
     """
-    return (
+    # Two ranges around 'employee' rather than role != 'employee': the
+    # optimizer can seek the (role, id) index for a range, not for !=. The
+    # short list is sorted here, since ORDER BY id would pull the plan back
+    # to a primary-key scan.
+    users = (
         db.query(models.User)
-        .filter(models.User.role != "employee")
+        .filter(
+            or_(models.User.role < "employee", models.User.role > "employee")
+        )
         .all()
     )
+    return sorted(users, key=lambda user: user.id)
+
+
+def _department_id_of(name: str):
+    """
+    The id of the department called `name`, as an uncorrelated scalar
+    subquery: filters compare users.department_id through its index
+    instead of matching names row by row.
+    """
+    return (
+        select(models.Department.id)
+        .where(models.Department.name == name)
+        .scalar_subquery()
+    )
 
 
-def get_employees(db: Session) -> List[models.User]:
+def _employee_filters(
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> list:
     """
-    Return all employees, represented by User rows with role='employee'.
+    Build the WHERE criteria shared by the employee listing and its count.
     """
-    return db.query(models.User).filter(models.User.role == "employee").all()
+    criteria = [models.User.role == "employee"]
+    if department is not None:
+        criteria.append(models.User.department_id == _department_id_of(department))
+    if city is not None:
+        criteria.append(models.User.city == city)
+    if is_active is not None:
+        criteria.append(models.User.is_active == is_active)
+    return criteria
+
+
+@replica_read
+def get_employees(
+    db: Session,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> List[models.User]:
+    """
+    Return employees (User rows with role='employee') ordered by id.
+
+    Pagination is keyset based: pass the last id of the previous page as
+    `after` so the database seeks straight to the next page instead of
+    counting past skipped rows.
+    """
+    query = (
+        db.query(models.User)
+        .filter(*_employee_filters(department, city, is_active))
+        .order_by(models.User.id)
+    )
+    if after is not None:
+        query = query.filter(models.User.id > after)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+EMPLOYEE_EXPORT_FIELDS = (
+    "id",
+    "employee_id",
+    "first_name",
+    "last_name",
+    "full_name",
+    "email",
+    "department",
+    "gender",
+    "address",
+    "pin",
+    "city",
+    "is_active",
+)
+
+
+@replica_read
+def iter_employees(
+    db: Session,
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> Iterator[dict]:
+    """
+    Stream employees matching the `get_employees` filters as plain dicts,
+    fetched from a server-side cursor REPORT_BATCH_SIZE rows at a time.
+    """
+    columns = (
+        models.Department.name.label(field)
+        if field == "department"
+        else getattr(models.User, field)
+        for field in EMPLOYEE_EXPORT_FIELDS
+    )
+    query = (
+        db.query(*columns)
+        .outerjoin(models.Department, models.Department.id == models.User.department_id)
+        .filter(*_employee_filters(department, city, is_active))
+        .order_by(models.User.id)
+        .yield_per(REPORT_BATCH_SIZE)
+    )
+    for row in query:
+        yield row._asdict()
+
+
+@replica_read
+def count_employees(
+    db: Session,
+    department: Optional[str] = None,
+    city: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> int:
+    """
+    Count employees matching the same filters as `get_employees`.
+    """
+    return (
+        db.query(func.count(models.User.id))
+        .filter(*_employee_filters(department, city, is_active))
+        .scalar()
+    )
 
 
 def get_employee(db: Session, employee_id: int):
@@ -130,17 +442,71 @@ def get_employee_by_empid(db: Session, empid: str):
     )
 
 
-def create_employee(
-    db: Session, employee: schemas.EmployeeCreate, password_hash: str
-):
+def get_employee_cached(db: Session, employee_id: int) -> Optional[dict]:
     """
-    Create a new employee backed by the unified User table.
+    The employee as a `schemas.Employee` dict, read through the cache.
+    """
+    def load():
+        employee = get_employee(db, employee_id)
+        return None if employee is None else _dump(schemas.Employee, employee)
 
-    Employees are Users with role='employee' and their employee-specific
-    profile fields populated. A matching Auth row is created so the
-    employee can log in.
+    return _employees.get_or_load(f"id:{employee_id}", load)
+
+
+def get_employee_by_empid_cached(db: Session, empid: str) -> Optional[dict]:
     """
-    db_employee = models.User(
+    The employee with business code `empid` as a `schemas.Employee` dict,
+    read through the cache.
+    """
+    def load():
+        employee = get_employee_by_empid(db, empid)
+        return None if employee is None else _dump(schemas.Employee, employee)
+
+    return _employees.get_or_load(f"code:{empid}", load)
+
+
+def invalidate_employee_cache(employee_id: int, empid: Optional[str]) -> None:
+    _employees.delete(f"id:{employee_id}", f"code:{empid}")
+    invalidate_user_cache(employee_id)
+
+
+def _department_ids(db: Session, names: set) -> dict:
+    """
+    Map department names to ids inside the caller's transaction, creating
+    the departments that do not exist yet (employees have always been free
+    to name a new department). Blank names are left out.
+    """
+    names = {name for name in names if name}
+    if not names:
+        return {}
+    ids = dict(
+        db.query(models.Department.name, models.Department.id).filter(
+            models.Department.name.in_(names)
+        )
+    )
+    created = False
+    for name in sorted(names - set(ids)):
+        department = models.Department(name=name, is_active=True)
+        try:
+            with db.begin_nested():
+                db.add(department)
+            ids[name] = department.id
+            created = True
+        except IntegrityError:
+            # Created concurrently, or equal to an existing name under the
+            # database collation (e.g. "qa" vs "QA" on MySQL).
+            ids[name] = db.query(models.Department.id).filter(
+                models.Department.name == name
+            ).scalar()
+    if created:
+        bump_table_version(db, models.Department.__tablename__)
+    return ids
+
+
+def _employee_values(
+    employee: schemas.EmployeeCreate, department_id: Optional[int]
+) -> dict:
+    return dict(
         employee_id=employee.employee_id,
         # Structured name fields; also keep full_name in sync for display.
         first_name=employee.first_name,
@@ -151,7 +517,7 @@ def create_employee(
             else employee.first_name
         ),
         email=employee.email,
-        department=employee.department,
+        department_id=department_id,
         gender=employee.gender,
         address=employee.address,
         pin=employee.pin,
@@ -159,8 +525,50 @@ def create_employee(
         role="employee",
         is_active=True,
     )
-    db.add(db_employee)
+
+
+def next_employee_code(db: Session) -> str:
+    """
+    The EMP-<n> code after the highest one in use. One query over the
+    employee_id index range of the prefix; longer codes sort first so
+    EMP-10000 comes after EMP-9999.
+    """
+    code = (
+        db.query(models.User.employee_id)
+        .filter(models.User.employee_id.like(EMPLOYEE_CODE_PREFIX + "%"))
+        .order_by(
+            func.length(models.User.employee_id).desc(),
+            models.User.employee_id.desc(),
+        )
+        .limit(1)
+        .scalar()
+    )
+    suffix = code[len(EMPLOYEE_CODE_PREFIX):] if code else ""
+    number = int(suffix) if suffix.isdigit() else 0
+    return f"{EMPLOYEE_CODE_PREFIX}{number + 1:04d}"
+
+
+def create_employee(
+    db: Session, employee: schemas.EmployeeCreate, password_hash: str
+):
+    """
+    Create a new employee backed by the unified User table.
+
+    Employees are Users with role='employee' and their employee-specific
+    profile fields populated. A matching Auth row is created so the
+    employee can log in. Without an employee_id the next EMP-<n> code is
+    assigned; a concurrent create taking the same code gets 409.
+    """
+    if not employee.employee_id:
+        employee = employee.model_copy(
+            update={"employee_id": next_employee_code(db)}
+        )
     try:
+        department_ids = _department_ids(db, {employee.department})
+        db_employee = models.User(
+            **_employee_values(employee, department_ids.get(employee.department))
+        )
+        db.add(db_employee)
         # Flush to get an id for the employee, then create the Auth row
         # in the same transaction.
         db.flush()
@@ -173,6 +581,7 @@ def create_employee(
             table_id=db_employee.id,
         )
         db.add(auth)
+        bump_table_version(db, models.User.__tablename__)
 
         db.commit()
         db.refresh(db_employee)
@@ -185,59 +594,1198 @@ def create_employee(
     return db_employee
 
 
+def _chunks(values: list, size: int = IN_CLAUSE_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def import_employee_batch(
+    db: Session,
+    rows: List[tuple],
+    password_hashes: List[str],
+) -> List[dict]:
+    """
+    Insert a batch of (row_number, EmployeeCreate) pairs with their password
+    hashes using multi-row INSERTs into users and auth, in one transaction.
+
+    Rows whose employee_id or email already exists (in the database or
+    earlier in the batch) are skipped. Emails are compared lowercased, as
+    MySQL's collation compares them case-insensitively. Returns an error dict per skipped
+    row; every other row was created.
+    """
+    employee_ids = [employee.employee_id for _, employee in rows]
+    emails = [employee.email for _, employee in rows]
+
+    taken_employee_ids = set()
+    taken_emails = set()
+    for chunk in _chunks(employee_ids):
+        taken_employee_ids.update(
+            row.employee_id
+            for row in db.query(models.User.employee_id).filter(
+                models.User.employee_id.in_(chunk)
+            )
+        )
+    for chunk in _chunks(emails):
+        taken_emails.update(
+            row.email.lower()
+            for row in db.query(models.User.email).filter(
+                models.User.email.in_(chunk)
+            )
+        )
+        # Employees log in with their email as Auth username.
+        taken_emails.update(
+            row.username.lower()
+            for row in db.query(models.Auth.username).filter(
+                models.Auth.username.in_(chunk)
+            )
+        )
+
+    errors = []
+    accepted = []
+    hash_by_email = {}
+    for (row_number, employee), password_hash in zip(rows, password_hashes):
+        if employee.employee_id in taken_employee_ids:
+            error = "Employee ID already exists."
+        elif employee.email.lower() in taken_emails:
+            error = "Email already exists."
+        else:
+            error = None
+        if error is not None:
+            errors.append(
+                {
+                    "row": row_number,
+                    "employee_id": employee.employee_id,
+                    "email": employee.email,
+                    "error": error,
+                }
+            )
+            continue
+        taken_employee_ids.add(employee.employee_id)
+        taken_emails.add(employee.email.lower())
+        accepted.append(employee)
+        hash_by_email[employee.email.lower()] = password_hash
+
+    if not accepted:
+        return errors
+
+    try:
+        department_ids = _department_ids(
+            db, {employee.department for employee in accepted}
+        )
+        user_rows = [
+            _employee_values(employee, department_ids.get(employee.department))
+            for employee in accepted
+        ]
+        db.execute(insert(models.User), user_rows)
+        # MySQL has no RETURNING for multi-row inserts; map the new ids
+        # back through the unique email.
+        auth_rows = []
+        for chunk in _chunks([employee.email for employee in accepted]):
+            for row in db.query(models.User.id, models.User.email).filter(
+                models.User.email.in_(chunk)
+            ):
+                auth_rows.append(
+                    {
+                        "username": row.email,
+                        "password_hash": hash_by_email[row.email.lower()],
+                        "table_name": models.User.__tablename__,
+                        "table_id": row.id,
+                    }
+                )
+        db.execute(insert(models.Auth), auth_rows)
+        bump_table_version(db, models.User.__tablename__)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        # Lost a race with a concurrent insert; report the whole batch.
+        rejected = {error["row"] for error in errors}
+        return errors + [
+            {
+                "row": row_number,
+                "employee_id": employee.employee_id,
+                "email": employee.email,
+                "error": "Conflicted with a concurrent insert; retry this row.",
+            }
+            for row_number, employee in rows
+            if row_number not in rejected
+        ]
+    return errors
+
+
+def _remove_from_attendance_summary(db: Session, employee_ids: List[int]) -> None:
+    """
+    Subtract the per-(date, department) counts of `employee_ids`' hot and
+    archived attendance from attendance_daily_summary, leaving it as a
+    rebuild without them would. Summary rows emptied this way are deleted.
+    """
+    hot = models.Attendance
+    archive = models.AttendanceArchive
+    owned = union_all(
+        select(hot.employee_id, hot.date, hot.status).where(
+            hot.employee_id.in_(employee_ids)
+        ),
+        select(archive.employee_id, archive.date, archive.status).where(
+            archive.employee_id.in_(employee_ids), archive.employee_code.is_(None)
+        ),
+    ).subquery("departed")
+    aggregate = (
+        select(
+            owned.c.date,
+            _department_key().label("department"),
+            _status_count(owned.c.status, "Present").label("present"),
+            _status_count(owned.c.status, "Absent").label("absent"),
+        )
+        .join(models.User, models.User.id == owned.c.employee_id)
+        .outerjoin(models.Department, models.Department.id == models.User.department_id)
+        .group_by(owned.c.date, _department_key())
+    )
+    counts = {
+        (row.date, row.department): {
+            SUMMARY_COLUMNS["Present"]: -int(row.present or 0),
+            SUMMARY_COLUMNS["Absent"]: -int(row.absent or 0),
+        }
+        for row in db.execute(aggregate)
+    }
+    if not counts:
+        return
+    add_to_attendance_summary(db, counts)
+
+    summary = models.AttendanceDailySummary
+    days = [day for day, _ in counts]
+    db.execute(
+        delete(summary)
+        .where(
+            summary.date >= min(days),
+            summary.date <= max(days),
+            summary.department.in_(sorted({department for _, department in counts})),
+            summary.present_count == 0,
+            summary.absent_count == 0,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _delete_employee_rows(db: Session, employee_ids: List[int]) -> None:
+    """
+    Delete employees and their credentials with set-based statements.
+
+    Their attendance is first copied to the archive (which has no foreign
+    key), so reports and exports keep it; ON DELETE CASCADE then removes the
+    hot rows. All their archived rows are then stamped with their
+    employee_id string: the user id may be handed out again, and the new
+    owner must not inherit this history. Reports count current employees
+    only, so their marks are also taken out of the daily summary.
+    """
+    hot = models.Attendance
+    archive = models.AttendanceArchive
+    if get_settings().attendance_summary_enabled:
+        _remove_from_attendance_summary(db, employee_ids)
+    newest = (
+        db.query(func.max(hot.date)).filter(hot.employee_id.in_(employee_ids)).scalar()
+    )
+    if newest is not None:
+        db.execute(
+            insert(archive).from_select(
+                ["id", "employee_id", "date", "status"],
+                select(hot.id, hot.employee_id, hot.date, hot.status).where(
+                    hot.employee_id.in_(employee_ids)
+                ),
+            )
+        )
+        _advance_archive_date(db, ARCHIVE_NEWEST, newest)
+    db.execute(
+        update(archive)
+        .where(archive.employee_id.in_(employee_ids), archive.employee_code.is_(None))
+        .values(
+            employee_code=select(func.coalesce(models.User.employee_id, ""))
+            .where(models.User.id == archive.employee_id)
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(models.Auth)
+        .where(
+            models.Auth.table_name == models.User.__tablename__,
+            models.Auth.table_id.in_(employee_ids),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(models.User)
+        .where(models.User.id.in_(employee_ids))
+        .execution_options(synchronize_session=False)
+    )
+    bump_table_version(db, models.User.__tablename__)
+
+
 def delete_employee(db: Session, employee_id: int):
     db_employee = get_employee(db, employee_id)
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
-    db.delete(db_employee)
+    # Snapshot before the row is gone; the response echoes the employee.
+    deleted = schemas.Employee.model_validate(db_employee, from_attributes=True)
+    _delete_employee_rows(db, [employee_id])
     db.commit()
-    return db_employee
+    invalidate_employee_cache(employee_id, deleted.employee_id)
+    return deleted
+
+
+def delete_employees(db: Session, employee_ids: List[int]) -> dict:
+    """
+    Offboard many employees at once: a fixed number of statements per
+    IN_CLAUSE_CHUNK_SIZE ids, however much attendance history they have.
+    Ids that are not employees are reported back and left untouched.
+    """
+    requested = list(dict.fromkeys(employee_ids))
+    # id -> business employee_id, for cache invalidation.
+    codes = {}
+    for chunk in _chunks(requested):
+        rows = db.query(models.User.id, models.User.employee_id).filter(
+            models.User.id.in_(chunk), models.User.role == "employee"
+        )
+        codes.update((row.id, row.employee_id) for row in rows)
+    found = list(codes)
+
+    for chunk in _chunks(found):
+        _delete_employee_rows(db, chunk)
+    db.commit()
+    for employee_id, empid in codes.items():
+        invalidate_employee_cache(employee_id, empid)
+
+    found_ids = set(found)
+    return {
+        "deleted": len(found),
+        "not_found": [i for i in requested if i not in found_ids],
+    }
+
+
+def _native_upsert(db: Session, model, keys: List[str], updates):
+    """
+    Build INSERT ... ON DUPLICATE KEY UPDATE (MySQL) or ON CONFLICT DO
+    UPDATE (PostgreSQL, SQLite) for `model`, unique on `keys`. `updates`
+    maps the proposed row (`new.<column>`) to the columns to overwrite.
+    Returns None when the dialect has no native upsert.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(model)
+        return stmt.on_duplicate_key_update(**updates(stmt.inserted))
+    if dialect in ("postgresql", "sqlite"):
+        stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(model)
+        return stmt.on_conflict_do_update(
+            index_elements=keys, set_=updates(stmt.excluded)
+        )
+    return None
+
+
+def _attendance_insert(db: Session, upsert: bool):
+    """
+    Build an INSERT for attendance rows. With `upsert`, a row whose
+    (employee_id, date) already exists has its status overwritten instead of
+    violating the unique index. Returns None when the dialect has no native
+    upsert; `_write_attendance` then falls back to UPDATE-then-INSERT.
+    """
+    if not upsert:
+        return insert(models.Attendance)
+    return _native_upsert(
+        db,
+        models.Attendance,
+        ["employee_id", "date"],
+        lambda new: {"status": new.status},
+    )
+
+
+def _write_attendance(db: Session, rows: List[dict], upsert: bool) -> None:
+    """
+    Insert attendance rows (dicts of employee_id, date, status), upserting
+    them when `upsert` is set.
+    """
+    stmt = _attendance_insert(db, upsert)
+    if stmt is not None:
+        db.execute(stmt, rows)
+        return
+
+    # Portable upsert: overwrite existing pairs, insert the rest. A pair
+    # inserted concurrently in between still hits the unique index.
+    attendance = models.Attendance
+    for row in rows:
+        updated = db.execute(
+            update(attendance)
+            .where(
+                attendance.employee_id == row["employee_id"],
+                attendance.date == row["date"],
+            )
+            .values(status=row["status"])
+            .execution_options(synchronize_session=False)
+        )
+        if updated.rowcount == 0:
+            db.execute(insert(attendance), [row])
+
+
+def _replace_attendance(db: Session, row: dict) -> Optional[str]:
+    """
+    Upsert one attendance row and return the status it replaced (None if
+    the pair is new), so the summary can move the count between columns.
+
+    An existing row is locked by primary key before its status is read. A
+    missing pair is inserted without a locking read first: on InnoDB that
+    read would take a gap lock, and gap locks held by concurrent marks
+    deadlock each other's inserts.
+    """
+    attendance = models.Attendance
+    pair = (
+        attendance.employee_id == row["employee_id"],
+        attendance.date == row["date"],
+    )
+    existing_id = db.query(attendance.id).filter(*pair).scalar()
+    if existing_id is None:
+        try:
+            with db.begin_nested():
+                db.execute(insert(attendance), [row])
+            return None
+        except IntegrityError:
+            # Inserted concurrently; a locking read sees the committed row.
+            existing_id = (
+                db.query(attendance.id).filter(*pair).with_for_update().scalar()
+            )
+            if existing_id is None:
+                raise
+
+    previous = (
+        db.query(attendance.status)
+        .filter(attendance.id == existing_id)
+        .with_for_update()
+        .scalar()
+    )
+    db.execute(
+        update(attendance)
+        .where(attendance.id == existing_id)
+        .values(status=row["status"])
+        .execution_options(synchronize_session=False)
+    )
+    return previous
+
+
+def _is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Tell a foreign key failure (MySQL 1451/1452, PostgreSQL 23503, SQLite
+    "FOREIGN KEY constraint failed") from a unique index violation.
+    """
+    orig = error.orig
+    if getattr(orig, "pgcode", None) == "23503":
+        return True
+    args = getattr(orig, "args", ())
+    if args and args[0] in (1451, 1452):
+        return True
+    return "FOREIGN KEY" in str(orig).upper()
+
+
+def _employee_department(db: Session, employee_id: int) -> Optional[str]:
+    """
+    The summary department key ("" for none) of an employee, or None if
+    there is no such employee. Read from the database, not the cache: the
+    cached copy may outlive the employee on other workers.
+    """
+    return (
+        db.query(_department_key())
+        .select_from(models.User)
+        .outerjoin(models.Department, models.Department.id == models.User.department_id)
+        .filter(models.User.id == employee_id, models.User.role == "employee")
+        .scalar()
+    )
+
+
+def _insert_for_employee(db: Session, row: dict, upsert: bool) -> bool:
+    """
+    Write one attendance row with INSERT ... SELECT from users, so the
+    database decides in the same statement whether the employee exists.
+    Returns False (and writes nothing) when it does not.
+    """
+    source = select(
+        models.User.id, literal(row["date"]), literal(row["status"])
+    ).where(models.User.id == row["employee_id"], models.User.role == "employee")
+    columns = ["employee_id", "date", "status"]
+
+    stmt = _attendance_insert(db, upsert)
+    if stmt is not None:
+        return db.execute(stmt.from_select(columns, source)).rowcount > 0
+
+    # Portable upsert, as in `_write_attendance`.
+    attendance = models.Attendance
+    updated = db.execute(
+        update(attendance)
+        .where(
+            attendance.employee_id == row["employee_id"],
+            attendance.date == row["date"],
+        )
+        .values(status=row["status"])
+        .execution_options(synchronize_session=False)
+    )
+    if updated.rowcount > 0:
+        return True
+    return db.execute(insert(attendance).from_select(columns, source)).rowcount > 0
 
 
 def mark_attendance(db: Session, attendance: schemas.AttendanceCreate):
-    # Ensure the employee exists before recording attendance.
-    employee = get_employee(db, attendance.employee_id)
-    if not employee:
+    # Archived days are closed: the unique index does not span the archive,
+    # so a new row would duplicate the archived one.
+    cutoff = get_archive_cutoff(db)
+    if attendance.date <= cutoff:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Employee not found.",
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Attendance up to {cutoff} is archived and can no longer "
+                "be changed."
+            ),
         )
 
-    # Prevent duplicate attendance for the same employee on the same date.
-    existing = (
-        db.query(models.Attendance)
-        .filter(
-            models.Attendance.employee_id == attendance.employee_id,
-            models.Attendance.date == attendance.date,
-        )
-        .first()
+    settings = get_settings()
+    row = attendance.model_dump()
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Employee not found.",
     )
-    if existing:
+
+    # The unique (employee_id, date) index rejects duplicates atomically,
+    # so there is no separate existence check to race against.
+    try:
+        if settings.attendance_summary_enabled:
+            department = _employee_department(db, attendance.employee_id)
+            if department is None:
+                raise not_found
+            previous = None
+            if settings.attendance_upsert:
+                previous = _replace_attendance(db, row)
+            else:
+                _write_attendance(db, [row], upsert=False)
+            # (date, department) -> summary column deltas.
+            counts = {}
+            _count_change(
+                counts, attendance.date, department, previous, attendance.status
+            )
+            add_to_attendance_summary(db, counts)
+        elif not _insert_for_employee(db, row, settings.attendance_upsert):
+            raise not_found
+
+        # Snapshot before commit expires the instance.
+        result = schemas.Attendance.model_validate(
+            db.query(models.Attendance)
+            .filter(
+                models.Attendance.employee_id == attendance.employee_id,
+                models.Attendance.date == attendance.date,
+            )
+            .one()
+        )
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        # The employee was deleted after the lookup above.
+        if _is_foreign_key_violation(error):
+            raise not_found
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Attendance for this date is already recorded.",
         )
+    return result
+
+
+def get_employee_ids_by_department(db: Session, department: str) -> List[int]:
+    """
+    Return the ids of all active employees in a department.
+    """
+    rows = (
+        db.query(models.User.id)
+        .filter(*_employee_filters(department=department, is_active=True))
+        .order_by(models.User.id)
+        .all()
+    )
+    return [row.id for row in rows]
+
+
+def mark_attendance_bulk(
+    db: Session, records: List[schemas.AttendanceCreate]
+) -> List[dict]:
+    """
+    Record attendance for many employees in a single transaction.
 
-    db_attendance = models.Attendance(**attendance.dict())
-    db.add(db_attendance)
+    Employee existence and already-recorded (employee_id, date) pairs are
+    resolved with set-based queries, and all new rows go out as one
+    multi-row INSERT. When ATTENDANCE_UPSERT is enabled, existing pairs are
+    overwritten by one more statement and reported as "updated". Returns
+    one result dict per input record, in order.
+    """
+    results = [
+        {
+            "employee_id": record.employee_id,
+            "date": record.date,
+            "status": record.status,
+            "result": "created",
+        }
+        for record in records
+    ]
+
+    employee_ids = sorted({record.employee_id for record in records})
+    dates = sorted({record.date for record in records})
+
+    # employee id -> department name, for employees that exist.
+    known_employees = {}
+    # (employee_id, date) -> attendance id, for pairs already recorded.
+    existing_pairs = {}
+    for chunk in _chunks(employee_ids):
+        known_employees.update(
+            (row.id, row.department)
+            for row in db.query(
+                models.User.id, models.Department.name.label("department")
+            )
+            .outerjoin(
+                models.Department, models.Department.id == models.User.department_id
+            )
+            .filter(models.User.id.in_(chunk), models.User.role == "employee")
+        )
+        existing_pairs.update(
+            ((row.employee_id, row.date), row.id)
+            for row in db.query(
+                models.Attendance.id,
+                models.Attendance.employee_id,
+                models.Attendance.date,
+            ).filter(
+                models.Attendance.employee_id.in_(chunk),
+                models.Attendance.date.in_(dates),
+            )
+        )
+
+    # Archived days are closed to marks (see `mark_attendance`).
+    cutoff = get_archive_cutoff(db)
+    settings = get_settings()
+    upsert = settings.attendance_upsert
+    # Pairs already taken by an earlier record in this batch.
+    seen_pairs = set()
+    created_rows = []
+    updated_rows = []
+    for result in results:
+        pair = (result["employee_id"], result["date"])
+        if result["status"] not in ATTENDANCE_STATUSES:
+            result["result"] = "invalid_status"
+        elif result["employee_id"] not in known_employees:
+            result["result"] = "employee_not_found"
+        elif result["date"] <= cutoff:
+            result["result"] = "archived"
+        elif pair in seen_pairs:
+            result["result"] = "duplicate"
+        elif pair in existing_pairs and not upsert:
+            result["result"] = "duplicate"
+        else:
+            seen_pairs.add(pair)
+            row = {
+                "employee_id": result["employee_id"],
+                "date": result["date"],
+                "status": result["status"],
+            }
+            if pair in existing_pairs:
+                result["result"] = "updated"
+                updated_rows.append(row)
+            else:
+                created_rows.append(row)
+
+    if not created_rows and not updated_rows:
+        return results
+
+    try:
+        counts = {}
+        if settings.attendance_summary_enabled:
+            # Lock the rows being overwritten (by primary key, so no gap
+            # locks) and read the statuses their counts move away from.
+            previous = {}
+            ids = sorted(
+                existing_pairs[(row["employee_id"], row["date"])]
+                for row in updated_rows
+            )
+            for chunk in _chunks(ids):
+                previous.update(
+                    ((row.employee_id, row.date), row.status)
+                    for row in db.query(
+                        models.Attendance.employee_id,
+                        models.Attendance.date,
+                        models.Attendance.status,
+                    )
+                    .filter(models.Attendance.id.in_(chunk))
+                    .with_for_update()
+                )
+            for row in created_rows + updated_rows:
+                _count_change(
+                    counts,
+                    row["date"],
+                    known_employees[row["employee_id"]],
+                    previous.get((row["employee_id"], row["date"])),
+                    row["status"],
+                )
+
+        # New pairs are inserted plainly: one recorded concurrently fails
+        # the batch (and is retried) rather than being counted twice.
+        if created_rows:
+            _write_attendance(db, created_rows, upsert=False)
+        if updated_rows:
+            _write_attendance(db, updated_rows, upsert=True)
+        add_to_attendance_summary(db, counts)
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                "An employee was deleted concurrently; please retry."
+                if _is_foreign_key_violation(error)
+                else "Attendance was recorded concurrently; please retry."
+            ),
+        )
+    return results
+
+
+def _archive_date(version: Optional[int]) -> date:
+    if not version:
+        return date.min
+    return date(version // 10000, version // 100 % 100, version % 100)
+
+
+def _archive_version(day: date) -> int:
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def get_archive_watermark(db: Session) -> date:
+    """
+    Return the latest date attendance_archive may hold (date.min while it
+    is empty): one primary-key read, on the same replica as the caller's
+    query.
+    """
+    return _archive_date(get_table_version(db, ARCHIVE_NEWEST))
+
+
+def get_archive_cutoff(db: Session) -> date:
+    """
+    Return the last archived day (date.min if nothing was archived), taking
+    a shared lock on it until the caller commits. `archive_attendance`
+    raises the cutoff before moving a batch, so it waits for the marks
+    holding this lock, and marks arriving later see the new cutoff.
+    """
+    version = (
+        db.query(models.TableVersion.version)
+        .filter(models.TableVersion.name == ARCHIVE_CUTOFF)
+        .with_for_update(read=True)
+        .scalar()
+    )
+    return _archive_date(version)
+
+
+def _advance_archive_date(db: Session, name: str, day: date) -> None:
+    """
+    Raise an archive date to `day` (never lower it) inside the caller's
+    transaction.
+    """
+    row = (
+        db.query(models.TableVersion)
+        .filter(models.TableVersion.name == name)
+        .with_for_update()
+        .first()
+    )
+    if row is None:
+        db.add(models.TableVersion(name=name, version=_archive_version(day)))
+    elif row.version < _archive_version(day):
+        row.version = _archive_version(day)
+    db.flush()
+
+
+def _attendance_source(
+    db: Session,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    employee_id: Optional[int] = None,
+    after: Optional[date] = None,
+):
+    """
+    Attendance rows (id, employee_id, date, status, employee_code) as a
+    subquery named "attendance". The archive is unioned in only when the
+    range starts on or before its watermark; filters are applied inside
+    each branch so both tables are read through their (employee_id, date) /
+    date indexes. employee_code is set only on archived rows of departed
+    employees; join users through `_owner_of`.
+    """
+    tables = [models.Attendance]
+    lower = after if after is not None else start
+    if lower is None or lower <= get_archive_watermark(db):
+        tables.append(models.AttendanceArchive)
+
+    branches = []
+    for table in tables:
+        if table is models.AttendanceArchive:
+            code = table.employee_code
+        else:
+            code = null().label("employee_code")
+        branch = select(table.id, table.employee_id, table.date, table.status, code)
+        if employee_id is not None:
+            branch = branch.where(table.employee_id == employee_id)
+            if table is models.AttendanceArchive:
+                branch = branch.where(table.employee_code.is_(None))
+        if start is not None:
+            branch = branch.where(table.date >= start)
+        if end is not None:
+            branch = branch.where(table.date <= end)
+        if after is not None:
+            branch = branch.where(table.date > after)
+        branches.append(branch)
+
+    if len(branches) == 1:
+        return branches[0].subquery("attendance")
+    return union_all(*branches).subquery("attendance")
+
+
+def _owner_of(source):
+    """
+    Join condition from an `_attendance_source` row to its current employee;
+    departed employees' rows match no user, even if their id was reused.
+    """
+    return and_(
+        models.User.id == source.c.employee_id, source.c.employee_code.is_(None)
+    )
+
+
+def _attendance_history_query(
+    db: Session,
+    columns: tuple,
+    employee_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    after: Optional[date] = None,
+    limit: Optional[int] = None,
+):
+    """
+    Date-ordered attendance for one employee, including archived days when
+    the range reaches them. Every filter is on the (employee_id, date)
+    index, so a month is a single range scan per table.
+    """
+    source = _attendance_source(
+        db, start, end, employee_id=employee_id, after=after
+    )
+    query = select(*(source.c[name] for name in columns)).order_by(source.c.date)
+    if limit is not None:
+        query = query.limit(limit)
+    return db.execute(query)
+
+
+@replica_read
+def get_attendance_for_employee(
+    db: Session,
+    employee_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    after: Optional[date] = None,
+    limit: Optional[int] = None,
+) -> List[tuple]:
+    """
+    Return an employee's attendance ordered by date, optionally restricted
+    to [start, end] and paged by passing the last date seen as `after`.
+    Rows carry id, employee_id, date and status.
+    """
+    return _attendance_history_query(
+        db,
+        ("id", "employee_id", "date", "status"),
+        employee_id,
+        start,
+        end,
+        after,
+        limit,
+    ).all()
+
+
+@replica_read
+def get_attendance_days(
+    db: Session,
+    employee_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    after: Optional[date] = None,
+    limit: Optional[int] = None,
+) -> List[tuple]:
+    """
+    Like `get_attendance_for_employee` but returns bare (date, status)
+    tuples for the compact calendar view.
+    """
+    return _attendance_history_query(
+        db, ("date", "status"), employee_id, start, end, after, limit
+    ).all()
+
+
+ATTENDANCE_EXPORT_FIELDS = (
+    "id",
+    "employee_id",
+    "employee_code",
+    "full_name",
+    "department",
+    "date",
+    "status",
+)
+
+
+@replica_read
+def iter_attendance(
+    db: Session,
+    start: date,
+    end: date,
+    department: Optional[str] = None,
+    employee_id: Optional[int] = None,
+) -> Iterator[dict]:
+    """
+    Stream attendance in [start, end] (archive included when needed) with
+    the employee's code, name and department, ordered by date then
+    employee, from a server-side cursor. Archived days of departed
+    employees are included with those fields empty.
+    """
+    source = _attendance_source(db, start, end, employee_id=employee_id)
+    query = (
+        select(
+            source.c.id,
+            source.c.employee_id,
+            func.coalesce(models.User.employee_id, source.c.employee_code).label(
+                "employee_code"
+            ),
+            models.User.full_name,
+            models.Department.name.label("department"),
+            source.c.date,
+            source.c.status,
+        )
+        .outerjoin(models.User, _owner_of(source))
+        .outerjoin(models.Department, models.Department.id == models.User.department_id)
+        .order_by(source.c.date, source.c.employee_id)
+    )
+    if department is not None:
+        query = query.where(models.User.department_id == _department_id_of(department))
+    result = db.execute(query, execution_options={"yield_per": REPORT_BATCH_SIZE})
+    for row in result:
+        yield row._asdict()
+
+
+def archive_attendance(
+    db: Session, before: date, max_batches: Optional[int] = None
+) -> int:
+    """
+    Move attendance dated before `before` into attendance_archive, one
+    ARCHIVE_BATCH_SIZE transaction at a time so locks stay short. Stops
+    after `max_batches` batches when given; a later call picks up where it
+    left off. Returns the number of rows moved.
+    """
+    hot = models.Attendance
+    archive = models.AttendanceArchive
+    last = before - timedelta(days=1)
+    moved = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        # Raised first in every batch: the update waits for marks that are
+        # in flight, and marks after it for these days are rejected, so no
+        # row can land in the hot table behind the batch.
+        _advance_archive_date(db, ARCHIVE_CUTOFF, last)
+        ids = [
+            row.id
+            for row in db.query(hot.id)
+            .filter(hot.date < before)
+            .order_by(hot.id)
+            .limit(ARCHIVE_BATCH_SIZE)
+        ]
+        if not ids:
+            db.commit()
+            break
+        db.execute(
+            insert(archive).from_select(
+                ["id", "employee_id", "date", "status"],
+                select(hot.id, hot.employee_id, hot.date, hot.status).where(
+                    hot.id.in_(ids)
+                ),
+            )
+        )
+        db.execute(
+            delete(hot)
+            .where(hot.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        _advance_archive_date(db, ARCHIVE_NEWEST, last)
+        db.commit()
+        moved += len(ids)
+        batches += 1
+    return moved
+
+
+def archive_horizon() -> date:
+    return date.today() - timedelta(days=get_settings().attendance_archive_after_days)
+
+
+# Attendance reporting
+def _status_count(status_column, value: str):
+    return func.sum(case((status_column == value, 1), else_=0))
+
+
+def _department_key():
+    # Summary rows need a non-null key; employees without one map to "".
+    # Callers outer-join departments on users.department_id.
+    return func.coalesce(models.Department.name, "")
+
+
+def _with_rate(row: dict) -> dict:
+    present = int(row["present"] or 0)
+    absent = int(row["absent"] or 0)
+    marked = present + absent
+    row.update(
+        present=present,
+        absent=absent,
+        attendance_rate=round(present / marked, 4) if marked else 0.0,
+    )
+    return row
+
+
+def _summary_insert(
+    db: Session, start: date, end: date, departments: Optional[List[str]] = None
+):
+    """
+    INSERT ... SELECT of per-(date, department) counts for attendance in
+    [start, end] (optionally only `departments`) into
+    attendance_daily_summary.
+    """
+    source = _attendance_source(db, start, end)
+    aggregate = (
+        select(
+            source.c.date,
+            _department_key(),
+            _status_count(source.c.status, "Present"),
+            _status_count(source.c.status, "Absent"),
+        )
+        .join(models.User, _owner_of(source))
+        .outerjoin(models.Department, models.Department.id == models.User.department_id)
+        .group_by(source.c.date, _department_key())
+    )
+    if departments is not None:
+        aggregate = aggregate.where(_department_key().in_(departments))
+    return insert(models.AttendanceDailySummary).from_select(
+        ["date", "department", "present_count", "absent_count"], aggregate
+    )
+
+
+# Summary column counting each attendance status.
+SUMMARY_COLUMNS = {"Present": "present_count", "Absent": "absent_count"}
+
+
+def _count_change(
+    counts: dict,
+    day: date,
+    department: Optional[str],
+    previous: Optional[str],
+    current: str,
+) -> None:
+    """
+    Record in `counts` that a mark of an employee in `department` went from
+    `previous` (None for a new mark) to `current`.
+    """
+    if previous == current:
+        return
+    deltas = counts.setdefault(
+        (day, department or ""), dict.fromkeys(SUMMARY_COLUMNS.values(), 0)
+    )
+    if previous is not None:
+        deltas[SUMMARY_COLUMNS[previous]] -= 1
+    deltas[SUMMARY_COLUMNS[current]] += 1
+
+
+def add_to_attendance_summary(db: Session, counts: dict) -> None:
+    """
+    Add per-(date, department) deltas to attendance_daily_summary inside the
+    caller's transaction, creating missing rows.
+
+    Each key costs one upsert of a single summary row, however much
+    attendance the day already has. Rows are written in key order so
+    concurrent marks lock them in the same order.
+    """
+    summary = models.AttendanceDailySummary
+    rows = [
+        {"date": day, "department": department, **deltas}
+        for (day, department), deltas in sorted(counts.items())
+        if any(deltas.values())
+    ]
+    if not rows:
+        return
+
+    stmt = _native_upsert(
+        db,
+        summary,
+        ["date", "department"],
+        lambda new: {
+            column: getattr(summary, column) + getattr(new, column)
+            for column in SUMMARY_COLUMNS.values()
+        },
+    )
+    if stmt is not None:
+        db.execute(stmt, rows)
+        return
+
+    for row in rows:
+        updated = db.execute(
+            update(summary)
+            .where(summary.date == row["date"], summary.department == row["department"])
+            .values(
+                {
+                    column: getattr(summary, column) + row[column]
+                    for column in SUMMARY_COLUMNS.values()
+                }
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if updated.rowcount == 0:
+            db.execute(insert(summary), [row])
+
+
+def rebuild_attendance_summary(db: Session, start: date, end: date) -> int:
+    """
+    Rebuild attendance_daily_summary for every day in [start, end], e.g.
+    after enabling the summary on a database with existing attendance.
+    Returns the number of summary rows written.
+    """
+    summary = models.AttendanceDailySummary
+    db.query(summary).filter(
+        summary.date >= start, summary.date <= end
+    ).delete(synchronize_session=False)
+    result = db.execute(_summary_insert(db, start, end))
     db.commit()
-    db.refresh(db_attendance)
-    return db_attendance
+    return result.rowcount
 
 
-def get_attendance_for_employee(db: Session, employee_id: int):
-    return (
-        db.query(models.Attendance)
-        .filter(models.Attendance.employee_id == employee_id)
-        .all()
+ATTENDANCE_REPORT_FIELDS = (
+    "id",
+    "employee_id",
+    "full_name",
+    "department",
+    "present",
+    "absent",
+    "attendance_rate",
+)
+
+
+@replica_read
+def iter_attendance_totals_by_employee(
+    db: Session, start: date, end: date, department: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    Yield present/absent totals and attendance rate per employee for
+    [start, end], computed by a single GROUP BY and streamed from the
+    server in batches. Departed employees, whose history lives on in the
+    archive, are listed by id alone (a department filter leaves them out).
+    """
+    source = _attendance_source(db, start, end)
+    employee_code = func.coalesce(models.User.employee_id, source.c.employee_code)
+    query = (
+        db.query(
+            source.c.employee_id.label("id"),
+            employee_code.label("employee_id"),
+            models.User.full_name,
+            models.Department.name.label("department"),
+            _status_count(source.c.status, "Present").label("present"),
+            _status_count(source.c.status, "Absent").label("absent"),
+        )
+        .select_from(source)
+        .outerjoin(models.User, _owner_of(source))
+        .outerjoin(models.Department, models.Department.id == models.User.department_id)
+    )
+    if department is not None:
+        query = query.filter(models.User.department_id == _department_id_of(department))
+    query = (
+        query.group_by(
+            source.c.employee_id,
+            employee_code,
+            models.User.full_name,
+            models.Department.name,
+        )
+        .order_by(source.c.employee_id)
+        .yield_per(REPORT_BATCH_SIZE)
     )
+    for row in query:
+        yield _with_rate(
+            {
+                "id": row.id,
+                "employee_id": row.employee_id,
+                "full_name": row.full_name,
+                "department": row.department,
+                "present": row.present,
+                "absent": row.absent,
+            }
+        )
+
+
+@replica_read
+def get_attendance_totals_by_department(
+    db: Session, start: date, end: date
+) -> List[dict]:
+    """
+    Present/absent totals and attendance rate per department for
+    [start, end]. Reads the materialized daily summary when it is enabled,
+    otherwise aggregates attendance (and the archive, if needed) directly.
+    """
+    if get_settings().attendance_summary_enabled:
+        summary = models.AttendanceDailySummary
+        query = (
+            db.query(
+                summary.department.label("department"),
+                func.sum(summary.present_count).label("present"),
+                func.sum(summary.absent_count).label("absent"),
+            )
+            .filter(summary.date >= start, summary.date <= end)
+            .group_by(summary.department)
+            .order_by(summary.department)
+        )
+    else:
+        source = _attendance_source(db, start, end)
+        query = (
+            db.query(
+                _department_key().label("department"),
+                _status_count(source.c.status, "Present").label("present"),
+                _status_count(source.c.status, "Absent").label("absent"),
+            )
+            .select_from(source)
+            .join(models.User, _owner_of(source))
+            .outerjoin(
+                models.Department, models.Department.id == models.User.department_id
+            )
+            .group_by(_department_key())
+            .order_by(_department_key())
+        )
+    return [
+        _with_rate(
+            {
+                "department": row.department,
+                "present": row.present,
+                "absent": row.absent,
+            }
+        )
+        for row in query
+    ]
 
 
 # Department management
+@replica_read
 def get_departments(db: Session) -> List[models.Department]:
     return db.query(models.Department).order_by(models.Department.name).all()
 
 
+def get_department_dicts(db: Session) -> List[dict]:
+    return [_dump(schemas.Department, d) for d in get_departments(db)]
+
+
+def get_departments_cached(db: Session, version: Optional[int] = None) -> List[dict]:
+    """
+    The department list as `schemas.Department` dicts, read through the
+    cache. Entries are keyed by the departments table version, so every
+    mutator's bump invalidates them on all workers at once and a cached body
+    always matches the ETag it is served with.
+    """
+    if version is None:
+        version = get_table_version(db, models.Department.__tablename__)
+    return departments_cache.get_or_load(version, lambda: get_department_dicts(db))
+
+
 def get_department(db: Session, department_id: int) -> Optional[models.Department]:
     return (
         db.query(models.Department)
@@ -255,6 +1803,7 @@ def create_department(
     )
     db.add(db_dept)
     try:
+        bump_table_version(db, models.Department.__tablename__)
         db.commit()
         db.refresh(db_dept)
     except IntegrityError:
@@ -275,12 +1824,23 @@ def update_department(
             status_code=status.HTTP_404_NOT_FOUND, detail="Department not found"
         )
 
+    old_name = dept.name
     update_data = department_in.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(dept, field, value)
+    renamed = dept.name != old_name
 
     try:
         db.add(dept)
+        bump_table_version(db, models.Department.__tablename__)
+        if renamed:
+            # Employees reference the department by id and need no update,
+            # but listings and the summary (keyed by name) show the name.
+            bump_table_version(db, models.User.__tablename__)
+            summary = models.AttendanceDailySummary
+            db.query(summary).filter(summary.department == old_name).update(
+                {summary.department: dept.name}, synchronize_session=False
+            )
         db.commit()
         db.refresh(dept)
     except IntegrityError:
@@ -290,6 +1850,14 @@ def update_department(
             detail="Department with this name already exists.",
         )
 
+    if renamed:
+        # Cached employee/user dicts carry the department name.
+        members = db.query(models.User.id, models.User.employee_id).filter(
+            models.User.department_id == department_id
+        )
+        for member in members:
+            invalidate_employee_cache(member.id, member.employee_id)
+
     return dept
 
 
@@ -300,7 +1868,13 @@ def delete_department(db: Session, department_id: int) -> models.Department:
             status_code=status.HTTP_404_NOT_FOUND, detail="Department not found"
         )
     db.delete(dept)
-    db.commit()
+    try:
+        bump_table_version(db, models.Department.__tablename__)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Department still has employees; reassign them first.",
+        )
     return dept
-
-
@@ -0,0 +1,122 @@
+"""
+Connection pool telemetry.
+
+Engines are built with an instrumented QueuePool that times every checkout
+(queue wait, plus connect/pre-ping when a new or stale connection is
+involved) and counts callers that found every connection, overflow
+included, checked out and had to queue for one. Pool events track
+connections in use and opened. Everything is exported through the shared
+metrics registry, labelled by pool name.
+"""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.utils.metrics import registry
+
+_checkout_seconds = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent obtaining a connection from the pool.",
+    ("pool",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+_waiting = registry.gauge(
+    "db_pool_waiting",
+    "Callers queued because every connection, overflow included, is checked out.",
+    ("pool",),
+)
+_in_use = registry.gauge(
+    "db_pool_in_use",
+    "Pooled connections currently checked out.",
+    ("pool",),
+)
+_opened = registry.counter(
+    "db_pool_connections_opened_total",
+    "New DBAPI connections opened by the pool.",
+    ("pool",),
+)
+_capacity = registry.gauge(
+    "db_pool_capacity",
+    "Maximum connections the pool may hold (pool_size + max_overflow).",
+    ("pool",),
+)
+_timeouts = registry.counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after the pool timeout.",
+    ("pool",),
+)
+
+
+class _InstrumentedPoolMixin:
+    # Overridden per engine by `instrument_engine`.
+    metrics_name = "primary"
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs) -> None:
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        # QueuePool keeps this private; the capacity gauge needs it.
+        self.max_overflow = max_overflow
+
+    def recreate(self):
+        # Engine.dispose() swaps in a new pool (event listeners are carried
+        # over); keep its metrics label too.
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+    def _exhausted(self) -> bool:
+        # max_overflow -1 means unlimited overflow: nobody ever queues.
+        return (
+            self.max_overflow >= 0
+            and self.checkedout() >= self.size() + self.max_overflow
+        )
+
+    def connect(self):
+        name = self.metrics_name
+        # Read without the pool's lock, so a checkout racing with a checkin
+        # may be miscounted; fine for a gauge.
+        queued = self._exhausted()
+        if queued:
+            _waiting.inc(pool=name)
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            _timeouts.inc(pool=name)
+            raise
+        finally:
+            if queued:
+                _waiting.dec(pool=name)
+            _checkout_seconds.observe(time.perf_counter() - started, pool=name)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Label the engine's pool for metrics and track checkouts/checkins.
+    """
+    pool = engine.pool
+    pool.metrics_name = name
+    _capacity.set(pool.size() + max(pool.max_overflow, 0), pool=name)
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        _opened.inc(pool=name)
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        _in_use.inc(pool=name)
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        _in_use.dec(pool=name)
@@ -0,0 +1,176 @@
+"""
+Read-replica routing.
+
+`RoutingSession` sends everything to the primary unless the caller is
+inside a function decorated with `@replica_read`; those reads go to a
+replica picked round-robin from DATABASE_REPLICA_URLS. A session keeps the
+replica it picked, so every read in one request sees the same snapshot.
+
+Read-your-writes: once a session has flushed or executed an
+INSERT/UPDATE/DELETE (or holds pending changes), all of its later reads go
+to the primary, so a request never reads back older data than it wrote.
+
+A replica that fails with a connection-level error is skipped for
+REPLICA_RETRY_SECONDS; the failed read is retried once on the primary.
+"""
+
+import functools
+import inspect
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.utils.metrics import registry
+
+logger = logging.getLogger("app.db")
+
+_reads = registry.counter(
+    "db_replica_reads_total",
+    "Read-only crud calls by the engine that served them.",
+    ("target",),
+)
+_failures = registry.counter(
+    "db_replica_failures_total",
+    "Replica reads that failed and were retried on the primary.",
+    ("replica",),
+)
+
+# Session.info keys.
+_READ_DEPTH = "replica_read_depth"
+_REPLICA = "replica"
+_WROTE = "wrote"
+
+
+class ReplicaSet:
+    """
+    Round-robin over replica engines, skipping any marked down until its
+    cooldown expires.
+    """
+
+    def __init__(self, engines: Dict[str, Engine], retry_seconds: float) -> None:
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._names: List[str] = list(engines)
+        self._cycle = itertools.cycle(self._names)
+        self._down_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._names)
+
+    def choose(self) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self._names)):
+                name = next(self._cycle)
+                if self._down_until.get(name, 0) <= now:
+                    return name
+        return None
+
+    def mark_down(self, name: str) -> None:
+        with self._lock:
+            self._down_until[name] = time.monotonic() + self.retry_seconds
+
+    def dispose(self, close: bool = True) -> None:
+        for engine in self.engines.values():
+            engine.dispose(close=close)
+
+
+class RoutingSession(Session):
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def _has_written(self) -> bool:
+        return bool(
+            self.info.get(_WROTE)
+            or self.new
+            or self.deleted
+            or self.identity_map.check_modified()
+        )
+
+    def _replica_for_read(self) -> Optional[str]:
+        if self._has_written():
+            return None
+        name = self.info.get(_REPLICA)
+        if name is None:
+            name = self.replicas.choose() or ""
+            # "" pins the session to the primary (no healthy replica).
+            self.info[_REPLICA] = name
+        return name or None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info[_WROTE] = True
+        elif self.replicas and self.info.get(_READ_DEPTH):
+            name = self._replica_for_read()
+            if name is not None:
+                return self.replicas.engines[name]
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def _routed_to(db: Session) -> str:
+    if isinstance(db, RoutingSession) and db.replicas and not db._has_written():
+        return db.info.get(_REPLICA) or "primary"
+    return "primary"
+
+
+def _fail_over(db: Session, replica: str, error: Exception) -> None:
+    logger.warning("Replica %s failed, retrying on the primary: %s", replica, error)
+    _failures.inc(replica=replica)
+    db.replicas.mark_down(replica)
+    # The session has not written (it would not have used a replica), so
+    # rolling back only releases the broken replica connection.
+    db.rollback()
+    db.info[_REPLICA] = ""
+
+
+def replica_read(func):
+    """
+    Mark a crud function as read-only so a `RoutingSession` may serve it
+    from a replica. Generator functions (exports) are routed the same way
+    but never retried.
+    """
+
+    def enter(db: Session) -> None:
+        db.info[_READ_DEPTH] = db.info.get(_READ_DEPTH, 0) + 1
+
+    def leave(db: Session) -> None:
+        db.info[_READ_DEPTH] -= 1
+
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def generator_wrapper(db: Session, *args, **kwargs):
+            enter(db)
+            try:
+                yield from func(db, *args, **kwargs)
+            finally:
+                leave(db)
+
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(db: Session, *args, **kwargs):
+        enter(db)
+        try:
+            try:
+                result = func(db, *args, **kwargs)
+            except OperationalError as error:
+                replica = _routed_to(db)
+                if replica == "primary":
+                    raise
+                _fail_over(db, replica, error)
+                result = func(db, *args, **kwargs)
+        finally:
+            leave(db)
+        _reads.inc(target=_routed_to(db))
+        return result
+
+    return wrapper
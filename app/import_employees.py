@@ -0,0 +1,48 @@
+"""
+Bulk-create employees from a CSV file.
+
+Usage:
+    python -m app.import_employees employees.csv
+
+See app/service/employee_import.py for the expected columns. Rows that fail
+validation or clash with an existing employee_id/email are listed and
+skipped; every other row is created.
+"""
+
+import argparse
+import asyncio
+
+from app.database import SessionLocal
+from app.service.employee_import import import_employees
+from app.service.password_hasher import password_hasher
+
+
+async def _run(path: str) -> dict:
+    db = SessionLocal()
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            return await import_employees(db, lines)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="CSV file to import.")
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(_run(args.path))
+    finally:
+        password_hasher.shutdown()
+
+    for error in result["errors"]:
+        print(f"row {error['row']}: {error['error']}")
+    print(
+        f"Processed {result['processed']} rows: {result['created']} created, "
+        f"{len(result['errors'])} rejected."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,111 @@
+import time
+
+_import_started = time.perf_counter()
+
+import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import PlainTextResponse, Response
+from starlette.concurrency import run_in_threadpool
 
 from app.database import init_db
+from app.database.async_session import dispose_async_engine
 from app.api.router import api_router
 from app.config import get_settings
+from app.service.password_hasher import password_hasher
+from app.utils.compression import CompressionMiddleware
+from app.utils.instrumentation import MetricsMiddleware
+from app.utils.metrics import CONTENT_TYPE, registry
+from app.utils.static import PrecompressedStaticFiles, SpaIndex
+
+logger = logging.getLogger("app.startup")
+
+_startup_seconds = registry.gauge(
+    "app_startup_seconds",
+    "Time spent in each startup phase of this worker.",
+    ("phase",),
+)
 
 settings = get_settings()
 
-init_db()
 
-app = FastAPI(title="HRMS Lite Backend", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup does no I/O unless asked to: the schema belongs to migrations
+    and services are built on first use, so a new worker is ready as soon
+    as its modules are imported.
+    """
+    phases = {"import": _import_finished - _import_started}
+
+    if settings.init_db_on_startup:
+        started = time.perf_counter()
+        await run_in_threadpool(init_db)
+        phases["init_db"] = time.perf_counter() - started
+
+    phases["total"] = time.perf_counter() - _import_started
+    for phase, seconds in phases.items():
+        _startup_seconds.set(seconds, phase=phase)
+    logger.info(
+        "Startup complete in %.3fs (%s)",
+        phases["total"],
+        ", ".join(f"{phase}={seconds:.3f}s" for phase, seconds in phases.items()),
+    )
+
+    yield
+
+    password_hasher.shutdown()
+    await dispose_async_engine()
+    registry.shutdown()
+
+
+app = FastAPI(title="HRMS Lite Backend", version="0.1.0", lifespan=lifespan)
+
 
 # Include API routers
 app.include_router(api_router, prefix="/api/v1")
 
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        """
+        Prometheus scrape endpoint (all workers when METRICS_MULTIPROC_DIR is set).
+        """
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+
 # Paths for built frontend (Vite)
 ROOT_DIR = Path(__file__).resolve().parents[1]
 frontend_dist = ROOT_DIR / "frontend" / "dist"
-index_html = frontend_dist / "index.html"
+index_html = SpaIndex(frontend_dist / "index.html")
 
-# Serve built assets (JS/CSS) from /static/
+# Serve built assets (JS/CSS) from /static/, preferring precompressed
+# .br/.gz files and caching fingerprinted assets/ forever. dist/ is build
+# output and not committed; the API still starts without it.
 app.mount(
     "/static",
-    StaticFiles(directory=str(frontend_dist), html=False),
+    PrecompressedStaticFiles(
+        directory=str(frontend_dist), html=False, check_dir=False
+    ),
     name="frontend_static",
 )
 
 
 @app.get("/", include_in_schema=False)
-async def serve_root() -> FileResponse:
+async def serve_root(request: Request) -> Response:
     """
     Serve the SPA index for the root path.
     """
-    return FileResponse(index_html)
+    return index_html.response(request)
 
 
 @app.get("/{full_path:path}", include_in_schema=False)
-async def serve_spa(full_path: str) -> FileResponse:
+async def serve_spa(full_path: str, request: Request) -> Response:
     """
     Serve the SPA index for any non-API path (enables BrowserRouter reloads).
     """
@@ -50,7 +115,7 @@ async def serve_spa(full_path: str) -> FileResponse:
         # if none match. We intentionally don't handle /api/* here.
         raise RuntimeError("API route should not be handled by SPA fallback")
 
-    return FileResponse(index_html)
+    return index_html.response(request)
 
 
 # Allow CORS for frontend (useful for dev / API calls)
@@ -62,6 +127,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_min_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+
+# Outermost, so latency covers every other middleware and streamed bodies.
+app.add_middleware(MetricsMiddleware, router=app.router)
+
+_import_finished = time.perf_counter()
+
 
 if __name__ == "__main__":
     import uvicorn
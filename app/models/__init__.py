@@ -1,4 +1,6 @@
-from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String
+from typing import Optional
+
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -9,10 +11,22 @@ class User(Base):
     Unified user/employee table.
 
     - Application users (admin, manager, etc.) have username + email + role != 'employee'
-    - Employees are rows with role='employee' and employee_id / department filled.
+    - Employees are rows with role='employee' and employee_id / department_id filled.
     """
 
     __tablename__ = "users"
+    # Every listing filters on role: (role, id) serves the id-ordered,
+    # keyset-paginated lists; (role, is_active, department_id) serves the
+    # active-employees-of-a-department lookups.
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id"),
+        Index(
+            "ix_users_role_is_active_department_id",
+            "role",
+            "is_active",
+            "department_id",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -32,17 +46,37 @@ class User(Base):
     address = Column(String, nullable=True)
     pin = Column(String, nullable=True)
     city = Column(String, nullable=True)
-    department = Column(String, nullable=True)
+    department_id = Column(
+        Integer, ForeignKey("departments.id"), nullable=True, index=True
+    )
+    # Many-to-one, so joined eager loading adds a primary-key join rather
+    # than an extra query per row.
+    department_ref = relationship("Department", lazy="joined")
 
     # Role: e.g. "user", "admin", "employee"
     role = Column(String, nullable=False, default="user")
 
     is_active = Column(Boolean, default=True)
 
+    # Carried in JWTs; bumping it revokes every token issued for this user.
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # The database removes attendance via ON DELETE CASCADE; passive_deletes
+    # keeps the ORM from loading the rows just to delete them one by one.
     attendance = relationship(
-        "Attendance", back_populates="employee", cascade="all, delete-orphan"
+        "Attendance",
+        back_populates="employee",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
+    @property
+    def department(self) -> Optional[str]:
+        """
+        Department name, as exposed by the API schemas.
+        """
+        return self.department_ref.name if self.department_ref is not None else None
+
 
 class Auth(Base):
     """
@@ -51,6 +85,11 @@ class Auth(Base):
     """
 
     __tablename__ = "auth"
+    # Resolves the credentials of a given owner row (login by email,
+    # password change).
+    __table_args__ = (
+        Index("ix_auth_table_name_table_id", "table_name", "table_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
@@ -61,18 +100,79 @@ class Auth(Base):
 
 class Attendance(Base):
     __tablename__ = "attendance"
+    # One row per employee per day; also serves per-employee date range scans.
+    __table_args__ = (
+        Index("ix_attendance_employee_id_date", "employee_id", "date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    date = Column(Date, nullable=False)
+    employee_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    date = Column(Date, nullable=False, index=True)
     status = Column(String, nullable=False)  # Present / Absent
     employee = relationship("User", back_populates="attendance")
 
 
+class AttendanceArchive(Base):
+    """
+    Cold tier for attendance older than ATTENDANCE_ARCHIVE_AFTER_DAYS.
+
+    Rows keep their original id. The primary key includes `date` so the
+    table can be partitioned by month on MySQL; there is no foreign key, so
+    the history of departed employees survives offboarding.
+
+    Offboarding sets `employee_code` to the departed employee's business
+    employee_id. Such rows no longer belong to `employee_id`, since a user
+    id can be reused, so reads only join users to rows without one.
+    """
+
+    __tablename__ = "attendance_archive"
+    __table_args__ = (
+        Index("ix_attendance_archive_employee_id_date", "employee_id", "date"),
+        # Date-range reports and exports; offboarding archives recent days
+        # too, so most of them read this table.
+        Index("ix_attendance_archive_date", "date"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    date = Column(Date, primary_key=True)
+    employee_id = Column(Integer, nullable=False)
+    status = Column(String(255), nullable=False)
+    employee_code = Column(String(255), nullable=True)
+
+
+class AttendanceDailySummary(Base):
+    """
+    Materialized present/absent counts per day and department.
+
+    Only maintained when ATTENDANCE_SUMMARY_ENABLED is set: every mark adds
+    to (or moves between) the counts of its (date, department) row, and the
+    rebuild endpoint recomputes a date range from attendance.
+    """
+
+    __tablename__ = "attendance_daily_summary"
+    __table_args__ = (
+        Index(
+            "ix_attendance_daily_summary_date_department",
+            "date",
+            "department",
+            unique=True,
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)
+    # Employees without a department are summarised under "".
+    department = Column(String(191), nullable=False)
+    present_count = Column(Integer, nullable=False, default=0)
+    absent_count = Column(Integer, nullable=False, default=0)
+
+
 class Department(Base):
     """
-    Simple department master table so admins can manage departments.
-    Employees still store the department name as a string for now.
+    Department master table. Employees reference it by `users.department_id`,
+    so a rename is a single-row update.
     """
 
     __tablename__ = "departments"
@@ -82,3 +182,14 @@ class Department(Base):
     name = Column(String(191), unique=True, index=True, nullable=False)
     is_active = Column(Boolean, default=True)
 
+
+class TableVersion(Base):
+    """
+    Change counter per table, bumped in the same transaction as every write
+    that alters a cached listing. Backs the ETags of list endpoints.
+    """
+
+    __tablename__ = "table_versions"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
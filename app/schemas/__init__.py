@@ -1,7 +1,8 @@
+import datetime
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, constr
+from pydantic import BaseModel, EmailStr, constr, field_validator
 
 
 class UserBase(BaseModel):
@@ -60,6 +61,18 @@ class TokenData(BaseModel):
     user_id: Optional[int] = None
 
 
+class CurrentUser(BaseModel):
+    """
+    Authenticated principal built from access-token claims, without loading
+    the full user row.
+    """
+
+    id: int
+    role: Optional[str] = None
+    is_active: bool = True
+    token_version: int = 0
+
+
 class LoginRequest(BaseModel):
     username: str
     password: constr(min_length=6, max_length=72)
@@ -95,14 +108,59 @@ class EmployeeBase(BaseModel):
 
 
 class EmployeeCreate(EmployeeBase):
+    # Omit to have the server assign the next EMP-<n> code.
+    employee_id: Optional[str] = None
     password: constr(min_length=6, max_length=72)
 
 
+class EmployeeImportRow(EmployeeCreate):
+    # Bulk imports must name every employee.
+    employee_id: constr(min_length=1)
+
+
 class Employee(EmployeeBase):
     id: int
     # Keep full_name for backwards compatibility in responses
     full_name: Optional[str] = None
 
+    @field_validator("department", mode="before")
+    @classmethod
+    def _blank_department(cls, value: Optional[str]) -> str:
+        # A blank department is stored as no department_id at all.
+        return "" if value is None else value
+
+
+class EmployeeOffboard(BaseModel):
+    employee_ids: List[int]
+
+
+class EmployeeOffboardResult(BaseModel):
+    deleted: int
+    # Requested ids that do not belong to an employee.
+    not_found: List[int] = []
+
+
+class EmployeeImportError(BaseModel):
+    # CSV line number; the header is row 1.
+    row: int
+    employee_id: Optional[str] = None
+    email: Optional[str] = None
+    error: str
+
+
+class EmployeeImportResult(BaseModel):
+    processed: int
+    created: int
+    errors: List[EmployeeImportError] = []
+
+
+class EmployeePage(BaseModel):
+    items: List[Employee]
+    # Pass as `after` to fetch the next page; None on the last page.
+    next_cursor: Optional[int] = None
+    # Only populated when the caller asked for the total count.
+    total: Optional[int] = None
+
 
 class DepartmentBase(BaseModel):
     name: str
@@ -144,3 +202,62 @@ class Attendance(AttendanceBase):
     class Config:
         from_attributes = True
 
+
+class AttendancePage(BaseModel):
+    items: List[Attendance]
+    # Pass as `after` to fetch the next page; None on the last page.
+    next_cursor: Optional[date] = None
+
+
+class AttendanceCompact(BaseModel):
+    # Parallel arrays: statuses[i] is the status code ("P"/"A") for dates[i].
+    employee_id: int
+    dates: List[date]
+    statuses: List[str]
+    next_cursor: Optional[date] = None
+
+
+class AttendanceBulkCreate(BaseModel):
+    # Explicit (employee_id, date, status) rows...
+    records: List[AttendanceCreate] = []
+    # ...and/or every active employee of a department for a single date.
+    department: Optional[str] = None
+    status: str = "Present"
+    # Spelled via the module: a defaulted `date` field shadows the bare name.
+    date: Optional[datetime.date] = None
+
+
+class AttendanceBulkResult(AttendanceCreate):
+    # created / updated / duplicate / archived / employee_not_found /
+    # invalid_status
+    result: str
+
+
+class AttendanceBulkResponse(BaseModel):
+    created: int
+    results: List[AttendanceBulkResult]
+
+
+class AttendanceArchiveResult(BaseModel):
+    before: date
+    archived: int
+    # False when the per-request batch limit was reached; rows may remain.
+    complete: bool = True
+
+
+class AttendanceTotals(BaseModel):
+    present: int
+    absent: int
+    # present / (present + absent); 0.0 when nothing was marked.
+    attendance_rate: float
+
+
+class EmployeeAttendanceReport(AttendanceTotals):
+    id: int
+    employee_id: Optional[str] = None
+    full_name: Optional[str] = None
+    department: Optional[str] = None
+
+
+class DepartmentAttendanceReport(AttendanceTotals):
+    department: str
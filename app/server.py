@@ -0,0 +1,145 @@
+"""
+Production server.
+
+Usage:
+    python -m app.server
+
+Runs gunicorn with SERVER_WORKERS uvicorn workers (0, the default, means
+one per available CPU). The app is imported once in the master (preload)
+and forked, so workers share its memory and start instantly; each worker
+then drops the connection pools it inherited and opens its own.
+
+gunicorn is optional (it does not run on Windows). Without it the same
+settings are passed to uvicorn's own multi-process mode, which imports the
+app in every worker and has no max-requests jitter.
+"""
+
+import logging
+import os
+import tempfile
+
+from app.config import available_cpus, get_settings
+
+try:  # Optional dependency.
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # pragma: no cover - depends on the environment
+    BaseApplication = None
+
+logger = logging.getLogger("app.server")
+
+APP = "app.main:app"
+
+
+def worker_count(configured: int) -> int:
+    if configured > 0:
+        return configured
+    return available_cpus()
+
+
+def post_fork(server, worker) -> None:
+    """
+    Connections and clients created before the fork belong to the master;
+    sharing their sockets between workers corrupts the protocol stream.
+    """
+    from app.database.async_session import reset_async_engine_after_fork
+    from app.database.session import reset_engine_after_fork
+    from app.utils.cache import get_cache_backend
+
+    reset_engine_after_fork()
+    reset_async_engine_after_fork()
+    get_cache_backend.cache_clear()
+
+
+def child_exit(server, worker) -> None:
+    """
+    Withdraw the gauges of a worker that exited (or was killed) so /metrics
+    does not report it any more; its counters stay in the totals.
+    """
+    from app.utils.metrics import mark_process_dead
+
+    directory = get_settings().metrics_multiproc_dir
+    if directory:
+        mark_process_dead(directory, worker.pid)
+
+
+def prepare_metrics_directory(settings) -> None:
+    """
+    Give the workers an empty shared metrics directory. Several workers get
+    a temporary one when METRICS_MULTIPROC_DIR is unset; it is passed on
+    through the environment so spawned workers find it too.
+    """
+    directory = settings.metrics_multiproc_dir
+    if not directory:
+        if worker_count(settings.server_workers) <= 1:
+            return
+        directory = tempfile.mkdtemp(prefix="hrms-metrics-")
+        os.environ["METRICS_MULTIPROC_DIR"] = directory
+        get_settings.cache_clear()
+    # Imported only now: app.utils.metrics reads the directory on import.
+    from app.utils.metrics import clear_multiprocess_directory
+
+    clear_multiprocess_directory(directory)
+
+
+def gunicorn_options(settings) -> dict:
+    return {
+        "bind": f"{settings.server_host}:{settings.server_port}",
+        "workers": worker_count(settings.server_workers),
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "keepalive": settings.server_keepalive,
+        "backlog": settings.server_backlog,
+        "max_requests": settings.server_max_requests,
+        "max_requests_jitter": settings.server_max_requests_jitter,
+        "graceful_timeout": settings.server_graceful_timeout,
+        "accesslog": "-",
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+
+if BaseApplication is not None:
+
+    class GunicornApplication(BaseApplication):
+        def __init__(self, options: dict) -> None:
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.main import app
+
+            return app
+
+
+def run_uvicorn(settings) -> None:
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=worker_count(settings.server_workers),
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keepalive,
+        limit_max_requests=settings.server_max_requests or None,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        proxy_headers=True,
+    )
+
+
+def main() -> None:
+    prepare_metrics_directory(get_settings())
+    settings = get_settings()
+    if BaseApplication is None:
+        logger.warning("gunicorn is not installed; falling back to uvicorn workers.")
+        run_uvicorn(settings)
+        return
+    GunicornApplication(gunicorn_options(settings)).run()
+
+
+if __name__ == "__main__":
+    main()
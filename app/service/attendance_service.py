@@ -0,0 +1,69 @@
+"""
+Request validation and shaping for attendance marking, shared by the sync
+and async routes.
+"""
+
+from typing import List
+
+from fastapi import HTTPException
+
+from app import schemas
+from app.database import crud
+
+
+def validate_attendance(attendance: schemas.AttendanceCreate) -> None:
+    if not all([attendance.employee_id, attendance.date, attendance.status]):
+        raise HTTPException(status_code=422, detail="All fields are required.")
+    if attendance.status not in crud.ATTENDANCE_STATUSES:
+        raise HTTPException(
+            status_code=422, detail="Status must be 'Present' or 'Absent'."
+        )
+
+
+def check_bulk_payload(payload: schemas.AttendanceBulkCreate) -> None:
+    if payload.department is not None and payload.date is None:
+        raise HTTPException(
+            status_code=422,
+            detail="A date is required when marking a department.",
+        )
+
+
+def bulk_records(
+    payload: schemas.AttendanceBulkCreate, department_employee_ids: List[int]
+) -> List[schemas.AttendanceCreate]:
+    """
+    The explicit records of a bulk payload followed by one record per
+    employee of its department.
+    """
+    records = list(payload.records)
+    records.extend(
+        schemas.AttendanceCreate(
+            employee_id=employee_id, date=payload.date, status=payload.status
+        )
+        for employee_id in department_employee_ids
+    )
+    if not records:
+        raise HTTPException(status_code=422, detail="No attendance records given.")
+    return records
+
+
+def bulk_response(results: List[dict]) -> dict:
+    created = sum(1 for result in results if result["result"] == "created")
+    return {"created": created, "results": results}
+
+
+def compact_page(employee_id: int, rows: list, limit: int) -> dict:
+    """
+    Attendance as parallel date/status-code arrays; like the paginators in
+    `app.utils.pagination`, expects `limit + 1` rows.
+    """
+    days = rows[:limit]
+    return {
+        "employee_id": employee_id,
+        "dates": [day.date for day in days],
+        "statuses": [
+            crud.ATTENDANCE_STATUS_CODES.get(day.status, day.status)
+            for day in days
+        ],
+        "next_cursor": days[-1].date if len(rows) > limit else None,
+    }
@@ -1,15 +1,15 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from jose import jwt
-from passlib.context import CryptContext
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app import models
-from app.database import crud
 from app.config import get_settings
-
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+from app.service.password_hasher import password_hasher, pwd_context
 
 
 class AuthService:
@@ -31,49 +31,99 @@ class AuthService:
     def get_password_hash(self, password: str) -> str:
         return pwd_context.hash(password)
 
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """
+        Verify in the password hashing pool so the event loop stays free.
+        """
+        return await password_hasher.verify(plain_password, hashed_password)
+
+    async def get_password_hash_async(self, password: str) -> str:
+        return await password_hasher.hash(password)
+
+    def _find_login(
+        self, db: Session, identifier: str
+    ) -> Optional[Tuple[models.Auth, models.User]]:
+        """
+        Resolve the Auth row and its linked User in one round trip.
+
+        The identifier may be an Auth username or a User email. Both are
+        looked up as indexed branches of a single UNION ALL (an OR across
+        the two tables would defeat the indexes); a username match wins if
+        the identifier matches both.
+        """
+        linked = db.query(models.Auth, models.User).join(
+            models.User,
+            and_(
+                models.Auth.table_name == models.User.__tablename__,
+                models.Auth.table_id == models.User.id,
+            ),
+        )
+        rows = (
+            linked.filter(models.Auth.username == identifier)
+            .union_all(linked.filter(models.User.email == identifier))
+            .limit(2)
+            .all()
+        )
+        for auth, user in rows:
+            if auth.username == identifier:
+                return auth, user
+        return rows[0] if rows else None
+
     def authenticate_user(self, db: Session, username: str, password: str):
         """
         Authenticate against the Auth table and return the linked User.
-
-        - First, try to find an Auth row by username.
-        - If not found, treat the provided value as an email, look up the User,
-          then find the corresponding Auth row.
         """
-        # 1) Look up Auth by username directly.
-        auth = db.query(models.Auth).filter(models.Auth.username == username).first()
-
-        # 2) If not found, treat the input as an email and resolve via User.
-        if not auth:
-            user_by_email = crud.get_user_by_email(db, username)
-            if not user_by_email:
-                return None
-
-            auth = (
-                db.query(models.Auth)
-                .filter(
-                    models.Auth.table_name == models.User.__tablename__,
-                    models.Auth.table_id == user_by_email.id,
-                )
-                .first()
-            )
-            if not auth:
-                return None
+        found = self._find_login(db, username)
+        if not found:
+            return None
 
+        auth, user = found
         # Verify password against the stored hash.
         if not self.verify_password(password, auth.password_hash):
             return None
+        return user
 
-        # Resolve the linked user row; for now we only support users.
-        if auth.table_name != models.User.__tablename__:
+    async def authenticate_user_async(
+        self, db: Session, username: str, password: str
+    ):
+        """
+        Same as `authenticate_user`, with the lookup in the thread pool and
+        the password check in the hashing pool.
+        """
+        found = await run_in_threadpool(self._find_login, db, username)
+        if not found:
             return None
 
-        user = (
-            db.query(models.User)
-            .filter(models.User.id == auth.table_id)
-            .first()
-        )
+        auth, user = found
+        if not await self.verify_password_async(password, auth.password_hash):
+            return None
         return user
 
+    def token_claims(self, user: models.User) -> dict:
+        """
+        Claims embedded in issued tokens so authenticated requests can be
+        authorised without loading the user row; `ver` must match the
+        user's current token_version for the token to be accepted.
+        """
+        return {
+            "sub": str(user.id),
+            "role": user.role,
+            "act": bool(user.is_active),
+            "ver": user.token_version or 0,
+        }
+
+    def create_token_pair(self, user: models.User) -> tuple:
+        """
+        Return a fresh (access_token, refresh_token) pair for the user.
+        """
+        claims = self.token_claims(user)
+        return (
+            self.create_access_token(data={**claims, "type": "access"}),
+            self.create_refresh_token(data={**claims, "type": "refresh"}),
+        )
+
     def create_access_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
     ) -> str:
@@ -110,3 +160,10 @@ class AuthServiceFactory:
             settings.refresh_token_expire_minutes,
         )
 
+
+@lru_cache()
+def get_auth_service() -> AuthService:
+    """
+    Process-wide AuthService, built on first use rather than at import.
+    """
+    return AuthServiceFactory.create()
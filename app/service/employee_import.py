@@ -0,0 +1,118 @@
+"""
+Bulk employee import from CSV.
+
+The CSV is parsed as a stream and validated row by row with
+`schemas.EmployeeImportRow`. Valid rows are processed in batches: passwords
+are hashed in parallel in the password hashing pool, then users and auth
+rows go out as multi-row INSERTs. Memory is bounded by the batch size, not
+the file size.
+
+Expected header (extra columns are ignored):
+    employee_id,first_name,last_name,email,department,gender,address,pin,city,password
+"""
+
+import csv
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app import schemas
+from app.database import crud
+from app.service.password_hasher import password_hasher
+
+IMPORT_BATCH_SIZE = 500
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def parse_employee_rows(
+    lines: Iterable[str],
+) -> Iterator[Tuple[int, Union[schemas.EmployeeImportRow, dict]]]:
+    """
+    Yield (row_number, EmployeeImportRow) for valid rows and (row_number,
+    error dict) for invalid ones. Row 1 is the header.
+    """
+    reader = csv.DictReader(lines)
+    for row_number, row in enumerate(reader, start=2):
+        # Blank cells stay empty strings, as in the JSON API; only cells
+        # missing from a short row are left out.
+        values = {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key is not None and value is not None
+        }
+        try:
+            yield row_number, schemas.EmployeeImportRow(**values)
+        except ValidationError as exc:
+            yield row_number, {
+                "row": row_number,
+                "employee_id": values.get("employee_id"),
+                "email": values.get("email"),
+                "error": _format_validation_error(exc),
+            }
+
+
+async def _import_batch(db: Session, batch: List[tuple]) -> List[dict]:
+    try:
+        hashes = await password_hasher.hash_many(
+            [employee.password for _, employee in batch]
+        )
+    except HTTPException as exc:
+        if exc.status_code != status.HTTP_503_SERVICE_UNAVAILABLE:
+            raise
+        # Earlier batches are already committed; report this one as not
+        # imported so the caller can retry exactly these rows.
+        return [
+            {
+                "row": row_number,
+                "employee_id": employee.employee_id,
+                "email": employee.email,
+                "error": f"not imported: {exc.detail}",
+            }
+            for row_number, employee in batch
+        ]
+    return await run_in_threadpool(crud.import_employee_batch, db, batch, hashes)
+
+
+async def import_employees(
+    db: Session, lines: Iterable[str], batch_size: int = IMPORT_BATCH_SIZE
+) -> dict:
+    """
+    Import employees from CSV `lines`. Returns the number of rows created
+    and one error per rejected row (validation, duplicate employee_id /
+    email, or a batch turned away because password hashing was saturated).
+    """
+    processed = 0
+    errors: List[dict] = []
+    rows = parse_employee_rows(lines)
+    while True:
+        # Reading the upload and validating rows both block, so each batch
+        # is parsed in the thread pool rather than on the event loop.
+        parsed_rows = await run_in_threadpool(list, islice(rows, batch_size))
+        if not parsed_rows:
+            break
+        processed += len(parsed_rows)
+        batch: List[tuple] = []
+        for row_number, parsed in parsed_rows:
+            if isinstance(parsed, dict):
+                errors.append(parsed)
+            else:
+                batch.append((row_number, parsed))
+        if batch:
+            errors.extend(await _import_batch(db, batch))
+
+    errors.sort(key=lambda error: error["row"])
+    return {
+        "processed": processed,
+        "created": processed - len(errors),
+        "errors": errors,
+    }
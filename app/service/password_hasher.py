@@ -0,0 +1,170 @@
+"""
+Password hashing off the event loop.
+
+pbkdf2 is deliberately slow and holds the GIL, so running it inside request
+handlers stalls every other request on the worker. Hashes are computed in a
+bounded ProcessPoolExecutor instead; callers await the result.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.utils.metrics import registry
+
+pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+
+# Passwords per process-pool task in `hash_many`; small, so a batch never
+# occupies a process for long.
+HASH_MANY_CHUNK_SIZE = 8
+
+_requests = registry.counter(
+    "password_hash_requests_total",
+    "Password hash/verify operations submitted.",
+    ("operation",),
+)
+_rejected = registry.counter(
+    "password_hash_rejected_total",
+    "Password hash/verify operations rejected because the queue was full.",
+    ("operation",),
+)
+_pending = registry.gauge(
+    "password_hash_pending",
+    "Password hash/verify operations queued or running.",
+)
+_duration = registry.histogram(
+    "password_hash_duration_seconds",
+    "Time from submission to result for password hash/verify operations.",
+    ("operation",),
+)
+
+
+# Module-level so the process pool can pickle them by reference.
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+def _hash_all(passwords: List[str]) -> List[str]:
+    return [pwd_context.hash(password) for password in passwords]
+
+
+class PasswordHasher:
+    """
+    Runs hash/verify calls in a process pool of `workers` processes, or in
+    the thread pool when `workers` is 0. At most `max_pending` operations
+    may be queued or running; beyond that callers get 503 so a login storm
+    sheds load instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _acquire(self, operation: str) -> None:
+        with self._lock:
+            if self.max_pending > 0 and self._pending >= self.max_pending:
+                _rejected.inc(operation=operation)
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent authentication requests; retry shortly.",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        _pending.inc()
+        _requests.inc(operation=operation)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+        _pending.dec()
+
+    async def _run(self, operation: str, func, *args):
+        self._acquire(operation)
+        started = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(func, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._release()
+            _duration.observe(time.perf_counter() - started, operation=operation)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", _verify, password, hashed_password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hash a batch (e.g. a bulk import) as one queued operation, in
+        HASH_MANY_CHUNK_SIZE chunks. At most `workers - 1` chunks are in the
+        process pool at a time, so single hashes and verifies (logins) wait
+        behind one short chunk at most rather than the whole batch.
+        """
+        if not passwords:
+            return []
+        self._acquire("hash_many")
+        started = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(_hash_all, passwords)
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            in_flight = asyncio.Semaphore(max(self.workers - 1, 1))
+
+            async def hash_chunk(chunk: List[str]) -> List[str]:
+                async with in_flight:
+                    return await loop.run_in_executor(executor, _hash_all, chunk)
+
+            chunks = await asyncio.gather(
+                *(
+                    hash_chunk(passwords[start:start + HASH_MANY_CHUNK_SIZE])
+                    for start in range(0, len(passwords), HASH_MANY_CHUNK_SIZE)
+                )
+            )
+            return [hashed for chunk in chunks for hashed in chunk]
+        finally:
+            self._release()
+            _duration.observe(time.perf_counter() - started, operation="hash_many")
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_settings = get_settings()
+password_hasher = PasswordHasher(
+    workers=_settings.password_hash_workers,
+    max_pending=_settings.password_hash_max_pending,
+)
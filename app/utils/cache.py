@@ -0,0 +1,237 @@
+"""
+Read-through cache used by crud for hot, rarely-changing reads.
+
+`Cache` is a namespaced view over one process-wide backend chosen by
+CACHE_BACKEND:
+
+- "memory" (default): bounded in-process LRU with per-entry TTL. Each
+  worker keeps its own copy.
+- "redis": any Redis-protocol server (Redis, Valkey, KeyDB, ...) at
+  CACHE_URL, shared by every worker. Needs the optional `redis` package.
+  Connection errors degrade to cache misses rather than failing requests.
+- "none": caching disabled.
+
+Values must be JSON-serializable; crud stores plain dicts, not ORM objects.
+Writers invalidate keys after they commit (write-through invalidation).
+
+Coroutines use the `*_async` methods: a backend that does network I/O is
+then called from the thread pool so it never blocks the event loop.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.utils.metrics import registry
+
+try:  # Optional dependency, only needed for CACHE_BACKEND=redis.
+    import redis
+except ImportError:  # pragma: no cover - depends on the environment
+    redis = None
+
+logger = logging.getLogger("app.cache")
+
+_requests = registry.counter(
+    "cache_requests_total",
+    "Cache lookups by namespace and result (hit/miss).",
+    ("namespace", "result"),
+)
+
+
+class CacheBackend:
+    # Whether calls may wait on the network; async callers then run them in
+    # the thread pool.
+    blocking = False
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class NullBackend(CacheBackend):
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Small thread-safe in-process cache with per-entry expiry and LRU
+    eviction once `maxsize` entries are stored.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisBackend(CacheBackend):
+    blocking = True
+
+    def __init__(self, url: str, prefix: str) -> None:
+        if redis is None:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package (pip install redis)."
+            )
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(key)
+        except redis.RedisError as exc:
+            logger.warning("Cache read failed for %s: %s", key, exc)
+            return None
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            self._client.set(key, json.dumps(value), px=int(ttl * 1000))
+        except redis.RedisError as exc:
+            logger.warning("Cache write failed for %s: %s", key, exc)
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except redis.RedisError as exc:
+            # A failed invalidation leaves stale data until the TTL expires.
+            logger.warning("Cache invalidation failed for %s: %s", keys, exc)
+
+    def clear(self) -> None:
+        try:
+            keys = list(self._client.scan_iter(match=self.prefix + "*"))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError as exc:
+            logger.warning("Cache clear failed: %s", exc)
+
+
+@lru_cache()
+def get_cache_backend() -> CacheBackend:
+    settings = get_settings()
+    if settings.cache_backend == "redis":
+        return RedisBackend(settings.cache_url, settings.cache_prefix)
+    if settings.cache_backend == "none":
+        return NullBackend()
+    return MemoryBackend(settings.cache_max_entries)
+
+
+class Cache:
+    """
+    Namespaced cache with a fixed TTL. A TTL of 0 disables it. `None` is
+    never stored, so a `None` from `get` always means "not cached".
+    """
+
+    def __init__(self, namespace: str, ttl: float) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def _key(self, key: Hashable) -> str:
+        return f"{get_settings().cache_prefix}{self.namespace}:{key}"
+
+    def _counted(self, value: Optional[Any]) -> Optional[Any]:
+        _requests.inc(namespace=self.namespace, result="miss" if value is None else "hit")
+        return value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if self.ttl <= 0:
+            return None
+        return self._counted(get_cache_backend().get(self._key(key)))
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or value is None:
+            return
+        get_cache_backend().set(self._key(key), value, self.ttl)
+
+    def delete(self, *keys: Hashable) -> None:
+        get_cache_backend().delete(*(self._key(key) for key in keys))
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Optional[Any]:
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    async def get_async(self, key: Hashable) -> Optional[Any]:
+        if self.ttl <= 0:
+            return None
+        backend = get_cache_backend()
+        return self._counted(await _call(backend, backend.get, self._key(key)))
+
+    async def set_async(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or value is None:
+            return
+        backend = get_cache_backend()
+        await _call(backend, backend.set, self._key(key), value, self.ttl)
+
+    async def get_or_load_async(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Optional[Any]:
+        value = await self.get_async(key)
+        if value is None:
+            value = await loader()
+            await self.set_async(key, value)
+        return value
+
+
+async def _call(backend: CacheBackend, method: Callable, *args) -> Any:
+    if backend.blocking:
+        return await run_in_threadpool(method, *args)
+    return method(*args)
@@ -0,0 +1,163 @@
+"""
+gzip / brotli response compression.
+
+Pure ASGI, so streamed bodies (exports, NDJSON reports) are compressed chunk
+by chunk and flushed as they are produced instead of being buffered.
+Responses that already carry a Content-Encoding (the precompressed static
+files) or whose type does not compress (images, fonts, archives) pass
+through untouched, as do bodies below COMPRESSION_MIN_SIZE.
+
+Brotli is used when the client accepts it and the optional `brotli`
+package is installed; otherwise gzip.
+"""
+
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.static import accepted_encodings
+
+try:  # Optional dependency.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def _compressible(content_type: str) -> bool:
+    return content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        # wbits=31: deflate with a gzip header and trailer.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Sync-flush so each streamed chunk reaches the client right away.
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose_encoding(self, scope: Scope) -> Optional[str]:
+        accepted = accepted_encodings(Headers(scope=scope))
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._choose_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        encoder = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] < 200
+                    or message["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or not _compressible(headers.get("content-type", ""))
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held until the first body chunk shows whether the
+                    # response is worth compressing.
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = self._encoder(encoding)
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    # Streaming: the compressed length is unknown upfront.
+                    del headers["Content-Length"]
+                    await send(start_message)
+                else:
+                    compressed = encoder.finish(body)
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+            if more_body:
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": encoder.chunk(body),
+                        "more_body": True,
+                    }
+                )
+            else:
+                await send({"type": "http.response.body", "body": encoder.finish(body)})
+
+        await self.app(scope, receive, send_wrapper)
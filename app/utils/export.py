@@ -0,0 +1,79 @@
+"""
+Streaming CSV / NDJSON responses for large exports.
+
+Rows are encoded and flushed in chunks as the database cursor yields them,
+so memory stays flat regardless of export size. The request-scoped session
+is closed before a streaming body is sent, so each export opens its own.
+"""
+
+import csv
+import io
+import json
+from typing import Callable, Iterator, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from app.database import SessionLocal
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows encoded per chunk written to the socket.
+CHUNK_ROWS = 500
+
+
+def _csv_chunks(rows: Iterator[dict], fields: Sequence[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(rows: Iterator[dict]) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str))
+        if len(lines) == CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _session_rows(fetch: Callable, args: tuple, kwargs: dict) -> Iterator[dict]:
+    db = SessionLocal()
+    try:
+        yield from fetch(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+def export_response(
+    fetch: Callable[..., Iterator[dict]],
+    fields: Sequence[str],
+    format: str,
+    filename: str,
+    *args,
+    **kwargs,
+) -> StreamingResponse:
+    """
+    Stream `fetch(db, *args, **kwargs)` as CSV or NDJSON. `fetch` runs in a
+    session owned by the response body.
+    """
+    rows = _session_rows(fetch, args, kwargs)
+    chunks = _csv_chunks(rows, fields) if format == "csv" else _ndjson_chunks(rows)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{format}"'
+        },
+    )
@@ -0,0 +1,63 @@
+"""
+Conditional GET helpers for list endpoints.
+
+Each cached listing derives a weak ETag from a `table_versions` counter, so
+checking freshness costs one primary-key lookup. When the client's
+If-None-Match still matches, the endpoint returns 304 without querying or
+serializing the listing.
+"""
+
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+
+
+def weak_etag(*parts) -> str:
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def _opaque(tag: str) -> str:
+    # Weak comparison (RFC 9110 8.8.3.2) ignores the W/ prefix.
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag) for tag in header.split(",")}
+
+
+def cache_headers(etag: str, vary: Optional[str] = None) -> dict:
+    max_age = get_settings().http_cache_max_age
+    headers = {
+        "ETag": etag,
+        # no-cache still lets clients store the response, but they must
+        # revalidate (cheaply, via If-None-Match) before reusing it.
+        "Cache-Control": (
+            f"public, max-age={max_age}, must-revalidate" if max_age > 0 else "no-cache"
+        ),
+    }
+    if vary:
+        headers["Vary"] = vary
+    return headers
+
+
+def conditional(
+    request: Request, response: Response, etag: str, vary: Optional[str] = None
+) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has `etag`; otherwise set
+    the caching headers on `response` and return None so the endpoint
+    builds the body.
+    """
+    headers = cache_headers(etag, vary)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
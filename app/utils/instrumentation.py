@@ -0,0 +1,285 @@
+"""
+Per-request instrumentation: route latency, in-flight requests and the SQL
+each request issues.
+
+`MetricsMiddleware` opens a `RequestStats` for every HTTP request and keeps
+it in a context variable; cursor events registered by `instrument_sql` add
+each statement's count and time to it. Sync endpoints run in the thread pool
+with a copy of the request context, so they update the same object.
+
+With QUERY_PROFILING enabled, requests that repeat one statement shape
+(the N+1 pattern) are logged, and statements slower than SLOW_QUERY_MS are
+logged with their EXPLAIN plan. `QueryBudget` lets tests assert how many
+statements a block of code may issue.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter as _Tally
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match, Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.utils.metrics import registry
+
+logger = logging.getLogger("app.sql")
+
+_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    ("method", "route"),
+)
+_request_statements = registry.histogram(
+    "http_request_sql_statements",
+    "SQL statements executed per HTTP request.",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+_request_sql_seconds = registry.histogram(
+    "http_request_sql_seconds",
+    "Total SQL execution time per HTTP request.",
+    ("method", "route"),
+)
+_statement_seconds = registry.histogram(
+    "db_statement_duration_seconds",
+    "Execution time of individual SQL statements.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+
+# Placeholder lists such as IN (%s, %s, %s) collapse to one shape.
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestStats:
+    def __init__(self, method: str, route: str, track_shapes: bool = False) -> None:
+        self.method = method
+        self.route = route
+        self.statements = 0
+        self.sql_seconds = 0.0
+        # statement shape -> executions; only kept while profiling.
+        self.shapes: Optional[_Tally] = _Tally() if track_shapes else None
+
+    def record_statement(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.sql_seconds += seconds
+        if self.shapes is not None:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[tuple]:
+        if not self.shapes:
+            return []
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryBudget:
+    """
+    Count the statements executed on any thread while the block runs and
+    fail if there are more than `max_statements`:
+
+        with QueryBudget(3):
+            client.get("/api/v1/employees/")
+    """
+
+    def __init__(self, max_statements: int) -> None:
+        self.max_statements = max_statements
+        self.statements: List[str] = []
+
+    def __enter__(self) -> "QueryBudget":
+        with _budgets_lock:
+            _budgets.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        with _budgets_lock:
+            _budgets.remove(self)
+        if exc_type is None and len(self.statements) > self.max_statements:
+            listing = "\n".join(f"  {sql}" for sql in self.statements)
+            raise AssertionError(
+                f"Expected at most {self.max_statements} SQL statements, "
+                f"got {len(self.statements)}:\n{listing}"
+            )
+
+
+_budgets: List[QueryBudget] = []
+_budgets_lock = threading.Lock()
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request", default=None
+)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current_request.get()
+
+
+def instrument_sql(engine: Engine) -> None:
+    """
+    Time every statement on `engine` and attribute it to the current request.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        _statement_seconds.observe(elapsed)
+        stats = _current_request.get()
+        if stats is not None:
+            stats.record_statement(statement, elapsed)
+        if _budgets:
+            with _budgets_lock:
+                for budget in _budgets:
+                    budget.statements.append(statement_shape(statement))
+
+        settings = get_settings()
+        if settings.query_profiling and elapsed * 1000 >= settings.slow_query_ms:
+            _log_slow_query(conn, cursor, statement, parameters, context, executemany, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context):
+        # A failed statement never reaches after_cursor_execute.
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+def explain_statement(conn, cursor, statement: str, parameters) -> Optional[list]:
+    """
+    EXPLAIN a just-executed SELECT on the same DBAPI connection and return
+    the plan rows as dicts keyed by column name. Uses a raw cursor so the
+    EXPLAIN itself is not instrumented.
+    """
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute(prefix + statement, parameters)
+        columns = [column[0] for column in explain_cursor.description]
+        return [dict(zip(columns, row)) for row in explain_cursor.fetchall()]
+    except Exception as exc:  # never let profiling break the request
+        return [f"EXPLAIN failed: {exc}"]
+    finally:
+        explain_cursor.close()
+
+
+def _describe_parameters(parameters, executemany: bool) -> str:
+    """
+    Parameter names (or count) for the slow-query log. Values are never
+    logged: they include password hashes and personal data.
+    """
+    if executemany:
+        return f"{len(parameters)} rows"
+    if isinstance(parameters, dict):
+        return ", ".join(sorted(parameters)) or "none"
+    return f"{len(parameters or ())} positional"
+
+
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany, elapsed):
+    plan = None
+    # A streamed (unbuffered) result still occupies the connection.
+    streaming = context is not None and context.execution_options.get("stream_results")
+    if not executemany and not streaming:
+        plan = explain_statement(conn, cursor, statement, parameters)
+    logger.warning(
+        "Slow query (%.1f ms): %s | params: %s | plan=%r",
+        elapsed * 1000,
+        _WHITESPACE.sub(" ", statement).strip(),
+        _describe_parameters(parameters, executemany),
+        plan,
+    )
+
+
+def _report_repeated_statements(stats: RequestStats, threshold: int) -> None:
+    for shape, count in stats.repeated_shapes(threshold):
+        logger.warning(
+            "Possible N+1 on %s %s: statement ran %d times: %s",
+            stats.method,
+            stats.route,
+            count,
+            shape,
+        )
+
+
+def _route_template(router: Router, scope: Scope) -> str:
+    """
+    Label requests by route template (e.g. /api/v1/attendance/{employee_id})
+    so per-id URLs share one series.
+    """
+    for route in router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware, so streaming responses pass through untouched and
+    are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp, router: Router) -> None:
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+        method = scope["method"]
+        route = _route_template(self.router, scope)
+        stats = RequestStats(method, route, track_shapes=settings.query_profiling)
+        token = _current_request.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        _in_flight.inc(method=method, route=route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _in_flight.dec(method=method, route=route)
+            _request_seconds.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=route,
+                status=status_code,
+            )
+            _request_statements.observe(stats.statements, method=method, route=route)
+            _request_sql_seconds.observe(stats.sql_seconds, method=method, route=route)
+            _current_request.reset(token)
+            if settings.query_profiling:
+                _report_repeated_statements(stats, settings.n_plus_one_threshold)
@@ -0,0 +1,194 @@
+"""
+Prometheus metrics, recorded with prometheus_client.
+
+Metrics are declared on `registry` with their label names and updated with
+the labels as keyword arguments. With several workers, METRICS_MULTIPROC_DIR
+names a shared directory: it is exported as PROMETHEUS_MULTIPROC_DIR before
+prometheus_client is imported, so every worker writes its values to its own
+memory-mapped files there and `render()` merges them with
+MultiProcessCollector, so any worker can answer a scrape. Counters and
+histograms are summed over all workers, including ones that have exited,
+so they never go backwards; gauges are reported per live worker with a
+`pid` label and dropped by `mark_process_dead`. The directory must be
+emptied (`clear_multiprocess_directory`) before workers start.
+"""
+
+import glob
+import os
+import threading
+from typing import Dict, Optional, Sequence
+
+from app.config import Settings
+
+# A fresh Settings: importing this module must not freeze get_settings()
+# before callers (e.g. the test suite) have set up the environment.
+_directory = Settings().metrics_multiproc_dir
+if _directory:
+    # Read once, when prometheus_client is imported.
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = _directory
+
+import prometheus_client  # noqa: E402
+from prometheus_client import (  # noqa: E402
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+CONTENT_TYPE = prometheus_client.CONTENT_TYPE_LATEST
+
+# The *_created series are not written in multiprocess mode; leave them out
+# everywhere so a single worker exposes the same families.
+prometheus_client.disable_created_metrics()
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _Metric:
+    """
+    A prometheus_client metric updated with labels as keyword arguments.
+    """
+
+    def __init__(self, metric, registry: CollectorRegistry, sample: str) -> None:
+        self._metric = metric
+        self._registry = registry
+        self._sample = sample
+
+    def _child(self, labels: dict):
+        return self._metric.labels(**labels) if labels else self._metric
+
+    def value(self, **labels) -> float:
+        """
+        This process's current value (not summed over workers).
+        """
+        value = self._registry.get_sample_value(
+            self._sample, {name: str(value) for name, value in labels.items()}
+        )
+        return value or 0
+
+
+class Counter(_Metric):
+    def inc(self, amount: float = 1, **labels) -> None:
+        self._child(labels).inc(amount)
+
+
+class Gauge(_Metric):
+    def inc(self, amount: float = 1, **labels) -> None:
+        self._child(labels).inc(amount)
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self._child(labels).dec(amount)
+
+    def set(self, value: float, **labels) -> None:
+        self._child(labels).set(value)
+
+
+class Histogram(_Metric):
+    def observe(self, value: float, **labels) -> None:
+        self._child(labels).observe(value)
+
+
+def clear_multiprocess_directory(directory: str) -> None:
+    """
+    Remove files left by a previous run; call before starting workers.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, "*.db")):
+        os.remove(path)
+
+
+def mark_process_dead(directory: str, pid: int) -> None:
+    """
+    Drop the gauges of an exited worker. Its counters and histograms stay,
+    so totals do not go backwards when a worker is replaced.
+    """
+    multiprocess.mark_process_dead(pid, directory)
+
+
+class MetricsRegistry:
+    """
+    Metrics of this process. `directory` is the shared multiprocess
+    directory `render()` merges, if any.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.directory = directory or None
+        self._registry = CollectorRegistry(auto_describe=True)
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, metric_cls, name: str, sample: str, *args, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                # Re-imports (e.g. reloads) get the already registered metric.
+                return existing
+            metric = cls(
+                metric_cls(name, *args, registry=self._registry, **kwargs),
+                self._registry,
+                sample,
+            )
+            self._metrics[name] = metric
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        # prometheus_client appends "_total" to the exposed name itself.
+        base = name[: -len("_total")] if name.endswith("_total") else name
+        return self._register(
+            Counter,
+            prometheus_client.Counter,
+            base,
+            f"{base}_total",
+            documentation,
+            labelnames,
+        )
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(
+            Gauge,
+            prometheus_client.Gauge,
+            name,
+            name,
+            documentation,
+            labelnames,
+            multiprocess_mode="liveall",
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        return self._register(
+            Histogram,
+            prometheus_client.Histogram,
+            name,
+            f"{name}_count",
+            documentation,
+            labelnames,
+            buckets=buckets or DEFAULT_BUCKETS,
+        )
+
+    def render(self) -> str:
+        if self.directory is None:
+            return generate_latest(self._registry).decode()
+        merged = CollectorRegistry()
+        multiprocess.MultiProcessCollector(merged, path=self.directory)
+        return generate_latest(merged).decode()
+
+    def shutdown(self) -> None:
+        """
+        Withdraw this worker's gauges; call when the worker stops.
+        """
+        if self.directory is not None:
+            mark_process_dead(self.directory, os.getpid())
+
+
+registry = MetricsRegistry(_directory)
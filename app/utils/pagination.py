@@ -0,0 +1,20 @@
+"""
+Page bodies for the keyset-paginated list endpoints (sync and async).
+
+Callers fetch `limit + 1` rows: the extra row only tells whether another
+page exists, and the last row shown becomes the `next_cursor`.
+"""
+
+from typing import Optional
+
+
+def employee_page(rows: list, limit: int, total: Optional[int]) -> dict:
+    items = rows[:limit]
+    next_cursor = items[-1].id if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor, "total": total}
+
+
+def attendance_page(rows: list, limit: int) -> dict:
+    items = rows[:limit]
+    next_cursor = items[-1].date if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,19 @@
+"""
+Pytest helpers for guarding the number of queries an endpoint issues.
+
+Enable with `pytest -p app.utils.pytest_plugin` (or list it in
+`pytest_plugins`), then:
+
+    def test_list_employees(client, query_budget):
+        with query_budget(2):
+            client.get("/api/v1/employees/")
+"""
+
+import pytest
+
+from app.utils.instrumentation import QueryBudget
+
+
+@pytest.fixture
+def query_budget():
+    return QueryBudget
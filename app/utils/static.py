@@ -0,0 +1,138 @@
+"""
+Static serving for the built SPA (frontend/dist).
+
+- `PrecompressedStaticFiles` serves a `.br` or `.gz` sibling written at
+  build time (see frontend/scripts/compress.mjs) when the client accepts
+  that encoding, so workers never compress bundles per request.
+- Vite fingerprints everything under `assets/`, so those files are cached
+  for a year as `immutable`; anything else must be revalidated.
+- `SpaIndex` keeps index.html (and its gzip form) in memory with a weak
+  ETag, shared by both encodings, instead of reading it from disk on every
+  client-side route.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import stat
+from pathlib import Path
+from typing import Optional
+
+import anyio
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.types import Scope
+
+from app.utils.http_cache import etag_matches, weak_etag
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Preferred first.
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(headers: Headers) -> set:
+    accepted = set()
+    for part in headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def _media_type(path: str) -> str:
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type in (
+        "application/javascript",
+        "application/json",
+    ):
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    def __init__(self, *args, immutable_prefix: str = "assets/", **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.immutable_prefix = immutable_prefix
+
+    async def _precompressed_response(self, path: str, scope: Scope) -> Optional[Response]:
+        accepted = accepted_encodings(Headers(scope=scope))
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + suffix
+            )
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                # ETag/Last-Modified come from the compressed file, so each
+                # encoding revalidates independently.
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["Content-Encoding"] = encoding
+                if isinstance(response, FileResponse):
+                    response.headers["Content-Type"] = _media_type(path)
+                return response
+        return None
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = None
+        if scope["method"] in ("GET", "HEAD"):
+            response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = (
+            IMMUTABLE_CACHE_CONTROL
+            if path.startswith(self.immutable_prefix)
+            else REVALIDATE_CACHE_CONTROL
+        )
+        return response
+
+
+class SpaIndex:
+    """
+    index.html served from memory. It is loaded on first use; rebuilding the
+    frontend requires a restart (the assets it references are new files).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._body: Optional[bytes] = None
+        self._gzipped: Optional[bytes] = None
+        self._etag = ""
+
+    def _load(self) -> None:
+        body = self.path.read_bytes()
+        self._gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        # Weak: the gzip and identity bodies differ byte for byte.
+        self._etag = weak_etag(hashlib.sha256(body).hexdigest()[:32])
+        self._body = body
+
+    def response(self, request: Request) -> Response:
+        if self._body is None:
+            if not self.path.is_file():
+                return Response(
+                    "Frontend not built; run `npm run build` in frontend/.",
+                    status_code=404,
+                    media_type="text/plain",
+                )
+            self._load()
+
+        headers = {
+            "ETag": self._etag,
+            "Cache-Control": REVALIDATE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request, self._etag):
+            return Response(status_code=304, headers=headers)
+
+        if "gzip" in accepted_encodings(request.headers):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self._gzipped, media_type="text/html", headers=headers)
+        return Response(self._body, media_type="text/html", headers=headers)
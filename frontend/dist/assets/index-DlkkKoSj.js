@@ -1,51 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function xd(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Ba={exports:{}},_l={},Ha={exports:{}},D={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var pr=Symbol.for("react.element"),wd=Symbol.for("react.portal"),Sd=Symbol.for("react.fragment"),kd=Symbol.for("react.strict_mode"),Ed=Symbol.for("react.profiler"),Cd=Symbol.for("react.provider"),Nd=Symbol.for("react.context"),_d=Symbol.for("react.forward_ref"),jd=Symbol.for("react.suspense"),Rd=Symbol.for("react.memo"),Pd=Symbol.for("react.lazy"),ks=Symbol.iterator;function Ld(e){return e===null||typeof e!="object"?null:(e=ks&&e[ks]||e["@@iterator"],typeof e=="function"?e:null)}var Wa={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Va=Object.assign,Qa={};function xn(e,t,n){this.props=e,this.context=t,this.refs=Qa,this.updater=n||Wa}xn.prototype.isReactComponent={};xn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};xn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Ka(){}Ka.prototype=xn.prototype;function Si(e,t,n){this.props=e,this.context=t,this.refs=Qa,this.updater=n||Wa}var ki=Si.prototype=new Ka;ki.constructor=Si;Va(ki,xn.prototype);ki.isPureReactComponent=!0;var Es=Array.isArray,Ya=Object.prototype.hasOwnProperty,Ei={current:null},Ga={key:!0,ref:!0,__self:!0,__source:!0};function Xa(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)Ya.call(t,r)&&!Ga.hasOwnProperty(r)&&(l[r]=t[r]);var s=arguments.length-2;if(s===1)l.children=n;else if(1<s){for(var a=Array(s),u=0;u<s;u++)a[u]=arguments[u+2];l.children=a}if(e&&e.defaultProps)for(r in s=e.defaultProps,s)l[r]===void 0&&(l[r]=s[r]);return{$$typeof:pr,type:e,key:o,ref:i,props:l,_owner:Ei.current}}function Td(e,t){return{$$typeof:pr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Ci(e){return typeof e=="object"&&e!==null&&e.$$typeof===pr}function zd(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Cs=/\/+/g;function Gl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?zd(""+e.key):t.toString(36)}function Ar(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case pr:case wd:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+Gl(i,0):r,Es(l)?(n="",e!=null&&(n=e.replace(Cs,"$&/")+"/"),Ar(l,t,n,"",function(u){return u})):l!=null&&(Ci(l)&&(l=Td(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Cs,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Es(e))for(var s=0;s<e.length;s++){o=e[s];var a=r+Gl(o,s);i+=Ar(o,t,n,a,l)}else if(a=Ld(e),typeof a=="function")for(e=a.call(e),s=0;!(o=e.next()).done;)o=o.value,a=r+Gl(o,s++),i+=Ar(o,t,n,a,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function kr(e,t,n){if(e==null)return e;var r=[],l=0;return Ar(e,r,"","",function(o){return t.call(n,o,l++)}),r}function Dd(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ce={current:null},Br={transition:null},Id={ReactCurrentDispatcher:ce,ReactCurrentBatchConfig:Br,ReactCurrentOwner:Ei};function Ja(){throw Error("act(...) is not supported in production builds of React.")}D.Children={map:kr,forEach:function(e,t,n){kr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return kr(e,function(){t++}),t},toArray:function(e){return kr(e,function(t){return t})||[]},only:function(e){if(!Ci(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};D.Component=xn;D.Fragment=Sd;D.Profiler=Ed;D.PureComponent=Si;D.StrictMode=kd;D.Suspense=jd;D.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Id;D.act=Ja;D.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Va({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=Ei.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var s=e.type.defaultProps;for(a in t)Ya.call(t,a)&&!Ga.hasOwnProperty(a)&&(r[a]=t[a]===void 0&&s!==void 0?s[a]:t[a])}var a=arguments.length-2;if(a===1)r.children=n;else if(1<a){s=Array(a);for(var u=0;u<a;u++)s[u]=arguments[u+2];r.children=s}return{$$typeof:pr,type:e.type,key:l,ref:o,props:r,_owner:i}};D.createContext=function(e){return e={$$typeof:Nd,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Cd,_context:e},e.Consumer=e};D.createElement=Xa;D.createFactory=function(e){var t=Xa.bind(null,e);return t.type=e,t};D.createRef=function(){return{current:null}};D.forwardRef=function(e){return{$$typeof:_d,render:e}};D.isValidElement=Ci;D.lazy=function(e){return{$$typeof:Pd,_payload:{_status:-1,_result:e},_init:Dd}};D.memo=function(e,t){return{$$typeof:Rd,type:e,compare:t===void 0?null:t}};D.startTransition=function(e){var t=Br.transition;Br.transition={};try{e()}finally{Br.transition=t}};D.unstable_act=Ja;D.useCallback=function(e,t){return ce.current.useCallback(e,t)};D.useContext=function(e){return ce.current.useContext(e)};D.useDebugValue=function(){};D.useDeferredValue=function(e){return ce.current.useDeferredValue(e)};D.useEffect=function(e,t){return ce.current.useEffect(e,t)};D.useId=function(){return ce.current.useId()};D.useImperativeHandle=function(e,t,n){return ce.current.useImperativeHandle(e,t,n)};D.useInsertionEffect=function(e,t){return ce.current.useInsertionEffect(e,t)};D.useLayoutEffect=function(e,t){return ce.current.useLayoutEffect(e,t)};D.useMemo=function(e,t){return ce.current.useMemo(e,t)};D.useReducer=function(e,t,n){return ce.current.useReducer(e,t,n)};D.useRef=function(e){return ce.current.useRef(e)};D.useState=function(e){return ce.current.useState(e)};D.useSyncExternalStore=function(e,t,n){return ce.current.useSyncExternalStore(e,t,n)};D.useTransition=function(){return ce.current.useTransition()};D.version="18.3.1";Ha.exports=D;var y=Ha.exports;const Fd=xd(y);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Od=y,Md=Symbol.for("react.element"),$d=Symbol.for("react.fragment"),Ud=Object.prototype.hasOwnProperty,Ad=Od.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Bd={key:!0,ref:!0,__self:!0,__source:!0};function Za(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Ud.call(t,r)&&!Bd.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:Md,type:e,key:o,ref:i,props:l,_owner:Ad.current}}_l.Fragment=$d;_l.jsx=Za;_l.jsxs=Za;Ba.exports=_l;var d=Ba.exports,No={},qa={exports:{}},Ee={},ba={exports:{}},eu={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(P,L){var z=P.length;P.push(L);e:for(;0<z;){var K=z-1>>>1,Z=P[K];if(0<l(Z,L))P[K]=L,P[z]=Z,z=K;else break e}}function n(P){return P.length===0?null:P[0]}function r(P){if(P.length===0)return null;var L=P[0],z=P.pop();if(z!==L){P[0]=z;e:for(var K=0,Z=P.length,wr=Z>>>1;K<wr;){var Pt=2*(K+1)-1,Yl=P[Pt],Lt=Pt+1,Sr=P[Lt];if(0>l(Yl,z))Lt<Z&&0>l(Sr,Yl)?(P[K]=Sr,P[Lt]=z,K=Lt):(P[K]=Yl,P[Pt]=z,K=Pt);else if(Lt<Z&&0>l(Sr,z))P[K]=Sr,P[Lt]=z,K=Lt;else break e}}return L}function l(P,L){var z=P.sortIndex-L.sortIndex;return z!==0?z:P.id-L.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,s=i.now();e.unstable_now=function(){return i.now()-s}}var a=[],u=[],h=1,p=null,v=3,w=!1,S=!1,x=!1,E=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,c=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function m(P){for(var L=n(u);L!==null;){if(L.callback===null)r(u);else if(L.startTime<=P)r(u),L.sortIndex=L.expirationTime,t(a,L);else break;L=n(u)}}function g(P){if(x=!1,m(P),!S)if(n(a)!==null)S=!0,Ql(k);else{var L=n(u);L!==null&&Kl(g,L.startTime-P)}}function k(P,L){S=!1,x&&(x=!1,f(R),R=-1),w=!0;var z=v;try{for(m(L),p=n(a);p!==null&&(!(p.expirationTime>L)||P&&!ge());){var K=p.callback;if(typeof K=="function"){p.callback=null,v=p.priorityLevel;var Z=K(p.expirationTime<=L);L=e.unstable_now(),typeof Z=="function"?p.callback=Z:p===n(a)&&r(a),m(L)}else r(a);p=n(a)}if(p!==null)var wr=!0;else{var Pt=n(u);Pt!==null&&Kl(g,Pt.startTime-L),wr=!1}return wr}finally{p=null,v=z,w=!1}}var N=!1,_=null,R=-1,O=5,T=-1;function ge(){return!(e.unstable_now()-T<O)}function Rt(){if(_!==null){var P=e.unstable_now();T=P;var L=!0;try{L=_(!0,P)}finally{L?st():(N=!1,_=null)}}else N=!1}var st;if(typeof c=="function")st=function(){c(Rt)};else if(typeof MessageChannel<"u"){var _n=new MessageChannel,Be=_n.port2;_n.port1.onmessage=Rt,st=function(){Be.postMessage(null)}}else st=function(){E(Rt,0)};function Ql(P){_=P,N||(N=!0,st())}function Kl(P,L){R=E(function(){P(e.unstable_now())},L)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(P){P.callback=null},e.unstable_continueExecution=function(){S||w||(S=!0,Ql(k))},e.unstable_forceFrameRate=function(P){0>P||125<P?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):O=0<P?Math.floor(1e3/P):5},e.unstable_getCurrentPriorityLevel=function(){return v},e.unstable_getFirstCallbackNode=function(){return n(a)},e.unstable_next=function(P){switch(v){case 1:case 2:case 3:var L=3;break;default:L=v}var z=v;v=L;try{return P()}finally{v=z}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(P,L){switch(P){case 1:case 2:case 3:case 4:case 5:break;default:P=3}var z=v;v=P;try{return L()}finally{v=z}},e.unstable_scheduleCallback=function(P,L,z){var K=e.unstable_now();switch(typeof z=="object"&&z!==null?(z=z.delay,z=typeof z=="number"&&0<z?K+z:K):z=K,P){case 1:var Z=-1;break;case 2:Z=250;break;case 5:Z=1073741823;break;case 4:Z=1e4;break;default:Z=5e3}return Z=z+Z,P={id:h++,callback:L,priorityLevel:P,startTime:z,expirationTime:Z,sortIndex:-1},z>K?(P.sortIndex=z,t(u,P),n(a)===null&&P===n(u)&&(x?(f(R),R=-1):x=!0,Kl(g,z-K))):(P.sortIndex=Z,t(a,P),S||w||(S=!0,Ql(k))),P},e.unstable_shouldYield=ge,e.unstable_wrapCallback=function(P){var L=v;return function(){var z=v;v=L;try{return P.apply(this,arguments)}finally{v=z}}}})(eu);ba.exports=eu;var Hd=ba.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Wd=y,ke=Hd;function C(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var tu=new Set,Xn={};function Wt(e,t){fn(e,t),fn(e+"Capture",t)}function fn(e,t){for(Xn[e]=t,e=0;e<t.length;e++)tu.add(t[e])}var et=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),_o=Object.prototype.hasOwnProperty,Vd=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ns={},_s={};function Qd(e){return _o.call(_s,e)?!0:_o.call(Ns,e)?!1:Vd.test(e)?_s[e]=!0:(Ns[e]=!0,!1)}function Kd(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Yd(e,t,n,r){if(t===null||typeof t>"u"||Kd(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function de(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var re={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){re[e]=new de(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];re[t]=new de(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){re[e]=new de(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){re[e]=new de(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){re[e]=new de(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){re[e]=new de(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){re[e]=new de(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){re[e]=new de(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){re[e]=new de(e,5,!1,e.toLowerCase(),null,!1,!1)});var Ni=/[\-:]([a-z])/g;function _i(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Ni,_i);re[t]=new de(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Ni,_i);re[t]=new de(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Ni,_i);re[t]=new de(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){re[e]=new de(e,1,!1,e.toLowerCase(),null,!1,!1)});re.xlinkHref=new de("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){re[e]=new de(e,1,!1,e.toLowerCase(),null,!0,!0)});function ji(e,t,n,r){var l=re.hasOwnProperty(t)?re[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Yd(t,n,l,r)&&(n=null),r||l===null?Qd(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ot=Wd.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Er=Symbol.for("react.element"),Yt=Symbol.for("react.portal"),Gt=Symbol.for("react.fragment"),Ri=Symbol.for("react.strict_mode"),jo=Symbol.for("react.profiler"),nu=Symbol.for("react.provider"),ru=Symbol.for("react.context"),Pi=Symbol.for("react.forward_ref"),Ro=Symbol.for("react.suspense"),Po=Symbol.for("react.suspense_list"),Li=Symbol.for("react.memo"),ut=Symbol.for("react.lazy"),lu=Symbol.for("react.offscreen"),js=Symbol.iterator;function jn(e){return e===null||typeof e!="object"?null:(e=js&&e[js]||e["@@iterator"],typeof e=="function"?e:null)}var V=Object.assign,Xl;function On(e){if(Xl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Xl=t&&t[1]||""}return`
-`+Xl+e}var Jl=!1;function Zl(e,t){if(!e||Jl)return"";Jl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&typeof u.stack=="string"){for(var l=u.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,s=o.length-1;1<=i&&0<=s&&l[i]!==o[s];)s--;for(;1<=i&&0<=s;i--,s--)if(l[i]!==o[s]){if(i!==1||s!==1)do if(i--,s--,0>s||l[i]!==o[s]){var a=`
-`+l[i].replace(" at new "," at ");return e.displayName&&a.includes("<anonymous>")&&(a=a.replace("<anonymous>",e.displayName)),a}while(1<=i&&0<=s);break}}}finally{Jl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?On(e):""}function Gd(e){switch(e.tag){case 5:return On(e.type);case 16:return On("Lazy");case 13:return On("Suspense");case 19:return On("SuspenseList");case 0:case 2:case 15:return e=Zl(e.type,!1),e;case 11:return e=Zl(e.type.render,!1),e;case 1:return e=Zl(e.type,!0),e;default:return""}}function Lo(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Gt:return"Fragment";case Yt:return"Portal";case jo:return"Profiler";case Ri:return"StrictMode";case Ro:return"Suspense";case Po:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case ru:return(e.displayName||"Context")+".Consumer";case nu:return(e._context.displayName||"Context")+".Provider";case Pi:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Li:return t=e.displayName||null,t!==null?t:Lo(e.type)||"Memo";case ut:t=e._payload,e=e._init;try{return Lo(e(t))}catch{}}return null}function Xd(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Lo(t);case 8:return t===Ri?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Et(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ou(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Jd(e){var t=ou(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Cr(e){e._valueTracker||(e._valueTracker=Jd(e))}function iu(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ou(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function el(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function To(e,t){var n=t.checked;return V({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Rs(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Et(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function su(e,t){t=t.checked,t!=null&&ji(e,"checked",t,!1)}function zo(e,t){su(e,t);var n=Et(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?Do(e,t.type,n):t.hasOwnProperty("defaultValue")&&Do(e,t.type,Et(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Ps(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function Do(e,t,n){(t!=="number"||el(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Mn=Array.isArray;function on(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Et(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function Io(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(C(91));return V({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ls(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(C(92));if(Mn(n)){if(1<n.length)throw Error(C(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Et(n)}}function au(e,t){var n=Et(t.value),r=Et(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Ts(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function uu(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Fo(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?uu(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Nr,cu=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Nr=Nr||document.createElement("div"),Nr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Nr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Jn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var An={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Zd=["Webkit","ms","Moz","O"];Object.keys(An).forEach(function(e){Zd.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),An[t]=An[e]})});function du(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||An.hasOwnProperty(e)&&An[e]?(""+t).trim():t+"px"}function fu(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=du(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var qd=V({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Oo(e,t){if(t){if(qd[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(C(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(C(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(C(61))}if(t.style!=null&&typeof t.style!="object")throw Error(C(62))}}function Mo(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var $o=null;function Ti(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Uo=null,sn=null,an=null;function zs(e){if(e=vr(e)){if(typeof Uo!="function")throw Error(C(280));var t=e.stateNode;t&&(t=Tl(t),Uo(e.stateNode,e.type,t))}}function pu(e){sn?an?an.push(e):an=[e]:sn=e}function mu(){if(sn){var e=sn,t=an;if(an=sn=null,zs(e),t)for(e=0;e<t.length;e++)zs(t[e])}}function hu(e,t){return e(t)}function vu(){}var ql=!1;function yu(e,t,n){if(ql)return e(t,n);ql=!0;try{return hu(e,t,n)}finally{ql=!1,(sn!==null||an!==null)&&(vu(),mu())}}function Zn(e,t){var n=e.stateNode;if(n===null)return null;var r=Tl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(C(231,t,typeof n));return n}var Ao=!1;if(et)try{var Rn={};Object.defineProperty(Rn,"passive",{get:function(){Ao=!0}}),window.addEventListener("test",Rn,Rn),window.removeEventListener("test",Rn,Rn)}catch{Ao=!1}function bd(e,t,n,r,l,o,i,s,a){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(h){this.onError(h)}}var Bn=!1,tl=null,nl=!1,Bo=null,ef={onError:function(e){Bn=!0,tl=e}};function tf(e,t,n,r,l,o,i,s,a){Bn=!1,tl=null,bd.apply(ef,arguments)}function nf(e,t,n,r,l,o,i,s,a){if(tf.apply(this,arguments),Bn){if(Bn){var u=tl;Bn=!1,tl=null}else throw Error(C(198));nl||(nl=!0,Bo=u)}}function Vt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function gu(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Ds(e){if(Vt(e)!==e)throw Error(C(188))}function rf(e){var t=e.alternate;if(!t){if(t=Vt(e),t===null)throw Error(C(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return Ds(l),e;if(o===r)return Ds(l),t;o=o.sibling}throw Error(C(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,s=l.child;s;){if(s===n){i=!0,n=l,r=o;break}if(s===r){i=!0,r=l,n=o;break}s=s.sibling}if(!i){for(s=o.child;s;){if(s===n){i=!0,n=o,r=l;break}if(s===r){i=!0,r=o,n=l;break}s=s.sibling}if(!i)throw Error(C(189))}}if(n.alternate!==r)throw Error(C(190))}if(n.tag!==3)throw Error(C(188));return n.stateNode.current===n?e:t}function xu(e){return e=rf(e),e!==null?wu(e):null}function wu(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=wu(e);if(t!==null)return t;e=e.sibling}return null}var Su=ke.unstable_scheduleCallback,Is=ke.unstable_cancelCallback,lf=ke.unstable_shouldYield,of=ke.unstable_requestPaint,Y=ke.unstable_now,sf=ke.unstable_getCurrentPriorityLevel,zi=ke.unstable_ImmediatePriority,ku=ke.unstable_UserBlockingPriority,rl=ke.unstable_NormalPriority,af=ke.unstable_LowPriority,Eu=ke.unstable_IdlePriority,jl=null,Qe=null;function uf(e){if(Qe&&typeof Qe.onCommitFiberRoot=="function")try{Qe.onCommitFiberRoot(jl,e,void 0,(e.current.flags&128)===128)}catch{}}var Me=Math.clz32?Math.clz32:ff,cf=Math.log,df=Math.LN2;function ff(e){return e>>>=0,e===0?32:31-(cf(e)/df|0)|0}var _r=64,jr=4194304;function $n(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function ll(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var s=i&~l;s!==0?r=$n(s):(o&=i,o!==0&&(r=$n(o)))}else i=n&~l,i!==0?r=$n(i):o!==0&&(r=$n(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Me(t),l=1<<n,r|=e[n],t&=~l;return r}function pf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function mf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Me(o),s=1<<i,a=l[i];a===-1?(!(s&n)||s&r)&&(l[i]=pf(s,t)):a<=t&&(e.expiredLanes|=s),o&=~s}}function Ho(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Cu(){var e=_r;return _r<<=1,!(_r&4194240)&&(_r=64),e}function bl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function mr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Me(t),e[t]=n}function hf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Me(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function Di(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Me(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var F=0;function Nu(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var _u,Ii,ju,Ru,Pu,Wo=!1,Rr=[],ht=null,vt=null,yt=null,qn=new Map,bn=new Map,dt=[],vf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Fs(e,t){switch(e){case"focusin":case"focusout":ht=null;break;case"dragenter":case"dragleave":vt=null;break;case"mouseover":case"mouseout":yt=null;break;case"pointerover":case"pointerout":qn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":bn.delete(t.pointerId)}}function Pn(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=vr(t),t!==null&&Ii(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function yf(e,t,n,r,l){switch(t){case"focusin":return ht=Pn(ht,e,t,n,r,l),!0;case"dragenter":return vt=Pn(vt,e,t,n,r,l),!0;case"mouseover":return yt=Pn(yt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return qn.set(o,Pn(qn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,bn.set(o,Pn(bn.get(o)||null,e,t,n,r,l)),!0}return!1}function Lu(e){var t=Dt(e.target);if(t!==null){var n=Vt(t);if(n!==null){if(t=n.tag,t===13){if(t=gu(n),t!==null){e.blockedOn=t,Pu(e.priority,function(){ju(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Hr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Vo(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);$o=r,n.target.dispatchEvent(r),$o=null}else return t=vr(n),t!==null&&Ii(t),e.blockedOn=n,!1;t.shift()}return!0}function Os(e,t,n){Hr(e)&&n.delete(t)}function gf(){Wo=!1,ht!==null&&Hr(ht)&&(ht=null),vt!==null&&Hr(vt)&&(vt=null),yt!==null&&Hr(yt)&&(yt=null),qn.forEach(Os),bn.forEach(Os)}function Ln(e,t){e.blockedOn===t&&(e.blockedOn=null,Wo||(Wo=!0,ke.unstable_scheduleCallback(ke.unstable_NormalPriority,gf)))}function er(e){function t(l){return Ln(l,e)}if(0<Rr.length){Ln(Rr[0],e);for(var n=1;n<Rr.length;n++){var r=Rr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(ht!==null&&Ln(ht,e),vt!==null&&Ln(vt,e),yt!==null&&Ln(yt,e),qn.forEach(t),bn.forEach(t),n=0;n<dt.length;n++)r=dt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<dt.length&&(n=dt[0],n.blockedOn===null);)Lu(n),n.blockedOn===null&&dt.shift()}var un=ot.ReactCurrentBatchConfig,ol=!0;function xf(e,t,n,r){var l=F,o=un.transition;un.transition=null;try{F=1,Fi(e,t,n,r)}finally{F=l,un.transition=o}}function wf(e,t,n,r){var l=F,o=un.transition;un.transition=null;try{F=4,Fi(e,t,n,r)}finally{F=l,un.transition=o}}function Fi(e,t,n,r){if(ol){var l=Vo(e,t,n,r);if(l===null)uo(e,t,r,il,n),Fs(e,r);else if(yf(l,e,t,n,r))r.stopPropagation();else if(Fs(e,r),t&4&&-1<vf.indexOf(e)){for(;l!==null;){var o=vr(l);if(o!==null&&_u(o),o=Vo(e,t,n,r),o===null&&uo(e,t,r,il,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else uo(e,t,r,null,n)}}var il=null;function Vo(e,t,n,r){if(il=null,e=Ti(r),e=Dt(e),e!==null)if(t=Vt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=gu(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return il=e,null}function Tu(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(sf()){case zi:return 1;case ku:return 4;case rl:case af:return 16;case Eu:return 536870912;default:return 16}default:return 16}}var pt=null,Oi=null,Wr=null;function zu(){if(Wr)return Wr;var e,t=Oi,n=t.length,r,l="value"in pt?pt.value:pt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Wr=l.slice(e,1<r?1-r:void 0)}function Vr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Pr(){return!0}function Ms(){return!1}function Ce(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var s in e)e.hasOwnProperty(s)&&(n=e[s],this[s]=n?n(o):o[s]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Pr:Ms,this.isPropagationStopped=Ms,this}return V(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Pr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Pr)},persist:function(){},isPersistent:Pr}),t}var wn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Mi=Ce(wn),hr=V({},wn,{view:0,detail:0}),Sf=Ce(hr),eo,to,Tn,Rl=V({},hr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:$i,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Tn&&(Tn&&e.type==="mousemove"?(eo=e.screenX-Tn.screenX,to=e.screenY-Tn.screenY):to=eo=0,Tn=e),eo)},movementY:function(e){return"movementY"in e?e.movementY:to}}),$s=Ce(Rl),kf=V({},Rl,{dataTransfer:0}),Ef=Ce(kf),Cf=V({},hr,{relatedTarget:0}),no=Ce(Cf),Nf=V({},wn,{animationName:0,elapsedTime:0,pseudoElement:0}),_f=Ce(Nf),jf=V({},wn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Rf=Ce(jf),Pf=V({},wn,{data:0}),Us=Ce(Pf),Lf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Tf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},zf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Df(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=zf[e])?!!t[e]:!1}function $i(){return Df}var If=V({},hr,{key:function(e){if(e.key){var t=Lf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Vr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Tf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:$i,charCode:function(e){return e.type==="keypress"?Vr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Vr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Ff=Ce(If),Of=V({},Rl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),As=Ce(Of),Mf=V({},hr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:$i}),$f=Ce(Mf),Uf=V({},wn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Af=Ce(Uf),Bf=V({},Rl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Hf=Ce(Bf),Wf=[9,13,27,32],Ui=et&&"CompositionEvent"in window,Hn=null;et&&"documentMode"in document&&(Hn=document.documentMode);var Vf=et&&"TextEvent"in window&&!Hn,Du=et&&(!Ui||Hn&&8<Hn&&11>=Hn),Bs=" ",Hs=!1;function Iu(e,t){switch(e){case"keyup":return Wf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Fu(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Xt=!1;function Qf(e,t){switch(e){case"compositionend":return Fu(t);case"keypress":return t.which!==32?null:(Hs=!0,Bs);case"textInput":return e=t.data,e===Bs&&Hs?null:e;default:return null}}function Kf(e,t){if(Xt)return e==="compositionend"||!Ui&&Iu(e,t)?(e=zu(),Wr=Oi=pt=null,Xt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Du&&t.locale!=="ko"?null:t.data;default:return null}}var Yf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ws(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Yf[e.type]:t==="textarea"}function Ou(e,t,n,r){pu(r),t=sl(t,"onChange"),0<t.length&&(n=new Mi("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Wn=null,tr=null;function Gf(e){Yu(e,0)}function Pl(e){var t=qt(e);if(iu(t))return e}function Xf(e,t){if(e==="change")return t}var Mu=!1;if(et){var ro;if(et){var lo="oninput"in document;if(!lo){var Vs=document.createElement("div");Vs.setAttribute("oninput","return;"),lo=typeof Vs.oninput=="function"}ro=lo}else ro=!1;Mu=ro&&(!document.documentMode||9<document.documentMode)}function Qs(){Wn&&(Wn.detachEvent("onpropertychange",$u),tr=Wn=null)}function $u(e){if(e.propertyName==="value"&&Pl(tr)){var t=[];Ou(t,tr,e,Ti(e)),yu(Gf,t)}}function Jf(e,t,n){e==="focusin"?(Qs(),Wn=t,tr=n,Wn.attachEvent("onpropertychange",$u)):e==="focusout"&&Qs()}function Zf(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Pl(tr)}function qf(e,t){if(e==="click")return Pl(t)}function bf(e,t){if(e==="input"||e==="change")return Pl(t)}function ep(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ue=typeof Object.is=="function"?Object.is:ep;function nr(e,t){if(Ue(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!_o.call(t,l)||!Ue(e[l],t[l]))return!1}return!0}function Ks(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Ys(e,t){var n=Ks(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Ks(n)}}function Uu(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Uu(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Au(){for(var e=window,t=el();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=el(e.document)}return t}function Ai(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function tp(e){var t=Au(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Uu(n.ownerDocument.documentElement,n)){if(r!==null&&Ai(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=Ys(n,o);var i=Ys(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var np=et&&"documentMode"in document&&11>=document.documentMode,Jt=null,Qo=null,Vn=null,Ko=!1;function Gs(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Ko||Jt==null||Jt!==el(r)||(r=Jt,"selectionStart"in r&&Ai(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Vn&&nr(Vn,r)||(Vn=r,r=sl(Qo,"onSelect"),0<r.length&&(t=new Mi("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Jt)))}function Lr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Zt={animationend:Lr("Animation","AnimationEnd"),animationiteration:Lr("Animation","AnimationIteration"),animationstart:Lr("Animation","AnimationStart"),transitionend:Lr("Transition","TransitionEnd")},oo={},Bu={};et&&(Bu=document.createElement("div").style,"AnimationEvent"in window||(delete Zt.animationend.animation,delete Zt.animationiteration.animation,delete Zt.animationstart.animation),"TransitionEvent"in window||delete Zt.transitionend.transition);function Ll(e){if(oo[e])return oo[e];if(!Zt[e])return e;var t=Zt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Bu)return oo[e]=t[n];return e}var Hu=Ll("animationend"),Wu=Ll("animationiteration"),Vu=Ll("animationstart"),Qu=Ll("transitionend"),Ku=new Map,Xs="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Nt(e,t){Ku.set(e,t),Wt(t,[e])}for(var io=0;io<Xs.length;io++){var so=Xs[io],rp=so.toLowerCase(),lp=so[0].toUpperCase()+so.slice(1);Nt(rp,"on"+lp)}Nt(Hu,"onAnimationEnd");Nt(Wu,"onAnimationIteration");Nt(Vu,"onAnimationStart");Nt("dblclick","onDoubleClick");Nt("focusin","onFocus");Nt("focusout","onBlur");Nt(Qu,"onTransitionEnd");fn("onMouseEnter",["mouseout","mouseover"]);fn("onMouseLeave",["mouseout","mouseover"]);fn("onPointerEnter",["pointerout","pointerover"]);fn("onPointerLeave",["pointerout","pointerover"]);Wt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Wt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Wt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Wt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Wt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Wt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Un="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),op=new Set("cancel close invalid load scroll toggle".split(" ").concat(Un));function Js(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,nf(r,t,void 0,e),e.currentTarget=null}function Yu(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var s=r[i],a=s.instance,u=s.currentTarget;if(s=s.listener,a!==o&&l.isPropagationStopped())break e;Js(l,s,u),o=a}else for(i=0;i<r.length;i++){if(s=r[i],a=s.instance,u=s.currentTarget,s=s.listener,a!==o&&l.isPropagationStopped())break e;Js(l,s,u),o=a}}}if(nl)throw e=Bo,nl=!1,Bo=null,e}function $(e,t){var n=t[Zo];n===void 0&&(n=t[Zo]=new Set);var r=e+"__bubble";n.has(r)||(Gu(t,e,2,!1),n.add(r))}function ao(e,t,n){var r=0;t&&(r|=4),Gu(n,e,r,t)}var Tr="_reactListening"+Math.random().toString(36).slice(2);function rr(e){if(!e[Tr]){e[Tr]=!0,tu.forEach(function(n){n!=="selectionchange"&&(op.has(n)||ao(n,!1,e),ao(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Tr]||(t[Tr]=!0,ao("selectionchange",!1,t))}}function Gu(e,t,n,r){switch(Tu(t)){case 1:var l=xf;break;case 4:l=wf;break;default:l=Fi}n=l.bind(null,t,n,e),l=void 0,!Ao||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function uo(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var s=r.stateNode.containerInfo;if(s===l||s.nodeType===8&&s.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var a=i.tag;if((a===3||a===4)&&(a=i.stateNode.containerInfo,a===l||a.nodeType===8&&a.parentNode===l))return;i=i.return}for(;s!==null;){if(i=Dt(s),i===null)return;if(a=i.tag,a===5||a===6){r=o=i;continue e}s=s.parentNode}}r=r.return}yu(function(){var u=o,h=Ti(n),p=[];e:{var v=Ku.get(e);if(v!==void 0){var w=Mi,S=e;switch(e){case"keypress":if(Vr(n)===0)break e;case"keydown":case"keyup":w=Ff;break;case"focusin":S="focus",w=no;break;case"focusout":S="blur",w=no;break;case"beforeblur":case"afterblur":w=no;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":w=$s;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":w=Ef;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":w=$f;break;case Hu:case Wu:case Vu:w=_f;break;case Qu:w=Af;break;case"scroll":w=Sf;break;case"wheel":w=Hf;break;case"copy":case"cut":case"paste":w=Rf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":w=As}var x=(t&4)!==0,E=!x&&e==="scroll",f=x?v!==null?v+"Capture":null:v;x=[];for(var c=u,m;c!==null;){m=c;var g=m.stateNode;if(m.tag===5&&g!==null&&(m=g,f!==null&&(g=Zn(c,f),g!=null&&x.push(lr(c,g,m)))),E)break;c=c.return}0<x.length&&(v=new w(v,S,null,n,h),p.push({event:v,listeners:x}))}}if(!(t&7)){e:{if(v=e==="mouseover"||e==="pointerover",w=e==="mouseout"||e==="pointerout",v&&n!==$o&&(S=n.relatedTarget||n.fromElement)&&(Dt(S)||S[tt]))break e;if((w||v)&&(v=h.window===h?h:(v=h.ownerDocument)?v.defaultView||v.parentWindow:window,w?(S=n.relatedTarget||n.toElement,w=u,S=S?Dt(S):null,S!==null&&(E=Vt(S),S!==E||S.tag!==5&&S.tag!==6)&&(S=null)):(w=null,S=u),w!==S)){if(x=$s,g="onMouseLeave",f="onMouseEnter",c="mouse",(e==="pointerout"||e==="pointerover")&&(x=As,g="onPointerLeave",f="onPointerEnter",c="pointer"),E=w==null?v:qt(w),m=S==null?v:qt(S),v=new x(g,c+"leave",w,n,h),v.target=E,v.relatedTarget=m,g=null,Dt(h)===u&&(x=new x(f,c+"enter",S,n,h),x.target=m,x.relatedTarget=E,g=x),E=g,w&&S)t:{for(x=w,f=S,c=0,m=x;m;m=Qt(m))c++;for(m=0,g=f;g;g=Qt(g))m++;for(;0<c-m;)x=Qt(x),c--;for(;0<m-c;)f=Qt(f),m--;for(;c--;){if(x===f||f!==null&&x===f.alternate)break t;x=Qt(x),f=Qt(f)}x=null}else x=null;w!==null&&Zs(p,v,w,x,!1),S!==null&&E!==null&&Zs(p,E,S,x,!0)}}e:{if(v=u?qt(u):window,w=v.nodeName&&v.nodeName.toLowerCase(),w==="select"||w==="input"&&v.type==="file")var k=Xf;else if(Ws(v))if(Mu)k=bf;else{k=Zf;var N=Jf}else(w=v.nodeName)&&w.toLowerCase()==="input"&&(v.type==="checkbox"||v.type==="radio")&&(k=qf);if(k&&(k=k(e,u))){Ou(p,k,n,h);break e}N&&N(e,v,u),e==="focusout"&&(N=v._wrapperState)&&N.controlled&&v.type==="number"&&Do(v,"number",v.value)}switch(N=u?qt(u):window,e){case"focusin":(Ws(N)||N.contentEditable==="true")&&(Jt=N,Qo=u,Vn=null);break;case"focusout":Vn=Qo=Jt=null;break;case"mousedown":Ko=!0;break;case"contextmenu":case"mouseup":case"dragend":Ko=!1,Gs(p,n,h);break;case"selectionchange":if(np)break;case"keydown":case"keyup":Gs(p,n,h)}var _;if(Ui)e:{switch(e){case"compositionstart":var R="onCompositionStart";break e;case"compositionend":R="onCompositionEnd";break e;case"compositionupdate":R="onCompositionUpdate";break e}R=void 0}else Xt?Iu(e,n)&&(R="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(R="onCompositionStart");R&&(Du&&n.locale!=="ko"&&(Xt||R!=="onCompositionStart"?R==="onCompositionEnd"&&Xt&&(_=zu()):(pt=h,Oi="value"in pt?pt.value:pt.textContent,Xt=!0)),N=sl(u,R),0<N.length&&(R=new Us(R,e,null,n,h),p.push({event:R,listeners:N}),_?R.data=_:(_=Fu(n),_!==null&&(R.data=_)))),(_=Vf?Qf(e,n):Kf(e,n))&&(u=sl(u,"onBeforeInput"),0<u.length&&(h=new Us("onBeforeInput","beforeinput",null,n,h),p.push({event:h,listeners:u}),h.data=_))}Yu(p,t)})}function lr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function sl(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Zn(e,n),o!=null&&r.unshift(lr(e,o,l)),o=Zn(e,t),o!=null&&r.push(lr(e,o,l))),e=e.return}return r}function Qt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Zs(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var s=n,a=s.alternate,u=s.stateNode;if(a!==null&&a===r)break;s.tag===5&&u!==null&&(s=u,l?(a=Zn(n,o),a!=null&&i.unshift(lr(n,a,s))):l||(a=Zn(n,o),a!=null&&i.push(lr(n,a,s)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var ip=/\r\n?/g,sp=/\u0000|\uFFFD/g;function qs(e){return(typeof e=="string"?e:""+e).replace(ip,`
-`).replace(sp,"")}function zr(e,t,n){if(t=qs(t),qs(e)!==t&&n)throw Error(C(425))}function al(){}var Yo=null,Go=null;function Xo(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Jo=typeof setTimeout=="function"?setTimeout:void 0,ap=typeof clearTimeout=="function"?clearTimeout:void 0,bs=typeof Promise=="function"?Promise:void 0,up=typeof queueMicrotask=="function"?queueMicrotask:typeof bs<"u"?function(e){return bs.resolve(null).then(e).catch(cp)}:Jo;function cp(e){setTimeout(function(){throw e})}function co(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),er(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);er(t)}function gt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function ea(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var Sn=Math.random().toString(36).slice(2),Ve="__reactFiber$"+Sn,or="__reactProps$"+Sn,tt="__reactContainer$"+Sn,Zo="__reactEvents$"+Sn,dp="__reactListeners$"+Sn,fp="__reactHandles$"+Sn;function Dt(e){var t=e[Ve];if(t)return t;for(var n=e.parentNode;n;){if(t=n[tt]||n[Ve]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=ea(e);e!==null;){if(n=e[Ve])return n;e=ea(e)}return t}e=n,n=e.parentNode}return null}function vr(e){return e=e[Ve]||e[tt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function qt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(C(33))}function Tl(e){return e[or]||null}var qo=[],bt=-1;function _t(e){return{current:e}}function U(e){0>bt||(e.current=qo[bt],qo[bt]=null,bt--)}function M(e,t){bt++,qo[bt]=e.current,e.current=t}var Ct={},se=_t(Ct),he=_t(!1),$t=Ct;function pn(e,t){var n=e.type.contextTypes;if(!n)return Ct;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function ve(e){return e=e.childContextTypes,e!=null}function ul(){U(he),U(se)}function ta(e,t,n){if(se.current!==Ct)throw Error(C(168));M(se,t),M(he,n)}function Xu(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(C(108,Xd(e)||"Unknown",l));return V({},n,r)}function cl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ct,$t=se.current,M(se,e),M(he,he.current),!0}function na(e,t,n){var r=e.stateNode;if(!r)throw Error(C(169));n?(e=Xu(e,t,$t),r.__reactInternalMemoizedMergedChildContext=e,U(he),U(se),M(se,e)):U(he),M(he,n)}var Je=null,zl=!1,fo=!1;function Ju(e){Je===null?Je=[e]:Je.push(e)}function pp(e){zl=!0,Ju(e)}function jt(){if(!fo&&Je!==null){fo=!0;var e=0,t=F;try{var n=Je;for(F=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}Je=null,zl=!1}catch(l){throw Je!==null&&(Je=Je.slice(e+1)),Su(zi,jt),l}finally{F=t,fo=!1}}return null}var en=[],tn=0,dl=null,fl=0,_e=[],je=0,Ut=null,Ze=1,qe="";function Tt(e,t){en[tn++]=fl,en[tn++]=dl,dl=e,fl=t}function Zu(e,t,n){_e[je++]=Ze,_e[je++]=qe,_e[je++]=Ut,Ut=e;var r=Ze;e=qe;var l=32-Me(r)-1;r&=~(1<<l),n+=1;var o=32-Me(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,Ze=1<<32-Me(t)+l|n<<l|r,qe=o+e}else Ze=1<<o|n<<l|r,qe=e}function Bi(e){e.return!==null&&(Tt(e,1),Zu(e,1,0))}function Hi(e){for(;e===dl;)dl=en[--tn],en[tn]=null,fl=en[--tn],en[tn]=null;for(;e===Ut;)Ut=_e[--je],_e[je]=null,qe=_e[--je],_e[je]=null,Ze=_e[--je],_e[je]=null}var Se=null,we=null,A=!1,Oe=null;function qu(e,t){var n=Re(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function ra(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Se=e,we=gt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Se=e,we=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Ut!==null?{id:Ze,overflow:qe}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Re(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Se=e,we=null,!0):!1;default:return!1}}function bo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function ei(e){if(A){var t=we;if(t){var n=t;if(!ra(e,t)){if(bo(e))throw Error(C(418));t=gt(n.nextSibling);var r=Se;t&&ra(e,t)?qu(r,n):(e.flags=e.flags&-4097|2,A=!1,Se=e)}}else{if(bo(e))throw Error(C(418));e.flags=e.flags&-4097|2,A=!1,Se=e}}}function la(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Se=e}function Dr(e){if(e!==Se)return!1;if(!A)return la(e),A=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Xo(e.type,e.memoizedProps)),t&&(t=we)){if(bo(e))throw bu(),Error(C(418));for(;t;)qu(e,t),t=gt(t.nextSibling)}if(la(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(C(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){we=gt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}we=null}}else we=Se?gt(e.stateNode.nextSibling):null;return!0}function bu(){for(var e=we;e;)e=gt(e.nextSibling)}function mn(){we=Se=null,A=!1}function Wi(e){Oe===null?Oe=[e]:Oe.push(e)}var mp=ot.ReactCurrentBatchConfig;function zn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(C(309));var r=n.stateNode}if(!r)throw Error(C(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var s=l.refs;i===null?delete s[o]:s[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(C(284));if(!n._owner)throw Error(C(290,e))}return e}function Ir(e,t){throw e=Object.prototype.toString.call(t),Error(C(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function oa(e){var t=e._init;return t(e._payload)}function ec(e){function t(f,c){if(e){var m=f.deletions;m===null?(f.deletions=[c],f.flags|=16):m.push(c)}}function n(f,c){if(!e)return null;for(;c!==null;)t(f,c),c=c.sibling;return null}function r(f,c){for(f=new Map;c!==null;)c.key!==null?f.set(c.key,c):f.set(c.index,c),c=c.sibling;return f}function l(f,c){return f=kt(f,c),f.index=0,f.sibling=null,f}function o(f,c,m){return f.index=m,e?(m=f.alternate,m!==null?(m=m.index,m<c?(f.flags|=2,c):m):(f.flags|=2,c)):(f.flags|=1048576,c)}function i(f){return e&&f.alternate===null&&(f.flags|=2),f}function s(f,c,m,g){return c===null||c.tag!==6?(c=xo(m,f.mode,g),c.return=f,c):(c=l(c,m),c.return=f,c)}function a(f,c,m,g){var k=m.type;return k===Gt?h(f,c,m.props.children,g,m.key):c!==null&&(c.elementType===k||typeof k=="object"&&k!==null&&k.$$typeof===ut&&oa(k)===c.type)?(g=l(c,m.props),g.ref=zn(f,c,m),g.return=f,g):(g=Zr(m.type,m.key,m.props,null,f.mode,g),g.ref=zn(f,c,m),g.return=f,g)}function u(f,c,m,g){return c===null||c.tag!==4||c.stateNode.containerInfo!==m.containerInfo||c.stateNode.implementation!==m.implementation?(c=wo(m,f.mode,g),c.return=f,c):(c=l(c,m.children||[]),c.return=f,c)}function h(f,c,m,g,k){return c===null||c.tag!==7?(c=Mt(m,f.mode,g,k),c.return=f,c):(c=l(c,m),c.return=f,c)}function p(f,c,m){if(typeof c=="string"&&c!==""||typeof c=="number")return c=xo(""+c,f.mode,m),c.return=f,c;if(typeof c=="object"&&c!==null){switch(c.$$typeof){case Er:return m=Zr(c.type,c.key,c.props,null,f.mode,m),m.ref=zn(f,null,c),m.return=f,m;case Yt:return c=wo(c,f.mode,m),c.return=f,c;case ut:var g=c._init;return p(f,g(c._payload),m)}if(Mn(c)||jn(c))return c=Mt(c,f.mode,m,null),c.return=f,c;Ir(f,c)}return null}function v(f,c,m,g){var k=c!==null?c.key:null;if(typeof m=="string"&&m!==""||typeof m=="number")return k!==null?null:s(f,c,""+m,g);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Er:return m.key===k?a(f,c,m,g):null;case Yt:return m.key===k?u(f,c,m,g):null;case ut:return k=m._init,v(f,c,k(m._payload),g)}if(Mn(m)||jn(m))return k!==null?null:h(f,c,m,g,null);Ir(f,m)}return null}function w(f,c,m,g,k){if(typeof g=="string"&&g!==""||typeof g=="number")return f=f.get(m)||null,s(c,f,""+g,k);if(typeof g=="object"&&g!==null){switch(g.$$typeof){case Er:return f=f.get(g.key===null?m:g.key)||null,a(c,f,g,k);case Yt:return f=f.get(g.key===null?m:g.key)||null,u(c,f,g,k);case ut:var N=g._init;return w(f,c,m,N(g._payload),k)}if(Mn(g)||jn(g))return f=f.get(m)||null,h(c,f,g,k,null);Ir(c,g)}return null}function S(f,c,m,g){for(var k=null,N=null,_=c,R=c=0,O=null;_!==null&&R<m.length;R++){_.index>R?(O=_,_=null):O=_.sibling;var T=v(f,_,m[R],g);if(T===null){_===null&&(_=O);break}e&&_&&T.alternate===null&&t(f,_),c=o(T,c,R),N===null?k=T:N.sibling=T,N=T,_=O}if(R===m.length)return n(f,_),A&&Tt(f,R),k;if(_===null){for(;R<m.length;R++)_=p(f,m[R],g),_!==null&&(c=o(_,c,R),N===null?k=_:N.sibling=_,N=_);return A&&Tt(f,R),k}for(_=r(f,_);R<m.length;R++)O=w(_,f,R,m[R],g),O!==null&&(e&&O.alternate!==null&&_.delete(O.key===null?R:O.key),c=o(O,c,R),N===null?k=O:N.sibling=O,N=O);return e&&_.forEach(function(ge){return t(f,ge)}),A&&Tt(f,R),k}function x(f,c,m,g){var k=jn(m);if(typeof k!="function")throw Error(C(150));if(m=k.call(m),m==null)throw Error(C(151));for(var N=k=null,_=c,R=c=0,O=null,T=m.next();_!==null&&!T.done;R++,T=m.next()){_.index>R?(O=_,_=null):O=_.sibling;var ge=v(f,_,T.value,g);if(ge===null){_===null&&(_=O);break}e&&_&&ge.alternate===null&&t(f,_),c=o(ge,c,R),N===null?k=ge:N.sibling=ge,N=ge,_=O}if(T.done)return n(f,_),A&&Tt(f,R),k;if(_===null){for(;!T.done;R++,T=m.next())T=p(f,T.value,g),T!==null&&(c=o(T,c,R),N===null?k=T:N.sibling=T,N=T);return A&&Tt(f,R),k}for(_=r(f,_);!T.done;R++,T=m.next())T=w(_,f,R,T.value,g),T!==null&&(e&&T.alternate!==null&&_.delete(T.key===null?R:T.key),c=o(T,c,R),N===null?k=T:N.sibling=T,N=T);return e&&_.forEach(function(Rt){return t(f,Rt)}),A&&Tt(f,R),k}function E(f,c,m,g){if(typeof m=="object"&&m!==null&&m.type===Gt&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Er:e:{for(var k=m.key,N=c;N!==null;){if(N.key===k){if(k=m.type,k===Gt){if(N.tag===7){n(f,N.sibling),c=l(N,m.props.children),c.return=f,f=c;break e}}else if(N.elementType===k||typeof k=="object"&&k!==null&&k.$$typeof===ut&&oa(k)===N.type){n(f,N.sibling),c=l(N,m.props),c.ref=zn(f,N,m),c.return=f,f=c;break e}n(f,N);break}else t(f,N);N=N.sibling}m.type===Gt?(c=Mt(m.props.children,f.mode,g,m.key),c.return=f,f=c):(g=Zr(m.type,m.key,m.props,null,f.mode,g),g.ref=zn(f,c,m),g.return=f,f=g)}return i(f);case Yt:e:{for(N=m.key;c!==null;){if(c.key===N)if(c.tag===4&&c.stateNode.containerInfo===m.containerInfo&&c.stateNode.implementation===m.implementation){n(f,c.sibling),c=l(c,m.children||[]),c.return=f,f=c;break e}else{n(f,c);break}else t(f,c);c=c.sibling}c=wo(m,f.mode,g),c.return=f,f=c}return i(f);case ut:return N=m._init,E(f,c,N(m._payload),g)}if(Mn(m))return S(f,c,m,g);if(jn(m))return x(f,c,m,g);Ir(f,m)}return typeof m=="string"&&m!==""||typeof m=="number"?(m=""+m,c!==null&&c.tag===6?(n(f,c.sibling),c=l(c,m),c.return=f,f=c):(n(f,c),c=xo(m,f.mode,g),c.return=f,f=c),i(f)):n(f,c)}return E}var hn=ec(!0),tc=ec(!1),pl=_t(null),ml=null,nn=null,Vi=null;function Qi(){Vi=nn=ml=null}function Ki(e){var t=pl.current;U(pl),e._currentValue=t}function ti(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function cn(e,t){ml=e,Vi=nn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(me=!0),e.firstContext=null)}function Le(e){var t=e._currentValue;if(Vi!==e)if(e={context:e,memoizedValue:t,next:null},nn===null){if(ml===null)throw Error(C(308));nn=e,ml.dependencies={lanes:0,firstContext:e}}else nn=nn.next=e;return t}var It=null;function Yi(e){It===null?It=[e]:It.push(e)}function nc(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Yi(t)):(n.next=l.next,l.next=n),t.interleaved=n,nt(e,r)}function nt(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var ct=!1;function Gi(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function rc(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function be(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function xt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,I&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,nt(e,n)}return l=r.interleaved,l===null?(t.next=t,Yi(r)):(t.next=l.next,l.next=t),r.interleaved=t,nt(e,n)}function Qr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Di(e,n)}}function ia(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function hl(e,t,n,r){var l=e.updateQueue;ct=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,s=l.shared.pending;if(s!==null){l.shared.pending=null;var a=s,u=a.next;a.next=null,i===null?o=u:i.next=u,i=a;var h=e.alternate;h!==null&&(h=h.updateQueue,s=h.lastBaseUpdate,s!==i&&(s===null?h.firstBaseUpdate=u:s.next=u,h.lastBaseUpdate=a))}if(o!==null){var p=l.baseState;i=0,h=u=a=null,s=o;do{var v=s.lane,w=s.eventTime;if((r&v)===v){h!==null&&(h=h.next={eventTime:w,lane:0,tag:s.tag,payload:s.payload,callback:s.callback,next:null});e:{var S=e,x=s;switch(v=t,w=n,x.tag){case 1:if(S=x.payload,typeof S=="function"){p=S.call(w,p,v);break e}p=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=x.payload,v=typeof S=="function"?S.call(w,p,v):S,v==null)break e;p=V({},p,v);break e;case 2:ct=!0}}s.callback!==null&&s.lane!==0&&(e.flags|=64,v=l.effects,v===null?l.effects=[s]:v.push(s))}else w={eventTime:w,lane:v,tag:s.tag,payload:s.payload,callback:s.callback,next:null},h===null?(u=h=w,a=p):h=h.next=w,i|=v;if(s=s.next,s===null){if(s=l.shared.pending,s===null)break;v=s,s=v.next,v.next=null,l.lastBaseUpdate=v,l.shared.pending=null}}while(!0);if(h===null&&(a=p),l.baseState=a,l.firstBaseUpdate=u,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Bt|=i,e.lanes=i,e.memoizedState=p}}function sa(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(C(191,l));l.call(r)}}}var yr={},Ke=_t(yr),ir=_t(yr),sr=_t(yr);function Ft(e){if(e===yr)throw Error(C(174));return e}function Xi(e,t){switch(M(sr,t),M(ir,e),M(Ke,yr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Fo(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=Fo(t,e)}U(Ke),M(Ke,t)}function vn(){U(Ke),U(ir),U(sr)}function lc(e){Ft(sr.current);var t=Ft(Ke.current),n=Fo(t,e.type);t!==n&&(M(ir,e),M(Ke,n))}function Ji(e){ir.current===e&&(U(Ke),U(ir))}var H=_t(0);function vl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var po=[];function Zi(){for(var e=0;e<po.length;e++)po[e]._workInProgressVersionPrimary=null;po.length=0}var Kr=ot.ReactCurrentDispatcher,mo=ot.ReactCurrentBatchConfig,At=0,W=null,X=null,q=null,yl=!1,Qn=!1,ar=0,hp=0;function le(){throw Error(C(321))}function qi(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ue(e[n],t[n]))return!1;return!0}function bi(e,t,n,r,l,o){if(At=o,W=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Kr.current=e===null||e.memoizedState===null?xp:wp,e=n(r,l),Qn){o=0;do{if(Qn=!1,ar=0,25<=o)throw Error(C(301));o+=1,q=X=null,t.updateQueue=null,Kr.current=Sp,e=n(r,l)}while(Qn)}if(Kr.current=gl,t=X!==null&&X.next!==null,At=0,q=X=W=null,yl=!1,t)throw Error(C(300));return e}function es(){var e=ar!==0;return ar=0,e}function We(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return q===null?W.memoizedState=q=e:q=q.next=e,q}function Te(){if(X===null){var e=W.alternate;e=e!==null?e.memoizedState:null}else e=X.next;var t=q===null?W.memoizedState:q.next;if(t!==null)q=t,X=e;else{if(e===null)throw Error(C(310));X=e,e={memoizedState:X.memoizedState,baseState:X.baseState,baseQueue:X.baseQueue,queue:X.queue,next:null},q===null?W.memoizedState=q=e:q=q.next=e}return q}function ur(e,t){return typeof t=="function"?t(e):t}function ho(e){var t=Te(),n=t.queue;if(n===null)throw Error(C(311));n.lastRenderedReducer=e;var r=X,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var s=i=null,a=null,u=o;do{var h=u.lane;if((At&h)===h)a!==null&&(a=a.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var p={lane:h,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};a===null?(s=a=p,i=r):a=a.next=p,W.lanes|=h,Bt|=h}u=u.next}while(u!==null&&u!==o);a===null?i=r:a.next=s,Ue(r,t.memoizedState)||(me=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=a,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,W.lanes|=o,Bt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function vo(e){var t=Te(),n=t.queue;if(n===null)throw Error(C(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);Ue(o,t.memoizedState)||(me=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function oc(){}function ic(e,t){var n=W,r=Te(),l=t(),o=!Ue(r.memoizedState,l);if(o&&(r.memoizedState=l,me=!0),r=r.queue,ts(uc.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||q!==null&&q.memoizedState.tag&1){if(n.flags|=2048,cr(9,ac.bind(null,n,r,l,t),void 0,null),b===null)throw Error(C(349));At&30||sc(n,t,l)}return l}function sc(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=W.updateQueue,t===null?(t={lastEffect:null,stores:null},W.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function ac(e,t,n,r){t.value=n,t.getSnapshot=r,cc(t)&&dc(e)}function uc(e,t,n){return n(function(){cc(t)&&dc(e)})}function cc(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ue(e,n)}catch{return!0}}function dc(e){var t=nt(e,1);t!==null&&$e(t,e,1,-1)}function aa(e){var t=We();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:ur,lastRenderedState:e},t.queue=e,e=e.dispatch=gp.bind(null,W,e),[t.memoizedState,e]}function cr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=W.updateQueue,t===null?(t={lastEffect:null,stores:null},W.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function fc(){return Te().memoizedState}function Yr(e,t,n,r){var l=We();W.flags|=e,l.memoizedState=cr(1|t,n,void 0,r===void 0?null:r)}function Dl(e,t,n,r){var l=Te();r=r===void 0?null:r;var o=void 0;if(X!==null){var i=X.memoizedState;if(o=i.destroy,r!==null&&qi(r,i.deps)){l.memoizedState=cr(t,n,o,r);return}}W.flags|=e,l.memoizedState=cr(1|t,n,o,r)}function ua(e,t){return Yr(8390656,8,e,t)}function ts(e,t){return Dl(2048,8,e,t)}function pc(e,t){return Dl(4,2,e,t)}function mc(e,t){return Dl(4,4,e,t)}function hc(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function vc(e,t,n){return n=n!=null?n.concat([e]):null,Dl(4,4,hc.bind(null,t,e),n)}function ns(){}function yc(e,t){var n=Te();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&qi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function gc(e,t){var n=Te();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&qi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function xc(e,t,n){return At&21?(Ue(n,t)||(n=Cu(),W.lanes|=n,Bt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,me=!0),e.memoizedState=n)}function vp(e,t){var n=F;F=n!==0&&4>n?n:4,e(!0);var r=mo.transition;mo.transition={};try{e(!1),t()}finally{F=n,mo.transition=r}}function wc(){return Te().memoizedState}function yp(e,t,n){var r=St(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Sc(e))kc(t,n);else if(n=nc(e,t,n,r),n!==null){var l=ue();$e(n,e,r,l),Ec(n,t,r)}}function gp(e,t,n){var r=St(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Sc(e))kc(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,s=o(i,n);if(l.hasEagerState=!0,l.eagerState=s,Ue(s,i)){var a=t.interleaved;a===null?(l.next=l,Yi(t)):(l.next=a.next,a.next=l),t.interleaved=l;return}}catch{}finally{}n=nc(e,t,l,r),n!==null&&(l=ue(),$e(n,e,r,l),Ec(n,t,r))}}function Sc(e){var t=e.alternate;return e===W||t!==null&&t===W}function kc(e,t){Qn=yl=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ec(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Di(e,n)}}var gl={readContext:Le,useCallback:le,useContext:le,useEffect:le,useImperativeHandle:le,useInsertionEffect:le,useLayoutEffect:le,useMemo:le,useReducer:le,useRef:le,useState:le,useDebugValue:le,useDeferredValue:le,useTransition:le,useMutableSource:le,useSyncExternalStore:le,useId:le,unstable_isNewReconciler:!1},xp={readContext:Le,useCallback:function(e,t){return We().memoizedState=[e,t===void 0?null:t],e},useContext:Le,useEffect:ua,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Yr(4194308,4,hc.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Yr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Yr(4,2,e,t)},useMemo:function(e,t){var n=We();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=We();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=yp.bind(null,W,e),[r.memoizedState,e]},useRef:function(e){var t=We();return e={current:e},t.memoizedState=e},useState:aa,useDebugValue:ns,useDeferredValue:function(e){return We().memoizedState=e},useTransition:function(){var e=aa(!1),t=e[0];return e=vp.bind(null,e[1]),We().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=W,l=We();if(A){if(n===void 0)throw Error(C(407));n=n()}else{if(n=t(),b===null)throw Error(C(349));At&30||sc(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,ua(uc.bind(null,r,o,e),[e]),r.flags|=2048,cr(9,ac.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=We(),t=b.identifierPrefix;if(A){var n=qe,r=Ze;n=(r&~(1<<32-Me(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ar++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=hp++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},wp={readContext:Le,useCallback:yc,useContext:Le,useEffect:ts,useImperativeHandle:vc,useInsertionEffect:pc,useLayoutEffect:mc,useMemo:gc,useReducer:ho,useRef:fc,useState:function(){return ho(ur)},useDebugValue:ns,useDeferredValue:function(e){var t=Te();return xc(t,X.memoizedState,e)},useTransition:function(){var e=ho(ur)[0],t=Te().memoizedState;return[e,t]},useMutableSource:oc,useSyncExternalStore:ic,useId:wc,unstable_isNewReconciler:!1},Sp={readContext:Le,useCallback:yc,useContext:Le,useEffect:ts,useImperativeHandle:vc,useInsertionEffect:pc,useLayoutEffect:mc,useMemo:gc,useReducer:vo,useRef:fc,useState:function(){return vo(ur)},useDebugValue:ns,useDeferredValue:function(e){var t=Te();return X===null?t.memoizedState=e:xc(t,X.memoizedState,e)},useTransition:function(){var e=vo(ur)[0],t=Te().memoizedState;return[e,t]},useMutableSource:oc,useSyncExternalStore:ic,useId:wc,unstable_isNewReconciler:!1};function Ie(e,t){if(e&&e.defaultProps){t=V({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function ni(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:V({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Il={isMounted:function(e){return(e=e._reactInternals)?Vt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=ue(),l=St(e),o=be(r,l);o.payload=t,n!=null&&(o.callback=n),t=xt(e,o,l),t!==null&&($e(t,e,l,r),Qr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=ue(),l=St(e),o=be(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=xt(e,o,l),t!==null&&($e(t,e,l,r),Qr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=ue(),r=St(e),l=be(n,r);l.tag=2,t!=null&&(l.callback=t),t=xt(e,l,r),t!==null&&($e(t,e,r,n),Qr(t,e,r))}};function ca(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!nr(n,r)||!nr(l,o):!0}function Cc(e,t,n){var r=!1,l=Ct,o=t.contextType;return typeof o=="object"&&o!==null?o=Le(o):(l=ve(t)?$t:se.current,r=t.contextTypes,o=(r=r!=null)?pn(e,l):Ct),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Il,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function da(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Il.enqueueReplaceState(t,t.state,null)}function ri(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Gi(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Le(o):(o=ve(t)?$t:se.current,l.context=pn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(ni(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&Il.enqueueReplaceState(l,l.state,null),hl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function yn(e,t){try{var n="",r=t;do n+=Gd(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function yo(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function li(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var kp=typeof WeakMap=="function"?WeakMap:Map;function Nc(e,t,n){n=be(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){wl||(wl=!0,mi=r),li(e,t)},n}function _c(e,t,n){n=be(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){li(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){li(e,t),typeof r!="function"&&(wt===null?wt=new Set([this]):wt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function fa(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new kp;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Op.bind(null,e,t,n),t.then(e,e))}function pa(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function ma(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=be(-1,1),t.tag=2,xt(n,t,1))),n.lanes|=1),e)}var Ep=ot.ReactCurrentOwner,me=!1;function ae(e,t,n,r){t.child=e===null?tc(t,null,n,r):hn(t,e.child,n,r)}function ha(e,t,n,r,l){n=n.render;var o=t.ref;return cn(t,l),r=bi(e,t,n,r,o,l),n=es(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,rt(e,t,l)):(A&&n&&Bi(t),t.flags|=1,ae(e,t,r,l),t.child)}function va(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!cs(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,jc(e,t,o,r,l)):(e=Zr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:nr,n(i,r)&&e.ref===t.ref)return rt(e,t,l)}return t.flags|=1,e=kt(o,r),e.ref=t.ref,e.return=t,t.child=e}function jc(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(nr(o,r)&&e.ref===t.ref)if(me=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(me=!0);else return t.lanes=e.lanes,rt(e,t,l)}return oi(e,t,n,r,l)}function Rc(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},M(ln,xe),xe|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,M(ln,xe),xe|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,M(ln,xe),xe|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,M(ln,xe),xe|=r;return ae(e,t,l,n),t.child}function Pc(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function oi(e,t,n,r,l){var o=ve(n)?$t:se.current;return o=pn(t,o),cn(t,l),n=bi(e,t,n,r,o,l),r=es(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,rt(e,t,l)):(A&&r&&Bi(t),t.flags|=1,ae(e,t,n,l),t.child)}function ya(e,t,n,r,l){if(ve(n)){var o=!0;cl(t)}else o=!1;if(cn(t,l),t.stateNode===null)Gr(e,t),Cc(t,n,r),ri(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,s=t.memoizedProps;i.props=s;var a=i.context,u=n.contextType;typeof u=="object"&&u!==null?u=Le(u):(u=ve(n)?$t:se.current,u=pn(t,u));var h=n.getDerivedStateFromProps,p=typeof h=="function"||typeof i.getSnapshotBeforeUpdate=="function";p||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(s!==r||a!==u)&&da(t,i,r,u),ct=!1;var v=t.memoizedState;i.state=v,hl(t,r,i,l),a=t.memoizedState,s!==r||v!==a||he.current||ct?(typeof h=="function"&&(ni(t,n,h,r),a=t.memoizedState),(s=ct||ca(t,n,s,r,v,a,u))?(p||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=a),i.props=r,i.state=a,i.context=u,r=s):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,rc(e,t),s=t.memoizedProps,u=t.type===t.elementType?s:Ie(t.type,s),i.props=u,p=t.pendingProps,v=i.context,a=n.contextType,typeof a=="object"&&a!==null?a=Le(a):(a=ve(n)?$t:se.current,a=pn(t,a));var w=n.getDerivedStateFromProps;(h=typeof w=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(s!==p||v!==a)&&da(t,i,r,a),ct=!1,v=t.memoizedState,i.state=v,hl(t,r,i,l);var S=t.memoizedState;s!==p||v!==S||he.current||ct?(typeof w=="function"&&(ni(t,n,w,r),S=t.memoizedState),(u=ct||ca(t,n,u,r,v,S,a)||!1)?(h||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,S,a),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,S,a)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),i.props=r,i.state=S,i.context=a,r=u):(typeof i.componentDidUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=1024),r=!1)}return ii(e,t,n,r,o,l)}function ii(e,t,n,r,l,o){Pc(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&na(t,n,!1),rt(e,t,o);r=t.stateNode,Ep.current=t;var s=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=hn(t,e.child,null,o),t.child=hn(t,null,s,o)):ae(e,t,s,o),t.memoizedState=r.state,l&&na(t,n,!0),t.child}function Lc(e){var t=e.stateNode;t.pendingContext?ta(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ta(e,t.context,!1),Xi(e,t.containerInfo)}function ga(e,t,n,r,l){return mn(),Wi(l),t.flags|=256,ae(e,t,n,r),t.child}var si={dehydrated:null,treeContext:null,retryLane:0};function ai(e){return{baseLanes:e,cachePool:null,transitions:null}}function Tc(e,t,n){var r=t.pendingProps,l=H.current,o=!1,i=(t.flags&128)!==0,s;if((s=i)||(s=e!==null&&e.memoizedState===null?!1:(l&2)!==0),s?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),M(H,l&1),e===null)return ei(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=Ml(i,r,0,null),e=Mt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=ai(n),t.memoizedState=si,e):rs(t,i));if(l=e.memoizedState,l!==null&&(s=l.dehydrated,s!==null))return Cp(e,t,i,r,s,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,s=l.sibling;var a={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=a,t.deletions=null):(r=kt(l,a),r.subtreeFlags=l.subtreeFlags&14680064),s!==null?o=kt(s,o):(o=Mt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?ai(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=si,r}return o=e.child,e=o.sibling,r=kt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function rs(e,t){return t=Ml({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Fr(e,t,n,r){return r!==null&&Wi(r),hn(t,e.child,null,n),e=rs(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Cp(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=yo(Error(C(422))),Fr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=Ml({mode:"visible",children:r.children},l,0,null),o=Mt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&hn(t,e.child,null,i),t.child.memoizedState=ai(i),t.memoizedState=si,o);if(!(t.mode&1))return Fr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var s=r.dgst;return r=s,o=Error(C(419)),r=yo(o,r,void 0),Fr(e,t,i,r)}if(s=(i&e.childLanes)!==0,me||s){if(r=b,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,nt(e,l),$e(r,e,l,-1))}return us(),r=yo(Error(C(421))),Fr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Mp.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,we=gt(l.nextSibling),Se=t,A=!0,Oe=null,e!==null&&(_e[je++]=Ze,_e[je++]=qe,_e[je++]=Ut,Ze=e.id,qe=e.overflow,Ut=t),t=rs(t,r.children),t.flags|=4096,t)}function xa(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),ti(e.return,t,n)}function go(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function zc(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(ae(e,t,r.children,n),r=H.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&xa(e,n,t);else if(e.tag===19)xa(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(M(H,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&vl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),go(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&vl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}go(t,!0,n,null,o);break;case"together":go(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Gr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function rt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Bt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(C(153));if(t.child!==null){for(e=t.child,n=kt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=kt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Np(e,t,n){switch(t.tag){case 3:Lc(t),mn();break;case 5:lc(t);break;case 1:ve(t.type)&&cl(t);break;case 4:Xi(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;M(pl,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(M(H,H.current&1),t.flags|=128,null):n&t.child.childLanes?Tc(e,t,n):(M(H,H.current&1),e=rt(e,t,n),e!==null?e.sibling:null);M(H,H.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return zc(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),M(H,H.current),r)break;return null;case 22:case 23:return t.lanes=0,Rc(e,t,n)}return rt(e,t,n)}var Dc,ui,Ic,Fc;Dc=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};ui=function(){};Ic=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Ft(Ke.current);var o=null;switch(n){case"input":l=To(e,l),r=To(e,r),o=[];break;case"select":l=V({},l,{value:void 0}),r=V({},r,{value:void 0}),o=[];break;case"textarea":l=Io(e,l),r=Io(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=al)}Oo(n,r);var i;n=null;for(u in l)if(!r.hasOwnProperty(u)&&l.hasOwnProperty(u)&&l[u]!=null)if(u==="style"){var s=l[u];for(i in s)s.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else u!=="dangerouslySetInnerHTML"&&u!=="children"&&u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(Xn.hasOwnProperty(u)?o||(o=[]):(o=o||[]).push(u,null));for(u in r){var a=r[u];if(s=l!=null?l[u]:void 0,r.hasOwnProperty(u)&&a!==s&&(a!=null||s!=null))if(u==="style")if(s){for(i in s)!s.hasOwnProperty(i)||a&&a.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in a)a.hasOwnProperty(i)&&s[i]!==a[i]&&(n||(n={}),n[i]=a[i])}else n||(o||(o=[]),o.push(u,n)),n=a;else u==="dangerouslySetInnerHTML"?(a=a?a.__html:void 0,s=s?s.__html:void 0,a!=null&&s!==a&&(o=o||[]).push(u,a)):u==="children"?typeof a!="string"&&typeof a!="number"||(o=o||[]).push(u,""+a):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&(Xn.hasOwnProperty(u)?(a!=null&&u==="onScroll"&&$("scroll",e),o||s===a||(o=[])):(o=o||[]).push(u,a))}n&&(o=o||[]).push("style",n);var u=o;(t.updateQueue=u)&&(t.flags|=4)}};Fc=function(e,t,n,r){n!==r&&(t.flags|=4)};function Dn(e,t){if(!A)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function oe(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function _p(e,t,n){var r=t.pendingProps;switch(Hi(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return oe(t),null;case 1:return ve(t.type)&&ul(),oe(t),null;case 3:return r=t.stateNode,vn(),U(he),U(se),Zi(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Dr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Oe!==null&&(yi(Oe),Oe=null))),ui(e,t),oe(t),null;case 5:Ji(t);var l=Ft(sr.current);if(n=t.type,e!==null&&t.stateNode!=null)Ic(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(C(166));return oe(t),null}if(e=Ft(Ke.current),Dr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Ve]=t,r[or]=o,e=(t.mode&1)!==0,n){case"dialog":$("cancel",r),$("close",r);break;case"iframe":case"object":case"embed":$("load",r);break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],r);break;case"source":$("error",r);break;case"img":case"image":case"link":$("error",r),$("load",r);break;case"details":$("toggle",r);break;case"input":Rs(r,o),$("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},$("invalid",r);break;case"textarea":Ls(r,o),$("invalid",r)}Oo(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var s=o[i];i==="children"?typeof s=="string"?r.textContent!==s&&(o.suppressHydrationWarning!==!0&&zr(r.textContent,s,e),l=["children",s]):typeof s=="number"&&r.textContent!==""+s&&(o.suppressHydrationWarning!==!0&&zr(r.textContent,s,e),l=["children",""+s]):Xn.hasOwnProperty(i)&&s!=null&&i==="onScroll"&&$("scroll",r)}switch(n){case"input":Cr(r),Ps(r,o,!0);break;case"textarea":Cr(r),Ts(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=al)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=uu(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[Ve]=t,e[or]=r,Dc(e,t,!1,!1),t.stateNode=e;e:{switch(i=Mo(n,r),n){case"dialog":$("cancel",e),$("close",e),l=r;break;case"iframe":case"object":case"embed":$("load",e),l=r;break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],e);l=r;break;case"source":$("error",e),l=r;break;case"img":case"image":case"link":$("error",e),$("load",e),l=r;break;case"details":$("toggle",e),l=r;break;case"input":Rs(e,r),l=To(e,r),$("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=V({},r,{value:void 0}),$("invalid",e);break;case"textarea":Ls(e,r),l=Io(e,r),$("invalid",e);break;default:l=r}Oo(n,l),s=l;for(o in s)if(s.hasOwnProperty(o)){var a=s[o];o==="style"?fu(e,a):o==="dangerouslySetInnerHTML"?(a=a?a.__html:void 0,a!=null&&cu(e,a)):o==="children"?typeof a=="string"?(n!=="textarea"||a!=="")&&Jn(e,a):typeof a=="number"&&Jn(e,""+a):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Xn.hasOwnProperty(o)?a!=null&&o==="onScroll"&&$("scroll",e):a!=null&&ji(e,o,a,i))}switch(n){case"input":Cr(e),Ps(e,r,!1);break;case"textarea":Cr(e),Ts(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Et(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?on(e,!!r.multiple,o,!1):r.defaultValue!=null&&on(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=al)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return oe(t),null;case 6:if(e&&t.stateNode!=null)Fc(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(C(166));if(n=Ft(sr.current),Ft(Ke.current),Dr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ve]=t,(o=r.nodeValue!==n)&&(e=Se,e!==null))switch(e.tag){case 3:zr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&zr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ve]=t,t.stateNode=r}return oe(t),null;case 13:if(U(H),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(A&&we!==null&&t.mode&1&&!(t.flags&128))bu(),mn(),t.flags|=98560,o=!1;else if(o=Dr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(C(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(C(317));o[Ve]=t}else mn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;oe(t),o=!1}else Oe!==null&&(yi(Oe),Oe=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||H.current&1?J===0&&(J=3):us())),t.updateQueue!==null&&(t.flags|=4),oe(t),null);case 4:return vn(),ui(e,t),e===null&&rr(t.stateNode.containerInfo),oe(t),null;case 10:return Ki(t.type._context),oe(t),null;case 17:return ve(t.type)&&ul(),oe(t),null;case 19:if(U(H),o=t.memoizedState,o===null)return oe(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)Dn(o,!1);else{if(J!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=vl(e),i!==null){for(t.flags|=128,Dn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return M(H,H.current&1|2),t.child}e=e.sibling}o.tail!==null&&Y()>gn&&(t.flags|=128,r=!0,Dn(o,!1),t.lanes=4194304)}else{if(!r)if(e=vl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Dn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!A)return oe(t),null}else 2*Y()-o.renderingStartTime>gn&&n!==1073741824&&(t.flags|=128,r=!0,Dn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=Y(),t.sibling=null,n=H.current,M(H,r?n&1|2:n&1),t):(oe(t),null);case 22:case 23:return as(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?xe&1073741824&&(oe(t),t.subtreeFlags&6&&(t.flags|=8192)):oe(t),null;case 24:return null;case 25:return null}throw Error(C(156,t.tag))}function jp(e,t){switch(Hi(t),t.tag){case 1:return ve(t.type)&&ul(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return vn(),U(he),U(se),Zi(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ji(t),null;case 13:if(U(H),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(C(340));mn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(H),null;case 4:return vn(),null;case 10:return Ki(t.type._context),null;case 22:case 23:return as(),null;case 24:return null;default:return null}}var Or=!1,ie=!1,Rp=typeof WeakSet=="function"?WeakSet:Set,j=null;function rn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Q(e,t,r)}else n.current=null}function ci(e,t,n){try{n()}catch(r){Q(e,t,r)}}var wa=!1;function Pp(e,t){if(Yo=ol,e=Au(),Ai(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,s=-1,a=-1,u=0,h=0,p=e,v=null;t:for(;;){for(var w;p!==n||l!==0&&p.nodeType!==3||(s=i+l),p!==o||r!==0&&p.nodeType!==3||(a=i+r),p.nodeType===3&&(i+=p.nodeValue.length),(w=p.firstChild)!==null;)v=p,p=w;for(;;){if(p===e)break t;if(v===n&&++u===l&&(s=i),v===o&&++h===r&&(a=i),(w=p.nextSibling)!==null)break;p=v,v=p.parentNode}p=w}n=s===-1||a===-1?null:{start:s,end:a}}else n=null}n=n||{start:0,end:0}}else n=null;for(Go={focusedElem:e,selectionRange:n},ol=!1,j=t;j!==null;)if(t=j,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,j=e;else for(;j!==null;){t=j;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var x=S.memoizedProps,E=S.memoizedState,f=t.stateNode,c=f.getSnapshotBeforeUpdate(t.elementType===t.type?x:Ie(t.type,x),E);f.__reactInternalSnapshotBeforeUpdate=c}break;case 3:var m=t.stateNode.containerInfo;m.nodeType===1?m.textContent="":m.nodeType===9&&m.documentElement&&m.removeChild(m.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(C(163))}}catch(g){Q(t,t.return,g)}if(e=t.sibling,e!==null){e.return=t.return,j=e;break}j=t.return}return S=wa,wa=!1,S}function Kn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&ci(t,n,o)}l=l.next}while(l!==r)}}function Fl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function di(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Oc(e){var t=e.alternate;t!==null&&(e.alternate=null,Oc(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ve],delete t[or],delete t[Zo],delete t[dp],delete t[fp])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Mc(e){return e.tag===5||e.tag===3||e.tag===4}function Sa(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Mc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function fi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=al));else if(r!==4&&(e=e.child,e!==null))for(fi(e,t,n),e=e.sibling;e!==null;)fi(e,t,n),e=e.sibling}function pi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(pi(e,t,n),e=e.sibling;e!==null;)pi(e,t,n),e=e.sibling}var ee=null,Fe=!1;function at(e,t,n){for(n=n.child;n!==null;)$c(e,t,n),n=n.sibling}function $c(e,t,n){if(Qe&&typeof Qe.onCommitFiberUnmount=="function")try{Qe.onCommitFiberUnmount(jl,n)}catch{}switch(n.tag){case 5:ie||rn(n,t);case 6:var r=ee,l=Fe;ee=null,at(e,t,n),ee=r,Fe=l,ee!==null&&(Fe?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(Fe?(e=ee,n=n.stateNode,e.nodeType===8?co(e.parentNode,n):e.nodeType===1&&co(e,n),er(e)):co(ee,n.stateNode));break;case 4:r=ee,l=Fe,ee=n.stateNode.containerInfo,Fe=!0,at(e,t,n),ee=r,Fe=l;break;case 0:case 11:case 14:case 15:if(!ie&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&ci(n,t,i),l=l.next}while(l!==r)}at(e,t,n);break;case 1:if(!ie&&(rn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){Q(n,t,s)}at(e,t,n);break;case 21:at(e,t,n);break;case 22:n.mode&1?(ie=(r=ie)||n.memoizedState!==null,at(e,t,n),ie=r):at(e,t,n);break;default:at(e,t,n)}}function ka(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Rp),t.forEach(function(r){var l=$p.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function ze(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,s=i;e:for(;s!==null;){switch(s.tag){case 5:ee=s.stateNode,Fe=!1;break e;case 3:ee=s.stateNode.containerInfo,Fe=!0;break e;case 4:ee=s.stateNode.containerInfo,Fe=!0;break e}s=s.return}if(ee===null)throw Error(C(160));$c(o,i,l),ee=null,Fe=!1;var a=l.alternate;a!==null&&(a.return=null),l.return=null}catch(u){Q(l,t,u)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Uc(t,e),t=t.sibling}function Uc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(ze(t,e),He(e),r&4){try{Kn(3,e,e.return),Fl(3,e)}catch(x){Q(e,e.return,x)}try{Kn(5,e,e.return)}catch(x){Q(e,e.return,x)}}break;case 1:ze(t,e),He(e),r&512&&n!==null&&rn(n,n.return);break;case 5:if(ze(t,e),He(e),r&512&&n!==null&&rn(n,n.return),e.flags&32){var l=e.stateNode;try{Jn(l,"")}catch(x){Q(e,e.return,x)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,s=e.type,a=e.updateQueue;if(e.updateQueue=null,a!==null)try{s==="input"&&o.type==="radio"&&o.name!=null&&su(l,o),Mo(s,i);var u=Mo(s,o);for(i=0;i<a.length;i+=2){var h=a[i],p=a[i+1];h==="style"?fu(l,p):h==="dangerouslySetInnerHTML"?cu(l,p):h==="children"?Jn(l,p):ji(l,h,p,u)}switch(s){case"input":zo(l,o);break;case"textarea":au(l,o);break;case"select":var v=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var w=o.value;w!=null?on(l,!!o.multiple,w,!1):v!==!!o.multiple&&(o.defaultValue!=null?on(l,!!o.multiple,o.defaultValue,!0):on(l,!!o.multiple,o.multiple?[]:"",!1))}l[or]=o}catch(x){Q(e,e.return,x)}}break;case 6:if(ze(t,e),He(e),r&4){if(e.stateNode===null)throw Error(C(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(x){Q(e,e.return,x)}}break;case 3:if(ze(t,e),He(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{er(t.containerInfo)}catch(x){Q(e,e.return,x)}break;case 4:ze(t,e),He(e);break;case 13:ze(t,e),He(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(is=Y())),r&4&&ka(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ie=(u=ie)||h,ze(t,e),ie=u):ze(t,e),He(e),r&8192){if(u=e.memoizedState!==null,(e.stateNode.isHidden=u)&&!h&&e.mode&1)for(j=e,h=e.child;h!==null;){for(p=j=h;j!==null;){switch(v=j,w=v.child,v.tag){case 0:case 11:case 14:case 15:Kn(4,v,v.return);break;case 1:rn(v,v.return);var S=v.stateNode;if(typeof S.componentWillUnmount=="function"){r=v,n=v.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(x){Q(r,n,x)}}break;case 5:rn(v,v.return);break;case 22:if(v.memoizedState!==null){Ca(p);continue}}w!==null?(w.return=v,j=w):Ca(p)}h=h.sibling}e:for(h=null,p=e;;){if(p.tag===5){if(h===null){h=p;try{l=p.stateNode,u?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(s=p.stateNode,a=p.memoizedProps.style,i=a!=null&&a.hasOwnProperty("display")?a.display:null,s.style.display=du("display",i))}catch(x){Q(e,e.return,x)}}}else if(p.tag===6){if(h===null)try{p.stateNode.nodeValue=u?"":p.memoizedProps}catch(x){Q(e,e.return,x)}}else if((p.tag!==22&&p.tag!==23||p.memoizedState===null||p===e)&&p.child!==null){p.child.return=p,p=p.child;continue}if(p===e)break e;for(;p.sibling===null;){if(p.return===null||p.return===e)break e;h===p&&(h=null),p=p.return}h===p&&(h=null),p.sibling.return=p.return,p=p.sibling}}break;case 19:ze(t,e),He(e),r&4&&ka(e);break;case 21:break;default:ze(t,e),He(e)}}function He(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Mc(n)){var r=n;break e}n=n.return}throw Error(C(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Jn(l,""),r.flags&=-33);var o=Sa(e);pi(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,s=Sa(e);fi(e,s,i);break;default:throw Error(C(161))}}catch(a){Q(e,e.return,a)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Lp(e,t,n){j=e,Ac(e)}function Ac(e,t,n){for(var r=(e.mode&1)!==0;j!==null;){var l=j,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Or;if(!i){var s=l.alternate,a=s!==null&&s.memoizedState!==null||ie;s=Or;var u=ie;if(Or=i,(ie=a)&&!u)for(j=l;j!==null;)i=j,a=i.child,i.tag===22&&i.memoizedState!==null?Na(l):a!==null?(a.return=i,j=a):Na(l);for(;o!==null;)j=o,Ac(o),o=o.sibling;j=l,Or=s,ie=u}Ea(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,j=o):Ea(e)}}function Ea(e){for(;j!==null;){var t=j;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ie||Fl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ie)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Ie(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&sa(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}sa(t,i,n)}break;case 5:var s=t.stateNode;if(n===null&&t.flags&4){n=s;var a=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":a.autoFocus&&n.focus();break;case"img":a.src&&(n.src=a.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var u=t.alternate;if(u!==null){var h=u.memoizedState;if(h!==null){var p=h.dehydrated;p!==null&&er(p)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(C(163))}ie||t.flags&512&&di(t)}catch(v){Q(t,t.return,v)}}if(t===e){j=null;break}if(n=t.sibling,n!==null){n.return=t.return,j=n;break}j=t.return}}function Ca(e){for(;j!==null;){var t=j;if(t===e){j=null;break}var n=t.sibling;if(n!==null){n.return=t.return,j=n;break}j=t.return}}function Na(e){for(;j!==null;){var t=j;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Fl(4,t)}catch(a){Q(t,n,a)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(a){Q(t,l,a)}}var o=t.return;try{di(t)}catch(a){Q(t,o,a)}break;case 5:var i=t.return;try{di(t)}catch(a){Q(t,i,a)}}}catch(a){Q(t,t.return,a)}if(t===e){j=null;break}var s=t.sibling;if(s!==null){s.return=t.return,j=s;break}j=t.return}}var Tp=Math.ceil,xl=ot.ReactCurrentDispatcher,ls=ot.ReactCurrentOwner,Pe=ot.ReactCurrentBatchConfig,I=0,b=null,G=null,ne=0,xe=0,ln=_t(0),J=0,dr=null,Bt=0,Ol=0,os=0,Yn=null,pe=null,is=0,gn=1/0,Xe=null,wl=!1,mi=null,wt=null,Mr=!1,mt=null,Sl=0,Gn=0,hi=null,Xr=-1,Jr=0;function ue(){return I&6?Y():Xr!==-1?Xr:Xr=Y()}function St(e){return e.mode&1?I&2&&ne!==0?ne&-ne:mp.transition!==null?(Jr===0&&(Jr=Cu()),Jr):(e=F,e!==0||(e=window.event,e=e===void 0?16:Tu(e.type)),e):1}function $e(e,t,n,r){if(50<Gn)throw Gn=0,hi=null,Error(C(185));mr(e,n,r),(!(I&2)||e!==b)&&(e===b&&(!(I&2)&&(Ol|=n),J===4&&ft(e,ne)),ye(e,r),n===1&&I===0&&!(t.mode&1)&&(gn=Y()+500,zl&&jt()))}function ye(e,t){var n=e.callbackNode;mf(e,t);var r=ll(e,e===b?ne:0);if(r===0)n!==null&&Is(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Is(n),t===1)e.tag===0?pp(_a.bind(null,e)):Ju(_a.bind(null,e)),up(function(){!(I&6)&&jt()}),n=null;else{switch(Nu(r)){case 1:n=zi;break;case 4:n=ku;break;case 16:n=rl;break;case 536870912:n=Eu;break;default:n=rl}n=Gc(n,Bc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Bc(e,t){if(Xr=-1,Jr=0,I&6)throw Error(C(327));var n=e.callbackNode;if(dn()&&e.callbackNode!==n)return null;var r=ll(e,e===b?ne:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=kl(e,r);else{t=r;var l=I;I|=2;var o=Wc();(b!==e||ne!==t)&&(Xe=null,gn=Y()+500,Ot(e,t));do try{Ip();break}catch(s){Hc(e,s)}while(!0);Qi(),xl.current=o,I=l,G!==null?t=0:(b=null,ne=0,t=J)}if(t!==0){if(t===2&&(l=Ho(e),l!==0&&(r=l,t=vi(e,l))),t===1)throw n=dr,Ot(e,0),ft(e,r),ye(e,Y()),n;if(t===6)ft(e,r);else{if(l=e.current.alternate,!(r&30)&&!zp(l)&&(t=kl(e,r),t===2&&(o=Ho(e),o!==0&&(r=o,t=vi(e,o))),t===1))throw n=dr,Ot(e,0),ft(e,r),ye(e,Y()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(C(345));case 2:zt(e,pe,Xe);break;case 3:if(ft(e,r),(r&130023424)===r&&(t=is+500-Y(),10<t)){if(ll(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){ue(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Jo(zt.bind(null,e,pe,Xe),t);break}zt(e,pe,Xe);break;case 4:if(ft(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Me(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=Y()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Tp(r/1960))-r,10<r){e.timeoutHandle=Jo(zt.bind(null,e,pe,Xe),r);break}zt(e,pe,Xe);break;case 5:zt(e,pe,Xe);break;default:throw Error(C(329))}}}return ye(e,Y()),e.callbackNode===n?Bc.bind(null,e):null}function vi(e,t){var n=Yn;return e.current.memoizedState.isDehydrated&&(Ot(e,t).flags|=256),e=kl(e,t),e!==2&&(t=pe,pe=n,t!==null&&yi(t)),e}function yi(e){pe===null?pe=e:pe.push.apply(pe,e)}function zp(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!Ue(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ft(e,t){for(t&=~os,t&=~Ol,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Me(t),r=1<<n;e[n]=-1,t&=~r}}function _a(e){if(I&6)throw Error(C(327));dn();var t=ll(e,0);if(!(t&1))return ye(e,Y()),null;var n=kl(e,t);if(e.tag!==0&&n===2){var r=Ho(e);r!==0&&(t=r,n=vi(e,r))}if(n===1)throw n=dr,Ot(e,0),ft(e,t),ye(e,Y()),n;if(n===6)throw Error(C(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,zt(e,pe,Xe),ye(e,Y()),null}function ss(e,t){var n=I;I|=1;try{return e(t)}finally{I=n,I===0&&(gn=Y()+500,zl&&jt())}}function Ht(e){mt!==null&&mt.tag===0&&!(I&6)&&dn();var t=I;I|=1;var n=Pe.transition,r=F;try{if(Pe.transition=null,F=1,e)return e()}finally{F=r,Pe.transition=n,I=t,!(I&6)&&jt()}}function as(){xe=ln.current,U(ln)}function Ot(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,ap(n)),G!==null)for(n=G.return;n!==null;){var r=n;switch(Hi(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&ul();break;case 3:vn(),U(he),U(se),Zi();break;case 5:Ji(r);break;case 4:vn();break;case 13:U(H);break;case 19:U(H);break;case 10:Ki(r.type._context);break;case 22:case 23:as()}n=n.return}if(b=e,G=e=kt(e.current,null),ne=xe=t,J=0,dr=null,os=Ol=Bt=0,pe=Yn=null,It!==null){for(t=0;t<It.length;t++)if(n=It[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}It=null}return e}function Hc(e,t){do{var n=G;try{if(Qi(),Kr.current=gl,yl){for(var r=W.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}yl=!1}if(At=0,q=X=W=null,Qn=!1,ar=0,ls.current=null,n===null||n.return===null){J=1,dr=t,G=null;break}e:{var o=e,i=n.return,s=n,a=t;if(t=ne,s.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){var u=a,h=s,p=h.tag;if(!(h.mode&1)&&(p===0||p===11||p===15)){var v=h.alternate;v?(h.updateQueue=v.updateQueue,h.memoizedState=v.memoizedState,h.lanes=v.lanes):(h.updateQueue=null,h.memoizedState=null)}var w=pa(i);if(w!==null){w.flags&=-257,ma(w,i,s,o,t),w.mode&1&&fa(o,u,t),t=w,a=u;var S=t.updateQueue;if(S===null){var x=new Set;x.add(a),t.updateQueue=x}else S.add(a);break e}else{if(!(t&1)){fa(o,u,t),us();break e}a=Error(C(426))}}else if(A&&s.mode&1){var E=pa(i);if(E!==null){!(E.flags&65536)&&(E.flags|=256),ma(E,i,s,o,t),Wi(yn(a,s));break e}}o=a=yn(a,s),J!==4&&(J=2),Yn===null?Yn=[o]:Yn.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Nc(o,a,t);ia(o,f);break e;case 1:s=a;var c=o.type,m=o.stateNode;if(!(o.flags&128)&&(typeof c.getDerivedStateFromError=="function"||m!==null&&typeof m.componentDidCatch=="function"&&(wt===null||!wt.has(m)))){o.flags|=65536,t&=-t,o.lanes|=t;var g=_c(o,s,t);ia(o,g);break e}}o=o.return}while(o!==null)}Qc(n)}catch(k){t=k,G===n&&n!==null&&(G=n=n.return);continue}break}while(!0)}function Wc(){var e=xl.current;return xl.current=gl,e===null?gl:e}function us(){(J===0||J===3||J===2)&&(J=4),b===null||!(Bt&268435455)&&!(Ol&268435455)||ft(b,ne)}function kl(e,t){var n=I;I|=2;var r=Wc();(b!==e||ne!==t)&&(Xe=null,Ot(e,t));do try{Dp();break}catch(l){Hc(e,l)}while(!0);if(Qi(),I=n,xl.current=r,G!==null)throw Error(C(261));return b=null,ne=0,J}function Dp(){for(;G!==null;)Vc(G)}function Ip(){for(;G!==null&&!lf();)Vc(G)}function Vc(e){var t=Yc(e.alternate,e,xe);e.memoizedProps=e.pendingProps,t===null?Qc(e):G=t,ls.current=null}function Qc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=jp(n,t),n!==null){n.flags&=32767,G=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{J=6,G=null;return}}else if(n=_p(n,t,xe),n!==null){G=n;return}if(t=t.sibling,t!==null){G=t;return}G=t=e}while(t!==null);J===0&&(J=5)}function zt(e,t,n){var r=F,l=Pe.transition;try{Pe.transition=null,F=1,Fp(e,t,n,r)}finally{Pe.transition=l,F=r}return null}function Fp(e,t,n,r){do dn();while(mt!==null);if(I&6)throw Error(C(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(C(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(hf(e,o),e===b&&(G=b=null,ne=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Mr||(Mr=!0,Gc(rl,function(){return dn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Pe.transition,Pe.transition=null;var i=F;F=1;var s=I;I|=4,ls.current=null,Pp(e,n),Uc(n,e),tp(Go),ol=!!Yo,Go=Yo=null,e.current=n,Lp(n),of(),I=s,F=i,Pe.transition=o}else e.current=n;if(Mr&&(Mr=!1,mt=e,Sl=l),o=e.pendingLanes,o===0&&(wt=null),uf(n.stateNode),ye(e,Y()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(wl)throw wl=!1,e=mi,mi=null,e;return Sl&1&&e.tag!==0&&dn(),o=e.pendingLanes,o&1?e===hi?Gn++:(Gn=0,hi=e):Gn=0,jt(),null}function dn(){if(mt!==null){var e=Nu(Sl),t=Pe.transition,n=F;try{if(Pe.transition=null,F=16>e?16:e,mt===null)var r=!1;else{if(e=mt,mt=null,Sl=0,I&6)throw Error(C(331));var l=I;for(I|=4,j=e.current;j!==null;){var o=j,i=o.child;if(j.flags&16){var s=o.deletions;if(s!==null){for(var a=0;a<s.length;a++){var u=s[a];for(j=u;j!==null;){var h=j;switch(h.tag){case 0:case 11:case 15:Kn(8,h,o)}var p=h.child;if(p!==null)p.return=h,j=p;else for(;j!==null;){h=j;var v=h.sibling,w=h.return;if(Oc(h),h===u){j=null;break}if(v!==null){v.return=w,j=v;break}j=w}}}var S=o.alternate;if(S!==null){var x=S.child;if(x!==null){S.child=null;do{var E=x.sibling;x.sibling=null,x=E}while(x!==null)}}j=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,j=i;else e:for(;j!==null;){if(o=j,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Kn(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,j=f;break e}j=o.return}}var c=e.current;for(j=c;j!==null;){i=j;var m=i.child;if(i.subtreeFlags&2064&&m!==null)m.return=i,j=m;else e:for(i=c;j!==null;){if(s=j,s.flags&2048)try{switch(s.tag){case 0:case 11:case 15:Fl(9,s)}}catch(k){Q(s,s.return,k)}if(s===i){j=null;break e}var g=s.sibling;if(g!==null){g.return=s.return,j=g;break e}j=s.return}}if(I=l,jt(),Qe&&typeof Qe.onPostCommitFiberRoot=="function")try{Qe.onPostCommitFiberRoot(jl,e)}catch{}r=!0}return r}finally{F=n,Pe.transition=t}}return!1}function ja(e,t,n){t=yn(n,t),t=Nc(e,t,1),e=xt(e,t,1),t=ue(),e!==null&&(mr(e,1,t),ye(e,t))}function Q(e,t,n){if(e.tag===3)ja(e,e,n);else for(;t!==null;){if(t.tag===3){ja(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(wt===null||!wt.has(r))){e=yn(n,e),e=_c(t,e,1),t=xt(t,e,1),e=ue(),t!==null&&(mr(t,1,e),ye(t,e));break}}t=t.return}}function Op(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=ue(),e.pingedLanes|=e.suspendedLanes&n,b===e&&(ne&n)===n&&(J===4||J===3&&(ne&130023424)===ne&&500>Y()-is?Ot(e,0):os|=n),ye(e,t)}function Kc(e,t){t===0&&(e.mode&1?(t=jr,jr<<=1,!(jr&130023424)&&(jr=4194304)):t=1);var n=ue();e=nt(e,t),e!==null&&(mr(e,t,n),ye(e,n))}function Mp(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Kc(e,n)}function $p(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(C(314))}r!==null&&r.delete(t),Kc(e,n)}var Yc;Yc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||he.current)me=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return me=!1,Np(e,t,n);me=!!(e.flags&131072)}else me=!1,A&&t.flags&1048576&&Zu(t,fl,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Gr(e,t),e=t.pendingProps;var l=pn(t,se.current);cn(t,n),l=bi(null,t,r,e,l,n);var o=es();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ve(r)?(o=!0,cl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Gi(t),l.updater=Il,t.stateNode=l,l._reactInternals=t,ri(t,r,e,n),t=ii(null,t,r,!0,o,n)):(t.tag=0,A&&o&&Bi(t),ae(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Gr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Ap(r),e=Ie(r,e),l){case 0:t=oi(null,t,r,e,n);break e;case 1:t=ya(null,t,r,e,n);break e;case 11:t=ha(null,t,r,e,n);break e;case 14:t=va(null,t,r,Ie(r.type,e),n);break e}throw Error(C(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),oi(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),ya(e,t,r,l,n);case 3:e:{if(Lc(t),e===null)throw Error(C(387));r=t.pendingProps,o=t.memoizedState,l=o.element,rc(e,t),hl(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=yn(Error(C(423)),t),t=ga(e,t,r,n,l);break e}else if(r!==l){l=yn(Error(C(424)),t),t=ga(e,t,r,n,l);break e}else for(we=gt(t.stateNode.containerInfo.firstChild),Se=t,A=!0,Oe=null,n=tc(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(mn(),r===l){t=rt(e,t,n);break e}ae(e,t,r,n)}t=t.child}return t;case 5:return lc(t),e===null&&ei(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,Xo(r,l)?i=null:o!==null&&Xo(r,o)&&(t.flags|=32),Pc(e,t),ae(e,t,i,n),t.child;case 6:return e===null&&ei(t),null;case 13:return Tc(e,t,n);case 4:return Xi(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=hn(t,null,r,n):ae(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),ha(e,t,r,l,n);case 7:return ae(e,t,t.pendingProps,n),t.child;case 8:return ae(e,t,t.pendingProps.children,n),t.child;case 12:return ae(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,M(pl,r._currentValue),r._currentValue=i,o!==null)if(Ue(o.value,i)){if(o.children===l.children&&!he.current){t=rt(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var s=o.dependencies;if(s!==null){i=o.child;for(var a=s.firstContext;a!==null;){if(a.context===r){if(o.tag===1){a=be(-1,n&-n),a.tag=2;var u=o.updateQueue;if(u!==null){u=u.shared;var h=u.pending;h===null?a.next=a:(a.next=h.next,h.next=a),u.pending=a}}o.lanes|=n,a=o.alternate,a!==null&&(a.lanes|=n),ti(o.return,n,t),s.lanes|=n;break}a=a.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(C(341));i.lanes|=n,s=i.alternate,s!==null&&(s.lanes|=n),ti(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}ae(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,cn(t,n),l=Le(l),r=r(l),t.flags|=1,ae(e,t,r,n),t.child;case 14:return r=t.type,l=Ie(r,t.pendingProps),l=Ie(r.type,l),va(e,t,r,l,n);case 15:return jc(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Gr(e,t),t.tag=1,ve(r)?(e=!0,cl(t)):e=!1,cn(t,n),Cc(t,r,l),ri(t,r,l,n),ii(null,t,r,!0,e,n);case 19:return zc(e,t,n);case 22:return Rc(e,t,n)}throw Error(C(156,t.tag))};function Gc(e,t){return Su(e,t)}function Up(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Re(e,t,n,r){return new Up(e,t,n,r)}function cs(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Ap(e){if(typeof e=="function")return cs(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Pi)return 11;if(e===Li)return 14}return 2}function kt(e,t){var n=e.alternate;return n===null?(n=Re(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Zr(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")cs(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case Gt:return Mt(n.children,l,o,t);case Ri:i=8,l|=8;break;case jo:return e=Re(12,n,t,l|2),e.elementType=jo,e.lanes=o,e;case Ro:return e=Re(13,n,t,l),e.elementType=Ro,e.lanes=o,e;case Po:return e=Re(19,n,t,l),e.elementType=Po,e.lanes=o,e;case lu:return Ml(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case nu:i=10;break e;case ru:i=9;break e;case Pi:i=11;break e;case Li:i=14;break e;case ut:i=16,r=null;break e}throw Error(C(130,e==null?e:typeof e,""))}return t=Re(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Mt(e,t,n,r){return e=Re(7,e,r,t),e.lanes=n,e}function Ml(e,t,n,r){return e=Re(22,e,r,t),e.elementType=lu,e.lanes=n,e.stateNode={isHidden:!1},e}function xo(e,t,n){return e=Re(6,e,null,t),e.lanes=n,e}function wo(e,t,n){return t=Re(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Bp(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=bl(0),this.expirationTimes=bl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=bl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function ds(e,t,n,r,l,o,i,s,a){return e=new Bp(e,t,n,s,a),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Re(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Gi(o),e}function Hp(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Yt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function Xc(e){if(!e)return Ct;e=e._reactInternals;e:{if(Vt(e)!==e||e.tag!==1)throw Error(C(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ve(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(C(171))}if(e.tag===1){var n=e.type;if(ve(n))return Xu(e,n,t)}return t}function Jc(e,t,n,r,l,o,i,s,a){return e=ds(n,r,!0,e,l,o,i,s,a),e.context=Xc(null),n=e.current,r=ue(),l=St(n),o=be(r,l),o.callback=t??null,xt(n,o,l),e.current.lanes=l,mr(e,l,r),ye(e,r),e}function $l(e,t,n,r){var l=t.current,o=ue(),i=St(l);return n=Xc(n),t.context===null?t.context=n:t.pendingContext=n,t=be(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=xt(l,t,i),e!==null&&($e(e,l,i,o),Qr(e,l,i)),i}function El(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Ra(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function fs(e,t){Ra(e,t),(e=e.alternate)&&Ra(e,t)}function Wp(){return null}var Zc=typeof reportError=="function"?reportError:function(e){console.error(e)};function ps(e){this._internalRoot=e}Ul.prototype.render=ps.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(C(409));$l(e,t,null,null)};Ul.prototype.unmount=ps.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Ht(function(){$l(null,e,null,null)}),t[tt]=null}};function Ul(e){this._internalRoot=e}Ul.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ru();e={blockedOn:null,target:e,priority:t};for(var n=0;n<dt.length&&t!==0&&t<dt[n].priority;n++);dt.splice(n,0,e),n===0&&Lu(e)}};function ms(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Al(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Pa(){}function Vp(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var u=El(i);o.call(u)}}var i=Jc(t,r,e,0,null,!1,!1,"",Pa);return e._reactRootContainer=i,e[tt]=i.current,rr(e.nodeType===8?e.parentNode:e),Ht(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var s=r;r=function(){var u=El(a);s.call(u)}}var a=ds(e,0,!1,null,null,!1,!1,"",Pa);return e._reactRootContainer=a,e[tt]=a.current,rr(e.nodeType===8?e.parentNode:e),Ht(function(){$l(t,a,n,r)}),a}function Bl(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var s=l;l=function(){var a=El(i);s.call(a)}}$l(t,i,e,l)}else i=Vp(n,t,e,l,r);return El(i)}_u=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=$n(t.pendingLanes);n!==0&&(Di(t,n|1),ye(t,Y()),!(I&6)&&(gn=Y()+500,jt()))}break;case 13:Ht(function(){var r=nt(e,1);if(r!==null){var l=ue();$e(r,e,1,l)}}),fs(e,1)}};Ii=function(e){if(e.tag===13){var t=nt(e,134217728);if(t!==null){var n=ue();$e(t,e,134217728,n)}fs(e,134217728)}};ju=function(e){if(e.tag===13){var t=St(e),n=nt(e,t);if(n!==null){var r=ue();$e(n,e,t,r)}fs(e,t)}};Ru=function(){return F};Pu=function(e,t){var n=F;try{return F=e,t()}finally{F=n}};Uo=function(e,t,n){switch(t){case"input":if(zo(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Tl(r);if(!l)throw Error(C(90));iu(r),zo(r,l)}}}break;case"textarea":au(e,n);break;case"select":t=n.value,t!=null&&on(e,!!n.multiple,t,!1)}};hu=ss;vu=Ht;var Qp={usingClientEntryPoint:!1,Events:[vr,qt,Tl,pu,mu,ss]},In={findFiberByHostInstance:Dt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Kp={bundleType:In.bundleType,version:In.version,rendererPackageName:In.rendererPackageName,rendererConfig:In.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ot.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=xu(e),e===null?null:e.stateNode},findFiberByHostInstance:In.findFiberByHostInstance||Wp,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var $r=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!$r.isDisabled&&$r.supportsFiber)try{jl=$r.inject(Kp),Qe=$r}catch{}}Ee.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Qp;Ee.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!ms(t))throw Error(C(200));return Hp(e,t,null,n)};Ee.createRoot=function(e,t){if(!ms(e))throw Error(C(299));var n=!1,r="",l=Zc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=ds(e,1,!1,null,null,n,!1,r,l),e[tt]=t.current,rr(e.nodeType===8?e.parentNode:e),new ps(t)};Ee.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(C(188)):(e=Object.keys(e).join(","),Error(C(268,e)));return e=xu(t),e=e===null?null:e.stateNode,e};Ee.flushSync=function(e){return Ht(e)};Ee.hydrate=function(e,t,n){if(!Al(t))throw Error(C(200));return Bl(null,e,t,!0,n)};Ee.hydrateRoot=function(e,t,n){if(!ms(e))throw Error(C(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=Zc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=Jc(t,null,e,1,n??null,l,!1,o,i),e[tt]=t.current,rr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Ul(t)};Ee.render=function(e,t,n){if(!Al(t))throw Error(C(200));return Bl(null,e,t,!1,n)};Ee.unmountComponentAtNode=function(e){if(!Al(e))throw Error(C(40));return e._reactRootContainer?(Ht(function(){Bl(null,null,e,!1,function(){e._reactRootContainer=null,e[tt]=null})}),!0):!1};Ee.unstable_batchedUpdates=ss;Ee.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Al(n))throw Error(C(200));if(e==null||e._reactInternals===void 0)throw Error(C(38));return Bl(e,t,n,!1,r)};Ee.version="18.3.1-next-f1338f8080-20240426";function qc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(qc)}catch(e){console.error(e)}}qc(),qa.exports=Ee;var Yp=qa.exports,La=Yp;No.createRoot=La.createRoot,No.hydrateRoot=La.hydrateRoot;/**
- * react-router v7.13.1
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */var Ta="popstate";function za(e){return typeof e=="object"&&e!=null&&"pathname"in e&&"search"in e&&"hash"in e&&"state"in e&&"key"in e}function Gp(e={}){function t(r,l){var u;let o=(u=l.state)==null?void 0:u.masked,{pathname:i,search:s,hash:a}=o||r.location;return gi("",{pathname:i,search:s,hash:a},l.state&&l.state.usr||null,l.state&&l.state.key||"default",o?{pathname:r.location.pathname,search:r.location.search,hash:r.location.hash}:void 0)}function n(r,l){return typeof l=="string"?l:fr(l)}return Jp(t,n,null,e)}function B(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function Ae(e,t){if(!e){typeof console<"u"&&console.warn(t);try{throw new Error(t)}catch{}}}function Xp(){return Math.random().toString(36).substring(2,10)}function Da(e,t){return{usr:e.state,key:e.key,idx:t,masked:e.unstable_mask?{pathname:e.pathname,search:e.search,hash:e.hash}:void 0}}function gi(e,t,n=null,r,l){return{pathname:typeof e=="string"?e:e.pathname,search:"",hash:"",...typeof t=="string"?kn(t):t,state:n,key:t&&t.key||r||Xp(),unstable_mask:l}}function fr({pathname:e="/",search:t="",hash:n=""}){return t&&t!=="?"&&(e+=t.charAt(0)==="?"?t:"?"+t),n&&n!=="#"&&(e+=n.charAt(0)==="#"?n:"#"+n),e}function kn(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function Jp(e,t,n,r={}){let{window:l=document.defaultView,v5Compat:o=!1}=r,i=l.history,s="POP",a=null,u=h();u==null&&(u=0,i.replaceState({...i.state,idx:u},""));function h(){return(i.state||{idx:null}).idx}function p(){s="POP";let E=h(),f=E==null?null:E-u;u=E,a&&a({action:s,location:x.location,delta:f})}function v(E,f){s="PUSH";let c=za(E)?E:gi(x.location,E,f);u=h()+1;let m=Da(c,u),g=x.createHref(c.unstable_mask||c);try{i.pushState(m,"",g)}catch(k){if(k instanceof DOMException&&k.name==="DataCloneError")throw k;l.location.assign(g)}o&&a&&a({action:s,location:x.location,delta:1})}function w(E,f){s="REPLACE";let c=za(E)?E:gi(x.location,E,f);u=h();let m=Da(c,u),g=x.createHref(c.unstable_mask||c);i.replaceState(m,"",g),o&&a&&a({action:s,location:x.location,delta:0})}function S(E){return Zp(E)}let x={get action(){return s},get location(){return e(l,i)},listen(E){if(a)throw new Error("A history only accepts one active listener");return l.addEventListener(Ta,p),a=E,()=>{l.removeEventListener(Ta,p),a=null}},createHref(E){return t(l,E)},createURL:S,encodeLocation(E){let f=S(E);return{pathname:f.pathname,search:f.search,hash:f.hash}},push:v,replace:w,go(E){return i.go(E)}};return x}function Zp(e,t=!1){let n="http://localhost";typeof window<"u"&&(n=window.location.origin!=="null"?window.location.origin:window.location.href),B(n,"No window.location.(origin|href) available to create URL");let r=typeof e=="string"?e:fr(e);return r=r.replace(/ $/,"%20"),!t&&r.startsWith("//")&&(r=n+r),new URL(r,n)}function bc(e,t,n="/"){return qp(e,t,n,!1)}function qp(e,t,n,r){let l=typeof t=="string"?kn(t):t,o=lt(l.pathname||"/",n);if(o==null)return null;let i=ed(e);bp(i);let s=null;for(let a=0;s==null&&a<i.length;++a){let u=cm(o);s=am(i[a],u,r)}return s}function ed(e,t=[],n=[],r="",l=!1){let o=(i,s,a=l,u)=>{let h={relativePath:u===void 0?i.path||"":u,caseSensitive:i.caseSensitive===!0,childrenIndex:s,route:i};if(h.relativePath.startsWith("/")){if(!h.relativePath.startsWith(r)&&a)return;B(h.relativePath.startsWith(r),`Absolute route path "${h.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),h.relativePath=h.relativePath.slice(r.length)}let p=Ye([r,h.relativePath]),v=n.concat(h);i.children&&i.children.length>0&&(B(i.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${p}".`),ed(i.children,t,v,p,a)),!(i.path==null&&!i.index)&&t.push({path:p,score:im(p,i.index),routesMeta:v})};return e.forEach((i,s)=>{var a;if(i.path===""||!((a=i.path)!=null&&a.includes("?")))o(i,s);else for(let u of td(i.path))o(i,s,!0,u)}),t}function td(e){let t=e.split("/");if(t.length===0)return[];let[n,...r]=t,l=n.endsWith("?"),o=n.replace(/\?$/,"");if(r.length===0)return l?[o,""]:[o];let i=td(r.join("/")),s=[];return s.push(...i.map(a=>a===""?o:[o,a].join("/"))),l&&s.push(...i),s.map(a=>e.startsWith("/")&&a===""?"/":a)}function bp(e){e.sort((t,n)=>t.score!==n.score?n.score-t.score:sm(t.routesMeta.map(r=>r.childrenIndex),n.routesMeta.map(r=>r.childrenIndex)))}var em=/^:[\w-]+$/,tm=3,nm=2,rm=1,lm=10,om=-2,Ia=e=>e==="*";function im(e,t){let n=e.split("/"),r=n.length;return n.some(Ia)&&(r+=om),t&&(r+=nm),n.filter(l=>!Ia(l)).reduce((l,o)=>l+(em.test(o)?tm:o===""?rm:lm),r)}function sm(e,t){return e.length===t.length&&e.slice(0,-1).every((r,l)=>r===t[l])?e[e.length-1]-t[t.length-1]:0}function am(e,t,n=!1){let{routesMeta:r}=e,l={},o="/",i=[];for(let s=0;s<r.length;++s){let a=r[s],u=s===r.length-1,h=o==="/"?t:t.slice(o.length)||"/",p=Cl({path:a.relativePath,caseSensitive:a.caseSensitive,end:u},h),v=a.route;if(!p&&u&&n&&!r[r.length-1].route.index&&(p=Cl({path:a.relativePath,caseSensitive:a.caseSensitive,end:!1},h)),!p)return null;Object.assign(l,p.params),i.push({params:l,pathname:Ye([o,p.pathname]),pathnameBase:mm(Ye([o,p.pathnameBase])),route:v}),p.pathnameBase!=="/"&&(o=Ye([o,p.pathnameBase]))}return i}function Cl(e,t){typeof e=="string"&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=um(e.path,e.caseSensitive,e.end),l=t.match(n);if(!l)return null;let o=l[0],i=o.replace(/(.)\/+$/,"$1"),s=l.slice(1);return{params:r.reduce((u,{paramName:h,isOptional:p},v)=>{if(h==="*"){let S=s[v]||"";i=o.slice(0,o.length-S.length).replace(/(.)\/+$/,"$1")}const w=s[v];return p&&!w?u[h]=void 0:u[h]=(w||"").replace(/%2F/g,"/"),u},{}),pathname:o,pathnameBase:i,pattern:e}}function um(e,t=!1,n=!0){Ae(e==="*"||!e.endsWith("*")||e.endsWith("/*"),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,"/*")}".`);let r=[],l="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(i,s,a,u,h)=>{if(r.push({paramName:s,isOptional:a!=null}),a){let p=h.charAt(u+i.length);return p&&p!=="/"?"/([^\\/]*)":"(?:/([^\\/]*))?"}return"/([^\\/]+)"}).replace(/\/([\w-]+)\?(\/|$)/g,"(/$1)?$2");return e.endsWith("*")?(r.push({paramName:"*"}),l+=e==="*"||e==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?l+="\\/*$":e!==""&&e!=="/"&&(l+="(?:(?=\\/|$))"),[new RegExp(l,t?void 0:"i"),r]}function cm(e){try{return e.split("/").map(t=>decodeURIComponent(t).replace(/\//g,"%2F")).join("/")}catch(t){return Ae(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function lt(e,t){if(t==="/")return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&r!=="/"?null:e.slice(n)||"/"}var dm=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i;function fm(e,t="/"){let{pathname:n,search:r="",hash:l=""}=typeof e=="string"?kn(e):e,o;return n?(n=n.replace(/\/\/+/g,"/"),n.startsWith("/")?o=Fa(n.substring(1),"/"):o=Fa(n,t)):o=t,{pathname:o,search:hm(r),hash:vm(l)}}function Fa(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(l=>{l===".."?n.length>1&&n.pop():l!=="."&&n.push(l)}),n.length>1?n.join("/"):"/"}function So(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function pm(e){return e.filter((t,n)=>n===0||t.route.path&&t.route.path.length>0)}function hs(e){let t=pm(e);return t.map((n,r)=>r===t.length-1?n.pathname:n.pathnameBase)}function Hl(e,t,n,r=!1){let l;typeof e=="string"?l=kn(e):(l={...e},B(!l.pathname||!l.pathname.includes("?"),So("?","pathname","search",l)),B(!l.pathname||!l.pathname.includes("#"),So("#","pathname","hash",l)),B(!l.search||!l.search.includes("#"),So("#","search","hash",l)));let o=e===""||l.pathname==="",i=o?"/":l.pathname,s;if(i==null)s=n;else{let p=t.length-1;if(!r&&i.startsWith("..")){let v=i.split("/");for(;v[0]==="..";)v.shift(),p-=1;l.pathname=v.join("/")}s=p>=0?t[p]:"/"}let a=fm(l,s),u=i&&i!=="/"&&i.endsWith("/"),h=(o||i===".")&&n.endsWith("/");return!a.pathname.endsWith("/")&&(u||h)&&(a.pathname+="/"),a}var Ye=e=>e.join("/").replace(/\/\/+/g,"/"),mm=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),hm=e=>!e||e==="?"?"":e.startsWith("?")?e:"?"+e,vm=e=>!e||e==="#"?"":e.startsWith("#")?e:"#"+e,ym=class{constructor(e,t,n,r=!1){this.status=e,this.statusText=t||"",this.internal=r,n instanceof Error?(this.data=n.toString(),this.error=n):this.data=n}};function gm(e){return e!=null&&typeof e.status=="number"&&typeof e.statusText=="string"&&typeof e.internal=="boolean"&&"data"in e}function xm(e){return e.map(t=>t.route.path).filter(Boolean).join("/").replace(/\/\/*/g,"/")||"/"}var nd=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";function rd(e,t){let n=e;if(typeof n!="string"||!dm.test(n))return{absoluteURL:void 0,isExternal:!1,to:n};let r=n,l=!1;if(nd)try{let o=new URL(window.location.href),i=n.startsWith("//")?new URL(o.protocol+n):new URL(n),s=lt(i.pathname,t);i.origin===o.origin&&s!=null?n=s+i.search+i.hash:l=!0}catch{Ae(!1,`<Link to="${n}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}return{absoluteURL:r,isExternal:l,to:n}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var ld=["POST","PUT","PATCH","DELETE"];new Set(ld);var wm=["GET",...ld];new Set(wm);var En=y.createContext(null);En.displayName="DataRouter";var Wl=y.createContext(null);Wl.displayName="DataRouterState";var Sm=y.createContext(!1),od=y.createContext({isTransitioning:!1});od.displayName="ViewTransition";var km=y.createContext(new Map);km.displayName="Fetchers";var Em=y.createContext(null);Em.displayName="Await";var Ne=y.createContext(null);Ne.displayName="Navigation";var gr=y.createContext(null);gr.displayName="Location";var Ge=y.createContext({outlet:null,matches:[],isDataRoute:!1});Ge.displayName="Route";var vs=y.createContext(null);vs.displayName="RouteError";var id="REACT_ROUTER_ERROR",Cm="REDIRECT",Nm="ROUTE_ERROR_RESPONSE";function _m(e){if(e.startsWith(`${id}:${Cm}:{`))try{let t=JSON.parse(e.slice(28));if(typeof t=="object"&&t&&typeof t.status=="number"&&typeof t.statusText=="string"&&typeof t.location=="string"&&typeof t.reloadDocument=="boolean"&&typeof t.replace=="boolean")return t}catch{}}function jm(e){if(e.startsWith(`${id}:${Nm}:{`))try{let t=JSON.parse(e.slice(40));if(typeof t=="object"&&t&&typeof t.status=="number"&&typeof t.statusText=="string")return new ym(t.status,t.statusText,t.data)}catch{}}function Rm(e,{relative:t}={}){B(Cn(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=y.useContext(Ne),{hash:l,pathname:o,search:i}=xr(e,{relative:t}),s=o;return n!=="/"&&(s=o==="/"?n:Ye([n,o])),r.createHref({pathname:s,search:i,hash:l})}function Cn(){return y.useContext(gr)!=null}function it(){return B(Cn(),"useLocation() may be used only in the context of a <Router> component."),y.useContext(gr).location}var sd="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function ad(e){y.useContext(Ne).static||y.useLayoutEffect(e)}function ys(){let{isDataRoute:e}=y.useContext(Ge);return e?Bm():Pm()}function Pm(){B(Cn(),"useNavigate() may be used only in the context of a <Router> component.");let e=y.useContext(En),{basename:t,navigator:n}=y.useContext(Ne),{matches:r}=y.useContext(Ge),{pathname:l}=it(),o=JSON.stringify(hs(r)),i=y.useRef(!1);return ad(()=>{i.current=!0}),y.useCallback((a,u={})=>{if(Ae(i.current,sd),!i.current)return;if(typeof a=="number"){n.go(a);return}let h=Hl(a,JSON.parse(o),l,u.relative==="path");e==null&&t!=="/"&&(h.pathname=h.pathname==="/"?t:Ye([t,h.pathname])),(u.replace?n.replace:n.push)(h,u.state,u)},[t,n,o,l,e])}y.createContext(null);function xr(e,{relative:t}={}){let{matches:n}=y.useContext(Ge),{pathname:r}=it(),l=JSON.stringify(hs(n));return y.useMemo(()=>Hl(e,JSON.parse(l),r,t==="path"),[e,l,r,t])}function Lm(e,t){return ud(e,t)}function ud(e,t,n){var E;B(Cn(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:r}=y.useContext(Ne),{matches:l}=y.useContext(Ge),o=l[l.length-1],i=o?o.params:{},s=o?o.pathname:"/",a=o?o.pathnameBase:"/",u=o&&o.route;{let f=u&&u.path||"";dd(s,!u||f.endsWith("*")||f.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${s}" (under <Route path="${f}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${f}"> to <Route path="${f==="/"?"*":`${f}/*`}">.`)}let h=it(),p;if(t){let f=typeof t=="string"?kn(t):t;B(a==="/"||((E=f.pathname)==null?void 0:E.startsWith(a)),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${a}" but pathname "${f.pathname}" was given in the \`location\` prop.`),p=f}else p=h;let v=p.pathname||"/",w=v;if(a!=="/"){let f=a.replace(/^\//,"").split("/");w="/"+v.replace(/^\//,"").split("/").slice(f.length).join("/")}let S=bc(e,{pathname:w});Ae(u||S!=null,`No routes matched location "${p.pathname}${p.search}${p.hash}" `),Ae(S==null||S[S.length-1].route.element!==void 0||S[S.length-1].route.Component!==void 0||S[S.length-1].route.lazy!==void 0,`Matched leaf route at location "${p.pathname}${p.search}${p.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let x=Fm(S&&S.map(f=>Object.assign({},f,{params:Object.assign({},i,f.params),pathname:Ye([a,r.encodeLocation?r.encodeLocation(f.pathname.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:f.pathname]),pathnameBase:f.pathnameBase==="/"?a:Ye([a,r.encodeLocation?r.encodeLocation(f.pathnameBase.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:f.pathnameBase])})),l,n);return t&&x?y.createElement(gr.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",unstable_mask:void 0,...p},navigationType:"POP"}},x):x}function Tm(){let e=Am(),t=gm(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:r},o={padding:"2px 4px",backgroundColor:r},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=y.createElement(y.Fragment,null,y.createElement("p",null,"💿 Hey developer 👋"),y.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",y.createElement("code",{style:o},"ErrorBoundary")," or"," ",y.createElement("code",{style:o},"errorElement")," prop on your route.")),y.createElement(y.Fragment,null,y.createElement("h2",null,"Unexpected Application Error!"),y.createElement("h3",{style:{fontStyle:"italic"}},t),n?y.createElement("pre",{style:l},n):null,i)}var zm=y.createElement(Tm,null),cd=class extends y.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||t.revalidation!=="idle"&&e.revalidation==="idle"?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:e.error!==void 0?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){this.props.onError?this.props.onError(e,t):console.error("React Router caught the following error during render",e)}render(){let e=this.state.error;if(this.context&&typeof e=="object"&&e&&"digest"in e&&typeof e.digest=="string"){const n=jm(e.digest);n&&(e=n)}let t=e!==void 0?y.createElement(Ge.Provider,{value:this.props.routeContext},y.createElement(vs.Provider,{value:e,children:this.props.component})):this.props.children;return this.context?y.createElement(Dm,{error:e},t):t}};cd.contextType=Sm;var ko=new WeakMap;function Dm({children:e,error:t}){let{basename:n}=y.useContext(Ne);if(typeof t=="object"&&t&&"digest"in t&&typeof t.digest=="string"){let r=_m(t.digest);if(r){let l=ko.get(t);if(l)throw l;let o=rd(r.location,n);if(nd&&!ko.get(t))if(o.isExternal||r.reloadDocument)window.location.href=o.absoluteURL||o.to;else{const i=Promise.resolve().then(()=>window.__reactRouterDataRouter.navigate(o.to,{replace:r.replace}));throw ko.set(t,i),i}return y.createElement("meta",{httpEquiv:"refresh",content:`0;url=${o.absoluteURL||o.to}`})}}return e}function Im({routeContext:e,match:t,children:n}){let r=y.useContext(En);return r&&r.static&&r.staticContext&&(t.route.errorElement||t.route.ErrorBoundary)&&(r.staticContext._deepestRenderedBoundaryId=t.route.id),y.createElement(Ge.Provider,{value:e},n)}function Fm(e,t=[],n){let r=n==null?void 0:n.state;if(e==null){if(!r)return null;if(r.errors)e=r.matches;else if(t.length===0&&!r.initialized&&r.matches.length>0)e=r.matches;else return null}let l=e,o=r==null?void 0:r.errors;if(o!=null){let h=l.findIndex(p=>p.route.id&&(o==null?void 0:o[p.route.id])!==void 0);B(h>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(o).join(",")}`),l=l.slice(0,Math.min(l.length,h+1))}let i=!1,s=-1;if(n&&r){i=r.renderFallback;for(let h=0;h<l.length;h++){let p=l[h];if((p.route.HydrateFallback||p.route.hydrateFallbackElement)&&(s=h),p.route.id){let{loaderData:v,errors:w}=r,S=p.route.loader&&!v.hasOwnProperty(p.route.id)&&(!w||w[p.route.id]===void 0);if(p.route.lazy||S){n.isStatic&&(i=!0),s>=0?l=l.slice(0,s+1):l=[l[0]];break}}}}let a=n==null?void 0:n.onError,u=r&&a?(h,p)=>{var v,w;a(h,{location:r.location,params:((w=(v=r.matches)==null?void 0:v[0])==null?void 0:w.params)??{},unstable_pattern:xm(r.matches),errorInfo:p})}:void 0;return l.reduceRight((h,p,v)=>{let w,S=!1,x=null,E=null;r&&(w=o&&p.route.id?o[p.route.id]:void 0,x=p.route.errorElement||zm,i&&(s<0&&v===0?(dd("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),S=!0,E=null):s===v&&(S=!0,E=p.route.hydrateFallbackElement||null)));let f=t.concat(l.slice(0,v+1)),c=()=>{let m;return w?m=x:S?m=E:p.route.Component?m=y.createElement(p.route.Component,null):p.route.element?m=p.route.element:m=h,y.createElement(Im,{match:p,routeContext:{outlet:h,matches:f,isDataRoute:r!=null},children:m})};return r&&(p.route.ErrorBoundary||p.route.errorElement||v===0)?y.createElement(cd,{location:r.location,revalidation:r.revalidation,component:x,error:w,children:c(),routeContext:{outlet:null,matches:f,isDataRoute:!0},onError:u}):c()},null)}function gs(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function Om(e){let t=y.useContext(En);return B(t,gs(e)),t}function Mm(e){let t=y.useContext(Wl);return B(t,gs(e)),t}function $m(e){let t=y.useContext(Ge);return B(t,gs(e)),t}function xs(e){let t=$m(e),n=t.matches[t.matches.length-1];return B(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function Um(){return xs("useRouteId")}function Am(){var r;let e=y.useContext(vs),t=Mm("useRouteError"),n=xs("useRouteError");return e!==void 0?e:(r=t.errors)==null?void 0:r[n]}function Bm(){let{router:e}=Om("useNavigate"),t=xs("useNavigate"),n=y.useRef(!1);return ad(()=>{n.current=!0}),y.useCallback(async(l,o={})=>{Ae(n.current,sd),n.current&&(typeof l=="number"?await e.navigate(l):await e.navigate(l,{fromRouteId:t,...o}))},[e,t])}var Oa={};function dd(e,t,n){!t&&!Oa[e]&&(Oa[e]=!0,Ae(!1,n))}y.memo(Hm);function Hm({routes:e,future:t,state:n,isStatic:r,onError:l}){return ud(e,void 0,{state:n,isStatic:r,onError:l})}function Kt({to:e,replace:t,state:n,relative:r}){B(Cn(),"<Navigate> may be used only in the context of a <Router> component.");let{static:l}=y.useContext(Ne);Ae(!l,"<Navigate> must not be used on the initial render in a <StaticRouter>. This is a no-op, but you should modify your code so the <Navigate> is only ever rendered in response to some user interaction or state change.");let{matches:o}=y.useContext(Ge),{pathname:i}=it(),s=ys(),a=Hl(e,hs(o),i,r==="path"),u=JSON.stringify(a);return y.useEffect(()=>{s(JSON.parse(u),{replace:t,state:n,relative:r})},[s,u,r,t,n]),null}function De(e){B(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function Wm({basename:e="/",children:t=null,location:n,navigationType:r="POP",navigator:l,static:o=!1,unstable_useTransitions:i}){B(!Cn(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let s=e.replace(/^\/*/,"/"),a=y.useMemo(()=>({basename:s,navigator:l,static:o,unstable_useTransitions:i,future:{}}),[s,l,o,i]);typeof n=="string"&&(n=kn(n));let{pathname:u="/",search:h="",hash:p="",state:v=null,key:w="default",unstable_mask:S}=n,x=y.useMemo(()=>{let E=lt(u,s);return E==null?null:{location:{pathname:E,search:h,hash:p,state:v,key:w,unstable_mask:S},navigationType:r}},[s,u,h,p,v,w,r,S]);return Ae(x!=null,`<Router basename="${s}"> is not able to match the URL "${u}${h}${p}" because it does not start with the basename, so the <Router> won't render anything.`),x==null?null:y.createElement(Ne.Provider,{value:a},y.createElement(gr.Provider,{children:t,value:x}))}function Ma({children:e,location:t}){return Lm(xi(e),t)}function xi(e,t=[]){let n=[];return y.Children.forEach(e,(r,l)=>{if(!y.isValidElement(r))return;let o=[...t,l];if(r.type===y.Fragment){n.push.apply(n,xi(r.props.children,o));return}B(r.type===De,`[${typeof r.type=="string"?r.type:r.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),B(!r.props.index||!r.props.children,"An index route cannot have child routes.");let i={id:r.props.id||o.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,middleware:r.props.middleware,loader:r.props.loader,action:r.props.action,hydrateFallbackElement:r.props.hydrateFallbackElement,HydrateFallback:r.props.HydrateFallback,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.hasErrorBoundary===!0||r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(i.children=xi(r.props.children,o)),n.push(i)}),n}var qr="get",br="application/x-www-form-urlencoded";function Vl(e){return typeof HTMLElement<"u"&&e instanceof HTMLElement}function Vm(e){return Vl(e)&&e.tagName.toLowerCase()==="button"}function Qm(e){return Vl(e)&&e.tagName.toLowerCase()==="form"}function Km(e){return Vl(e)&&e.tagName.toLowerCase()==="input"}function Ym(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function Gm(e,t){return e.button===0&&(!t||t==="_self")&&!Ym(e)}var Ur=null;function Xm(){if(Ur===null)try{new FormData(document.createElement("form"),0),Ur=!1}catch{Ur=!0}return Ur}var Jm=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Eo(e){return e!=null&&!Jm.has(e)?(Ae(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${br}"`),null):e}function Zm(e,t){let n,r,l,o,i;if(Qm(e)){let s=e.getAttribute("action");r=s?lt(s,t):null,n=e.getAttribute("method")||qr,l=Eo(e.getAttribute("enctype"))||br,o=new FormData(e)}else if(Vm(e)||Km(e)&&(e.type==="submit"||e.type==="image")){let s=e.form;if(s==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let a=e.getAttribute("formaction")||s.getAttribute("action");if(r=a?lt(a,t):null,n=e.getAttribute("formmethod")||s.getAttribute("method")||qr,l=Eo(e.getAttribute("formenctype"))||Eo(s.getAttribute("enctype"))||br,o=new FormData(s,e),!Xm()){let{name:u,type:h,value:p}=e;if(h==="image"){let v=u?`${u}.`:"";o.append(`${v}x`,"0"),o.append(`${v}y`,"0")}else u&&o.append(u,p)}}else{if(Vl(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=qr,r=null,l=br,i=e}return o&&l==="text/plain"&&(i=o,o=void 0),{action:r,method:n.toLowerCase(),encType:l,formData:o,body:i}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");function ws(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function qm(e,t,n,r){let l=typeof e=="string"?new URL(e,typeof window>"u"?"server://singlefetch/":window.location.origin):e;return n?l.pathname.endsWith("/")?l.pathname=`${l.pathname}_.${r}`:l.pathname=`${l.pathname}.${r}`:l.pathname==="/"?l.pathname=`_root.${r}`:t&&lt(l.pathname,t)==="/"?l.pathname=`${t.replace(/\/$/,"")}/_root.${r}`:l.pathname=`${l.pathname.replace(/\/$/,"")}.${r}`,l}async function bm(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function eh(e){return e==null?!1:e.href==null?e.rel==="preload"&&typeof e.imageSrcSet=="string"&&typeof e.imageSizes=="string":typeof e.rel=="string"&&typeof e.href=="string"}async function th(e,t,n){let r=await Promise.all(e.map(async l=>{let o=t.routes[l.route.id];if(o){let i=await bm(o,n);return i.links?i.links():[]}return[]}));return oh(r.flat(1).filter(eh).filter(l=>l.rel==="stylesheet"||l.rel==="preload").map(l=>l.rel==="stylesheet"?{...l,rel:"prefetch",as:"style"}:{...l,rel:"prefetch"}))}function $a(e,t,n,r,l,o){let i=(a,u)=>n[u]?a.route.id!==n[u].route.id:!0,s=(a,u)=>{var h;return n[u].pathname!==a.pathname||((h=n[u].route.path)==null?void 0:h.endsWith("*"))&&n[u].params["*"]!==a.params["*"]};return o==="assets"?t.filter((a,u)=>i(a,u)||s(a,u)):o==="data"?t.filter((a,u)=>{var p;let h=r.routes[a.route.id];if(!h||!h.hasLoader)return!1;if(i(a,u)||s(a,u))return!0;if(a.route.shouldRevalidate){let v=a.route.shouldRevalidate({currentUrl:new URL(l.pathname+l.search+l.hash,window.origin),currentParams:((p=n[0])==null?void 0:p.params)||{},nextUrl:new URL(e,window.origin),nextParams:a.params,defaultShouldRevalidate:!0});if(typeof v=="boolean")return v}return!0}):[]}function nh(e,t,{includeHydrateFallback:n}={}){return rh(e.map(r=>{let l=t.routes[r.route.id];if(!l)return[];let o=[l.module];return l.clientActionModule&&(o=o.concat(l.clientActionModule)),l.clientLoaderModule&&(o=o.concat(l.clientLoaderModule)),n&&l.hydrateFallbackModule&&(o=o.concat(l.hydrateFallbackModule)),l.imports&&(o=o.concat(l.imports)),o}).flat(1))}function rh(e){return[...new Set(e)]}function lh(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}function oh(e,t){let n=new Set;return new Set(t),e.reduce((r,l)=>{let o=JSON.stringify(lh(l));return n.has(o)||(n.add(o),r.push({key:o,link:l})),r},[])}function fd(){let e=y.useContext(En);return ws(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function ih(){let e=y.useContext(Wl);return ws(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var Ss=y.createContext(void 0);Ss.displayName="FrameworkContext";function pd(){let e=y.useContext(Ss);return ws(e,"You must render this element inside a <HydratedRouter> element"),e}function sh(e,t){let n=y.useContext(Ss),[r,l]=y.useState(!1),[o,i]=y.useState(!1),{onFocus:s,onBlur:a,onMouseEnter:u,onMouseLeave:h,onTouchStart:p}=t,v=y.useRef(null);y.useEffect(()=>{if(e==="render"&&i(!0),e==="viewport"){let x=f=>{f.forEach(c=>{i(c.isIntersecting)})},E=new IntersectionObserver(x,{threshold:.5});return v.current&&E.observe(v.current),()=>{E.disconnect()}}},[e]),y.useEffect(()=>{if(r){let x=setTimeout(()=>{i(!0)},100);return()=>{clearTimeout(x)}}},[r]);let w=()=>{l(!0)},S=()=>{l(!1),i(!1)};return n?e!=="intent"?[o,v,{}]:[o,v,{onFocus:Fn(s,w),onBlur:Fn(a,S),onMouseEnter:Fn(u,w),onMouseLeave:Fn(h,S),onTouchStart:Fn(p,w)}]:[!1,v,{}]}function Fn(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function ah({page:e,...t}){let{router:n}=fd(),r=y.useMemo(()=>bc(n.routes,e,n.basename),[n.routes,e,n.basename]);return r?y.createElement(ch,{page:e,matches:r,...t}):null}function uh(e){let{manifest:t,routeModules:n}=pd(),[r,l]=y.useState([]);return y.useEffect(()=>{let o=!1;return th(e,t,n).then(i=>{o||l(i)}),()=>{o=!0}},[e,t,n]),r}function ch({page:e,matches:t,...n}){let r=it(),{future:l,manifest:o,routeModules:i}=pd(),{basename:s}=fd(),{loaderData:a,matches:u}=ih(),h=y.useMemo(()=>$a(e,t,u,o,r,"data"),[e,t,u,o,r]),p=y.useMemo(()=>$a(e,t,u,o,r,"assets"),[e,t,u,o,r]),v=y.useMemo(()=>{if(e===r.pathname+r.search+r.hash)return[];let x=new Set,E=!1;if(t.forEach(c=>{var g;let m=o.routes[c.route.id];!m||!m.hasLoader||(!h.some(k=>k.route.id===c.route.id)&&c.route.id in a&&((g=i[c.route.id])!=null&&g.shouldRevalidate)||m.hasClientLoader?E=!0:x.add(c.route.id))}),x.size===0)return[];let f=qm(e,s,l.unstable_trailingSlashAwareDataRequests,"data");return E&&x.size>0&&f.searchParams.set("_routes",t.filter(c=>x.has(c.route.id)).map(c=>c.route.id).join(",")),[f.pathname+f.search]},[s,l.unstable_trailingSlashAwareDataRequests,a,r,o,h,t,e,i]),w=y.useMemo(()=>nh(p,o),[p,o]),S=uh(p);return y.createElement(y.Fragment,null,v.map(x=>y.createElement("link",{key:x,rel:"prefetch",as:"fetch",href:x,...n})),w.map(x=>y.createElement("link",{key:x,rel:"modulepreload",href:x,...n})),S.map(({key:x,link:E})=>y.createElement("link",{key:x,nonce:n.nonce,...E,crossOrigin:E.crossOrigin??n.crossOrigin})))}function dh(...e){return t=>{e.forEach(n=>{typeof n=="function"?n(t):n!=null&&(n.current=t)})}}var fh=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{fh&&(window.__reactRouterVersion="7.13.1")}catch{}function ph({basename:e,children:t,unstable_useTransitions:n,window:r}){let l=y.useRef();l.current==null&&(l.current=Gp({window:r,v5Compat:!0}));let o=l.current,[i,s]=y.useState({action:o.action,location:o.location}),a=y.useCallback(u=>{n===!1?s(u):y.startTransition(()=>s(u))},[n]);return y.useLayoutEffect(()=>o.listen(a),[o,a]),y.createElement(Wm,{basename:e,children:t,location:i.location,navigationType:i.action,navigator:o,unstable_useTransitions:n})}var md=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,hd=y.forwardRef(function({onClick:t,discover:n="render",prefetch:r="none",relative:l,reloadDocument:o,replace:i,unstable_mask:s,state:a,target:u,to:h,preventScrollReset:p,viewTransition:v,unstable_defaultShouldRevalidate:w,...S},x){let{basename:E,navigator:f,unstable_useTransitions:c}=y.useContext(Ne),m=typeof h=="string"&&md.test(h),g=rd(h,E);h=g.to;let k=Rm(h,{relative:l}),N=it(),_=null;if(s){let Be=Hl(s,[],N.unstable_mask?N.unstable_mask.pathname:"/",!0);E!=="/"&&(Be.pathname=Be.pathname==="/"?E:Ye([E,Be.pathname])),_=f.createHref(Be)}let[R,O,T]=sh(r,S),ge=vh(h,{replace:i,unstable_mask:s,state:a,target:u,preventScrollReset:p,relative:l,viewTransition:v,unstable_defaultShouldRevalidate:w,unstable_useTransitions:c});function Rt(Be){t&&t(Be),Be.defaultPrevented||ge(Be)}let st=!(g.isExternal||o),_n=y.createElement("a",{...S,...T,href:(st?_:void 0)||g.absoluteURL||k,onClick:st?Rt:t,ref:dh(x,O),target:u,"data-discover":!m&&n==="render"?"true":void 0});return R&&!m?y.createElement(y.Fragment,null,_n,y.createElement(ah,{page:k})):_n});hd.displayName="Link";var wi=y.forwardRef(function({"aria-current":t="page",caseSensitive:n=!1,className:r="",end:l=!1,style:o,to:i,viewTransition:s,children:a,...u},h){let p=xr(i,{relative:u.relative}),v=it(),w=y.useContext(Wl),{navigator:S,basename:x}=y.useContext(Ne),E=w!=null&&Sh(p)&&s===!0,f=S.encodeLocation?S.encodeLocation(p).pathname:p.pathname,c=v.pathname,m=w&&w.navigation&&w.navigation.location?w.navigation.location.pathname:null;n||(c=c.toLowerCase(),m=m?m.toLowerCase():null,f=f.toLowerCase()),m&&x&&(m=lt(m,x)||m);const g=f!=="/"&&f.endsWith("/")?f.length-1:f.length;let k=c===f||!l&&c.startsWith(f)&&c.charAt(g)==="/",N=m!=null&&(m===f||!l&&m.startsWith(f)&&m.charAt(f.length)==="/"),_={isActive:k,isPending:N,isTransitioning:E},R=k?t:void 0,O;typeof r=="function"?O=r(_):O=[r,k?"active":null,N?"pending":null,E?"transitioning":null].filter(Boolean).join(" ");let T=typeof o=="function"?o(_):o;return y.createElement(hd,{...u,"aria-current":R,className:O,ref:h,style:T,to:i,viewTransition:s},typeof a=="function"?a(_):a)});wi.displayName="NavLink";var mh=y.forwardRef(({discover:e="render",fetcherKey:t,navigate:n,reloadDocument:r,replace:l,state:o,method:i=qr,action:s,onSubmit:a,relative:u,preventScrollReset:h,viewTransition:p,unstable_defaultShouldRevalidate:v,...w},S)=>{let{unstable_useTransitions:x}=y.useContext(Ne),E=xh(),f=wh(s,{relative:u}),c=i.toLowerCase()==="get"?"get":"post",m=typeof s=="string"&&md.test(s),g=k=>{if(a&&a(k),k.defaultPrevented)return;k.preventDefault();let N=k.nativeEvent.submitter,_=(N==null?void 0:N.getAttribute("formmethod"))||i,R=()=>E(N||k.currentTarget,{fetcherKey:t,method:_,navigate:n,replace:l,state:o,relative:u,preventScrollReset:h,viewTransition:p,unstable_defaultShouldRevalidate:v});x&&n!==!1?y.startTransition(()=>R()):R()};return y.createElement("form",{ref:S,method:c,action:f,onSubmit:r?a:g,...w,"data-discover":!m&&e==="render"?"true":void 0})});mh.displayName="Form";function hh(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function vd(e){let t=y.useContext(En);return B(t,hh(e)),t}function vh(e,{target:t,replace:n,unstable_mask:r,state:l,preventScrollReset:o,relative:i,viewTransition:s,unstable_defaultShouldRevalidate:a,unstable_useTransitions:u}={}){let h=ys(),p=it(),v=xr(e,{relative:i});return y.useCallback(w=>{if(Gm(w,t)){w.preventDefault();let S=n!==void 0?n:fr(p)===fr(v),x=()=>h(e,{replace:S,unstable_mask:r,state:l,preventScrollReset:o,relative:i,viewTransition:s,unstable_defaultShouldRevalidate:a});u?y.startTransition(()=>x()):x()}},[p,h,v,n,r,l,t,e,o,i,s,a,u])}var yh=0,gh=()=>`__${String(++yh)}__`;function xh(){let{router:e}=vd("useSubmit"),{basename:t}=y.useContext(Ne),n=Um(),r=e.fetch,l=e.navigate;return y.useCallback(async(o,i={})=>{let{action:s,method:a,encType:u,formData:h,body:p}=Zm(o,t);if(i.navigate===!1){let v=i.fetcherKey||gh();await r(v,n,i.action||s,{unstable_defaultShouldRevalidate:i.unstable_defaultShouldRevalidate,preventScrollReset:i.preventScrollReset,formData:h,body:p,formMethod:i.method||a,formEncType:i.encType||u,flushSync:i.flushSync})}else await l(i.action||s,{unstable_defaultShouldRevalidate:i.unstable_defaultShouldRevalidate,preventScrollReset:i.preventScrollReset,formData:h,body:p,formMethod:i.method||a,formEncType:i.encType||u,replace:i.replace,state:i.state,fromRouteId:n,flushSync:i.flushSync,viewTransition:i.viewTransition})},[r,l,t,n])}function wh(e,{relative:t}={}){let{basename:n}=y.useContext(Ne),r=y.useContext(Ge);B(r,"useFormAction must be used inside a RouteContext");let[l]=r.matches.slice(-1),o={...xr(e||".",{relative:t})},i=it();if(e==null){o.search=i.search;let s=new URLSearchParams(o.search),a=s.getAll("index");if(a.some(h=>h==="")){s.delete("index"),a.filter(p=>p).forEach(p=>s.append("index",p));let h=s.toString();o.search=h?`?${h}`:""}}return(!e||e===".")&&l.route.index&&(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index"),n!=="/"&&(o.pathname=o.pathname==="/"?n:Ye([n,o.pathname])),fr(o)}function Sh(e,{relative:t}={}){let n=y.useContext(od);B(n!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=vd("useViewTransitionState"),l=xr(e,{relative:t});if(!n.isTransitioning)return!1;let o=lt(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=lt(n.nextLocation.pathname,r)||n.nextLocation.pathname;return Cl(l.pathname,i)!=null||Cl(l.pathname,o)!=null}const Co="http://127.0.0.1:8001/api/v1";function kh(){const e=Co.includes("127.0.0.1")||Co.includes("localhost"),t=typeof window<"u"&&(window.location.hostname==="127.0.0.1"||window.location.hostname==="localhost");return e&&!t?"/api/v1":Co}const Ua=kh();async function fe(e,{method:t="GET",headers:n={},body:r}={},l){var s;const o=async a=>{const u=`${Ua}${e}`,h={...r&&!(r instanceof FormData)?{"Content-Type":"application/json"}:{},...n};return a&&(h.Authorization=`Bearer ${a}`),await fetch(u,{method:t,headers:h,body:r&&!(r instanceof FormData)?JSON.stringify(r):r||void 0})};let i=await o(l);if(i.status===401)try{const a=window.localStorage.getItem("hrms_refresh_token");if(a){const u=await fetch(`${Ua}/auth/refresh`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({refresh_token:a})});if(u.ok){const h=await u.json();h.access_token&&window.localStorage.setItem("hrms_token",h.access_token),h.refresh_token&&window.localStorage.setItem("hrms_refresh_token",h.refresh_token),h.user&&window.localStorage.setItem("hrms_user",JSON.stringify(h.user)),i=await o(h.access_token)}else window.localStorage.removeItem("hrms_token"),window.localStorage.removeItem("hrms_refresh_token"),window.localStorage.removeItem("hrms_user")}}catch{}if(!i.ok){let a=`Request failed with status ${i.status}`;try{const u=await i.json();u!=null&&u.detail&&(a=typeof u.detail=="string"?u.detail:((s=u.detail[0])==null?void 0:s.msg)||a)}catch{}throw new Error(a)}return i.status===204?null:i.json()}async function Eh(e,t){return fe("/auth/login",{method:"POST",body:{username:e,password:t}})}async function Ch(e){return fe("/auth/me",{},e)}async function Nh(e){return fe("/auth/users",{},e)}async function _h(e,t){return fe("/auth/users",{method:"POST",body:t},e)}async function jh(e,t,n){return fe(`/auth/users/${t}`,{method:"PUT",body:n},e)}async function Rh(e,t){return fe("/auth/change-password",{method:"POST",body:t},e)}function yd(e){return fe("/employees/",{},e)}function Ph(e,t){return fe("/employees/",{method:"POST",body:e},t)}function Lh(e,t){return fe(`/employees/${e}`,{method:"DELETE"},t)}function gd(e){return fe("/departments/",{},e)}function Th(e,t){return fe("/departments/",{method:"POST",body:e},t)}function zh(e,t,n){return fe(`/departments/${e}`,{method:"PUT",body:t},n)}function Dh(e,t){return fe(`/departments/${e}`,{method:"DELETE"},t)}function te({label:e,type:t="text",name:n,value:r,onChange:l,placeholder:o,autoComplete:i,required:s,disabled:a,className:u="",withToggle:h=!1,size:p="md"}){const[v,w]=y.useState(!1),S=t==="password",x=S&&h?v?"text":"password":t,E="mt-1 w-full rounded-lg border border-slate-300 text-slate-900 shadow-sm focus:border-sky-500 focus:outline-none focus:ring-1 focus:ring-sky-500",f=p==="sm"?"px-3 py-1.5 text-xs":"px-3 py-2 text-sm";return d.jsxs("div",{className:S&&h?"relative":"",children:[e&&d.jsx("label",{className:"block text-sm font-medium text-slate-700",children:e}),d.jsx("input",{type:x,name:n,value:r,onChange:l,placeholder:o,autoComplete:i,required:s,disabled:a,className:`${E} ${f} ${S&&h?"pr-10":""} ${u}`}),S&&h&&d.jsx("button",{type:"button",onClick:()=>w(c=>!c),className:`absolute inset-y-0 right-0 mr-3 ${e?"mt-5":"mt-1"} flex items-center text-slate-400 hover:text-slate-600`,"aria-label":v?"Hide password":"Show password",children:v?d.jsxs("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-4 w-4",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:[d.jsx("path",{d:"M17.94 17.94A10.07 10.07 0 0 1 12 20c-5 0-9-4-9-8 0-1.13.27-2.2.76-3.17"}),d.jsx("path",{d:"M6.1 6.1A9.77 9.77 0 0 1 12 4c5 0 9 4 9 8 0 1.61-.49 3.11-1.33 4.37"}),d.jsx("path",{d:"M14.12 14.12A3 3 0 0 1 9.88 9.88"}),d.jsx("line",{x1:"3",y1:"3",x2:"21",y2:"21"})]}):d.jsxs("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-4 w-4",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:[d.jsx("path",{d:"M1 12s4-7 11-7 11 7 11 7-4 7-11 7S1 12 1 12Z"}),d.jsx("circle",{cx:"12",cy:"12",r:"3"})]})})]})}function Nl({label:e,name:t,value:n,onChange:r,children:l,className:o="",size:i="md"}){const s="mt-1 w-full rounded-lg border border-slate-300 bg-white text-slate-900 shadow-sm focus:border-sky-500 focus:outline-none focus:ring-1 focus:ring-sky-500",a=i==="sm"?"px-3 py-1.5 text-xs":"px-3 py-2 text-sm";return d.jsxs("div",{children:[e&&d.jsx("label",{className:"block text-sm font-medium text-slate-700",children:e}),d.jsx("select",{name:t,value:n,onChange:r,className:`${s} ${a} ${o}`,children:l})]})}function Nn({children:e,type:t="button",disabled:n,size:r="md"}){const l="inline-flex items-center justify-center rounded-lg bg-sky-600 text-white font-medium shadow-sm hover:bg-sky-700 disabled:cursor-not-allowed disabled:opacity-60",o=r==="sm"?"px-3 py-1.5 text-xs":"px-4 py-2 text-sm";return d.jsx("button",{type:t,disabled:n,className:`${l} ${o}`,children:e})}function Ih({token:e}){const[t,n]=y.useState([]),[r,l]=y.useState(!0),[o,i]=y.useState([]),[s,a]=y.useState({first_name:"",last_name:"",email:"",department:"Development",gender:"",address:"",pin:"",city:"",password:""}),[u,h]=y.useState(!1),[p,v]=y.useState(""),w=c=>{if(!c||c.length===0)return"EMP-0001";const g=c.reduce((k,N)=>{const _=typeof N.employee_id=="string"&&N.employee_id.match(/^EMP-(\d+)$/);if(!_)return k;const R=parseInt(_[1],10);return Number.isNaN(R)?k:Math.max(k,R)},0)+1;return`EMP-${String(g).padStart(4,"0")}`},S=()=>{l(!0),v(""),yd(e).then(n).catch(c=>v(c.message||"Failed to load employees")).finally(()=>l(!1))};y.useEffect(()=>{S(),gd(e).then(c=>{i(c),c.length>0&&a(m=>({...m,department:c[0].name}))}).catch(()=>{})},[]);const x=c=>{const{name:m,value:g}=c.target;a(k=>({...k,[m]:g}))},E=c=>{c.preventDefault(),h(!0),v("");const g={employee_id:w(t),...s};Ph(g,e).then(()=>{a({first_name:"",last_name:"",email:"",department:"Development",gender:"",address:"",pin:"",city:"",password:""}),S()}).catch(k=>v(k.message||"Failed to create employee")).finally(()=>h(!1))},f=c=>{window.confirm("Delete this employee?")&&Lh(c,e).then(()=>S()).catch(m=>v(m.message||"Failed to delete employee"))};return d.jsxs("div",{className:"grid gap-6 md:grid-cols-[minmax(0,1.5fr)_minmax(0,1fr)]",children:[d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Employees"}),r?d.jsx("p",{className:"text-sm text-slate-500",children:"Loading employees…"}):t.length===0?d.jsx("p",{className:"text-sm text-slate-500",children:"No employees yet."}):d.jsx("div",{className:"overflow-x-auto",children:d.jsxs("table",{className:"min-w-full border-collapse text-sm",children:[d.jsx("thead",{children:d.jsxs("tr",{className:"bg-slate-50",children:[d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Employee ID"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"First name"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Last name"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Email"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Department"}),d.jsx("th",{className:"px-3 py-2"})]})}),d.jsx("tbody",{children:t.map(c=>d.jsxs("tr",{className:"border-t border-slate-100",children:[d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.employee_id}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.first_name||c.full_name}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.last_name||""}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.email}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.department}),d.jsx("td",{className:"px-3 py-2 text-right",children:d.jsx("button",{className:"inline-flex items-center rounded-full bg-red-50 px-3 py-1 text-xs font-medium text-red-700 hover:bg-red-100",onClick:()=>f(c.id),children:"Delete"})})]},c.id))})]})}),p&&d.jsx("div",{className:"mt-3 rounded-lg border border-red-200 bg-red-50 px-3 py-2 text-xs text-red-700",children:p})]}),d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Add Employee"}),d.jsxs("form",{onSubmit:E,className:"space-y-3",children:[d.jsx(te,{label:"First name",name:"first_name",value:s.first_name,onChange:x,placeholder:"John",required:!0}),d.jsx(te,{label:"Last name",name:"last_name",value:s.last_name,onChange:x,placeholder:"Doe"}),d.jsx(te,{label:"Email",type:"email",name:"email",value:s.email,onChange:x,placeholder:"john@example.com"}),d.jsxs(Nl,{label:"Gender",name:"gender",value:s.gender,onChange:x,children:[d.jsx("option",{value:"",children:"Select gender (optional)"}),d.jsx("option",{value:"Male",children:"Male"}),d.jsx("option",{value:"Female",children:"Female"}),d.jsx("option",{value:"Other",children:"Other"})]}),d.jsx(te,{label:"Address",name:"address",value:s.address,onChange:x,placeholder:"Street, area"}),d.jsxs("div",{className:"grid grid-cols-1 gap-3 sm:grid-cols-2",children:[d.jsx(te,{label:"PIN code",name:"pin",value:s.pin,onChange:x,placeholder:"Postal code"}),d.jsx(te,{label:"City",name:"city",value:s.city,onChange:x,placeholder:"City"})]}),d.jsx(Nl,{label:"Department",name:"department",value:s.department,onChange:x,children:o.length===0?d.jsxs(d.Fragment,{children:[d.jsx("option",{value:"Development",children:"Development"}),d.jsx("option",{value:"QA",children:"QA"})]}):o.filter(c=>c.is_active).map(c=>d.jsx("option",{value:c.name,children:c.name},c.id))}),d.jsx(te,{label:"Temporary password",type:"password",name:"password",value:s.password,onChange:x,placeholder:"Set a login password",withToggle:!0}),d.jsx(Nn,{type:"submit",disabled:u,children:u?"Saving…":"Save"})]})]})]})}function Fh(e,t){return fe("/attendance",{method:"POST",body:e},t)}function Aa(e,t){return fe(`/attendance/${e}`,{},t)}function Oh({token:e,currentUser:t}){const[n,r]=y.useState([]),[l,o]=y.useState(""),i=new Date().toISOString().slice(0,10),[s,a]=y.useState(()=>i),[u,h]=y.useState("Present"),[p,v]=y.useState([]),[w,S]=y.useState(!1),[x,E]=y.useState(""),f=(t==null?void 0:t.role)==="employee",c=y.useMemo(()=>p.some(g=>g.date===s),[p,s]);y.useEffect(()=>{if(f){o(String(t.id));return}yd(e).then(g=>{r(g),g.length>0&&o(String(g[0].id))}).catch(g=>E(g.message||"Failed to load employees for attendance"))},[f,e,t]),y.useEffect(()=>{l&&(S(!0),E(""),Aa(Number(l),e).then(v).catch(g=>E(g.message||"Failed to load attendance")).finally(()=>S(!1)))},[l]);const m=g=>{if(g.preventDefault(),!(!l||c)){if(s>i){E("You cannot mark attendance for a future date.");return}S(!0),E(""),Fh({employee_id:Number(l),date:s,status:u},e).then(()=>Aa(Number(l),e).then(v)).catch(k=>E(k.message||"Failed to mark attendance")).finally(()=>S(!1))}};return d.jsxs("div",{className:"grid gap-6 md:grid-cols-[minmax(0,1.2fr)_minmax(0,1fr)]",children:[d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Mark Attendance"}),d.jsxs("form",{onSubmit:m,className:"space-y-3",children:[f?d.jsx("div",{children:d.jsxs("p",{className:"text-sm text-slate-600",children:["Mark attendance for"," ",d.jsx("span",{className:"font-medium",children:t.full_name||t.username}),"."]})}):d.jsxs("div",{children:[d.jsx("label",{className:"block text-sm font-medium text-slate-700",children:"Employee"}),d.jsx("select",{value:l,onChange:g=>o(g.target.value),className:"mt-1 w-full rounded-lg border border-slate-300 bg-white px-3 py-2 text-sm text-slate-900 shadow-sm focus:border-sky-500 focus:outline-none focus:ring-1 focus:ring-sky-500",children:n.map(g=>{const k=g.first_name?`${g.first_name}${g.last_name?` ${g.last_name}`:""}`:g.full_name;return d.jsxs("option",{value:g.id,children:[k," (",g.employee_id,")"]},g.id)})})]}),d.jsxs("div",{className:"flex flex-col gap-3 sm:flex-row",children:[d.jsx("div",{className:"flex-1",children:d.jsx(te,{label:"Date",type:"date",name:"date",value:s,onChange:g=>a(g.target.value),className:"mt-1"})}),d.jsx("div",{className:"flex-1",children:d.jsxs(Nl,{label:"Status",name:"status",value:u,onChange:g=>h(g.target.value),children:[d.jsx("option",{value:"Present",children:"Present"}),d.jsx("option",{value:"Absent",children:"Absent"})]})})]}),d.jsx(Nn,{type:"submit",disabled:w||c,children:c?"Already marked for today":w?"Saving…":"Save"})]}),x&&d.jsx("div",{className:"mt-3 rounded-lg border border-red-200 bg-red-50 px-3 py-2 text-xs text-red-700",children:x})]}),d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Attendance History"}),w?d.jsx("p",{className:"text-sm text-slate-500",children:"Loading attendance…"}):p.length===0?d.jsx("p",{className:"text-sm text-slate-500",children:"No attendance records."}):d.jsx("div",{className:"overflow-x-auto",children:d.jsxs("table",{className:"min-w-full border-collapse text-sm",children:[d.jsx("thead",{children:d.jsxs("tr",{className:"bg-slate-50",children:[d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"ID"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Date"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Status"})]})}),d.jsx("tbody",{children:p.map(g=>d.jsxs("tr",{className:"border-t border-slate-100",children:[d.jsx("td",{className:"px-3 py-2 text-slate-700",children:g.id}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:g.date}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:g.status})]},g.id))})]})})]})]})}function Mh({token:e}){const[t,n]=y.useState([]),[r,l]=y.useState(!0),[o,i]=y.useState(""),[s,a]=y.useState(!1),[u,h]=y.useState(null),[p,v]=y.useState({username:"",email:"",role:"user",is_active:!0}),w=()=>{l(!0),i(""),Nh(e).then(n).catch(c=>i(c.message||"Failed to load users")).finally(()=>l(!1))};y.useEffect(()=>{w()},[e]);const S=c=>{const{name:m,value:g,type:k,checked:N}=c.target;v(_=>({..._,[m]:k==="checkbox"?N:g}))},x=c=>{h(c.id),v({username:c.username||"",email:c.email||"",role:c.role||"user",is_active:c.is_active??!0})},E=()=>{h(null),v({username:"",email:"",role:"user",is_active:!0})},f=async c=>{c.preventDefault(),a(!0),i("");try{u?await jh(e,u,{username:p.username,email:p.email,role:p.role,is_active:p.is_active}):await _h(e,{username:p.username,email:p.email,role:p.role,password:p.password}),E(),w()}catch(m){i(m.message||"Failed to save user")}finally{a(!1)}};return d.jsxs("div",{className:"grid gap-6 md:grid-cols-[minmax(0,1.5fr)_minmax(0,1fr)]",children:[d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Users"}),r?d.jsx("p",{className:"text-sm text-slate-500",children:"Loading users…"}):t.length===0?d.jsx("p",{className:"text-sm text-slate-500",children:"No users found."}):d.jsx("div",{className:"overflow-x-auto",children:d.jsxs("table",{className:"min-w-full border-collapse text-sm",children:[d.jsx("thead",{children:d.jsxs("tr",{className:"bg-slate-50",children:[d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Username"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Email"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Role"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Active"}),d.jsx("th",{className:"px-3 py-2"})]})}),d.jsx("tbody",{children:t.map(c=>d.jsxs("tr",{className:"border-t border-slate-100",children:[d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.username||"—"}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.email}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.role||"user"}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:c.is_active?"Yes":"No"}),d.jsx("td",{className:"px-3 py-2 text-right",children:d.jsx("button",{className:"inline-flex items-center rounded-full bg-slate-50 px-3 py-1 text-xs font-medium text-slate-700 hover:bg-slate-100",onClick:()=>x(c),children:"Edit"})})]},c.id))})]})}),o&&d.jsx("div",{className:"mt-3 rounded-lg border border-red-200 bg-red-50 px-3 py-2 text-xs text-red-700",children:o})]}),d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:u?"Edit User":"Add User"}),d.jsxs("form",{onSubmit:f,className:"space-y-3",children:[d.jsx(te,{label:"Username",name:"username",value:p.username,onChange:S,placeholder:"username"}),d.jsx(te,{label:"Email",type:"email",name:"email",value:p.email,onChange:S,placeholder:"user@example.com"}),!u&&d.jsx(te,{label:"Temporary password",type:"password",name:"password",value:p.password||"",onChange:S,placeholder:"Initial login password",withToggle:!0}),d.jsxs(Nl,{label:"Role",name:"role",value:p.role,onChange:S,children:[d.jsx("option",{value:"user",children:"User"}),d.jsx("option",{value:"admin",children:"Admin"})]}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("input",{id:"user-active",type:"checkbox",name:"is_active",checked:p.is_active,onChange:S,className:"h-4 w-4 rounded border-slate-300 text-sky-600 focus:ring-sky-500"}),d.jsx("label",{htmlFor:"user-active",className:"text-xs font-medium text-slate-700",children:"Active"})]}),d.jsxs("div",{className:"flex gap-2",children:[d.jsx(Nn,{type:"submit",disabled:s,children:s?"Saving…":u?"Update user":"Create user"}),u&&d.jsx("button",{type:"button",className:"inline-flex items-center rounded-lg border border-slate-300 bg-white px-3 py-2 text-xs font-medium text-slate-700 shadow-sm hover:bg-slate-50",onClick:E,children:"Cancel"})]})]})]})]})}function $h({token:e}){const[t,n]=y.useState([]),[r,l]=y.useState(!0),[o,i]=y.useState(""),[s,a]=y.useState(!1),[u,h]=y.useState(null),[p,v]=y.useState({name:"",is_active:!0}),w=()=>{l(!0),i(""),gd(e).then(n).catch(m=>i(m.message||"Failed to load departments")).finally(()=>l(!1))};y.useEffect(()=>{w()},[]);const S=()=>{h(null),v({name:"",is_active:!0})},x=m=>{h(m.id),v({name:m.name,is_active:m.is_active})},E=m=>{const{name:g,value:k,type:N,checked:_}=m.target;v(R=>({...R,[g]:N==="checkbox"?_:k}))},f=m=>{m.preventDefault(),a(!0),i("");const g={name:p.name,is_active:p.is_active};(u?zh(u,g,e):Th(g,e)).then(()=>{S(),w()}).catch(N=>i(N.message||"Failed to save department")).finally(()=>a(!1))},c=m=>{window.confirm("Delete this department?")&&Dh(m,e).then(()=>w()).catch(g=>i(g.message||"Failed to delete department"))};return d.jsxs("div",{className:"grid gap-6 md:grid-cols-[minmax(0,1.5fr)_minmax(0,1fr)]",children:[d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Departments"}),r?d.jsx("p",{className:"text-sm text-slate-500",children:"Loading departments…"}):t.length===0?d.jsx("p",{className:"text-sm text-slate-500",children:"No departments yet."}):d.jsx("div",{className:"overflow-x-auto",children:d.jsxs("table",{className:"min-w-full border-collapse text-sm",children:[d.jsx("thead",{children:d.jsxs("tr",{className:"bg-slate-50",children:[d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Name"}),d.jsx("th",{className:"px-3 py-2 text-left font-medium text-slate-600",children:"Status"}),d.jsx("th",{className:"px-3 py-2"})]})}),d.jsx("tbody",{children:t.map(m=>d.jsxs("tr",{className:"border-t border-slate-100",children:[d.jsx("td",{className:"px-3 py-2 text-slate-700",children:m.name}),d.jsx("td",{className:"px-3 py-2 text-slate-700",children:m.is_active?"Active":"Inactive"}),d.jsxs("td",{className:"px-3 py-2 text-right space-x-2",children:[d.jsx("button",{type:"button",className:"inline-flex items-center rounded-full bg-slate-50 px-3 py-1 text-xs font-medium text-slate-700 hover:bg-slate-100",onClick:()=>x(m),children:"Edit"}),d.jsx("button",{type:"button",className:"inline-flex items-center rounded-full bg-red-50 px-3 py-1 text-xs font-medium text-red-700 hover:bg-red-100",onClick:()=>c(m.id),children:"Delete"})]})]},m.id))})]})}),o&&d.jsx("div",{className:"mt-3 rounded-lg border border-red-200 bg-red-50 px-3 py-2 text-xs text-red-700",children:o})]}),d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:u?"Edit Department":"Add Department"}),d.jsxs("form",{onSubmit:f,className:"space-y-3",children:[d.jsx(te,{label:"Department name",name:"name",value:p.name,onChange:E,placeholder:"e.g. Development",required:!0}),d.jsxs("label",{className:"inline-flex items-center space-x-2 text-sm text-slate-700",children:[d.jsx("input",{type:"checkbox",name:"is_active",checked:p.is_active,onChange:E,className:"h-4 w-4 rounded border-slate-300 text-sky-600 focus:ring-sky-500"}),d.jsx("span",{children:"Active"})]}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx(Nn,{type:"submit",disabled:s,children:s?"Saving…":"Save"}),u&&d.jsx("button",{type:"button",className:"text-xs font-medium text-slate-600 hover:underline",onClick:S,children:"Cancel edit"})]})]})]})]})}function Uh({onLogin:e}){const[t,n]=y.useState(""),[r,l]=y.useState(""),o=i=>{i.preventDefault(),!(!t||!r)&&e(t,r)};return d.jsxs("form",{onSubmit:o,className:"space-y-4",children:[d.jsx(te,{label:"Username",name:"username",value:t,onChange:i=>n(i.target.value),placeholder:"Enter username or email",autoComplete:"username"}),d.jsx(te,{label:"Password",type:"password",name:"password",value:r,onChange:i=>l(i.target.value),placeholder:"Enter password",autoComplete:"current-password",withToggle:!0}),d.jsx(Nn,{type:"submit",children:"Login"})]})}function Ah({token:e,onSuccess:t}){const[n,r]=y.useState({current_password:"",new_password:"",confirm_new_password:""}),[l,o]=y.useState(!1),[i,s]=y.useState(""),a=h=>{const{name:p,value:v}=h.target;r(w=>({...w,[p]:v}))},u=async h=>{if(h.preventDefault(),s(""),n.new_password!==n.confirm_new_password){s("New password and confirmation do not match.");return}o(!0);try{await Rh(e,{current_password:n.current_password,new_password:n.new_password}),r({current_password:"",new_password:"",confirm_new_password:""}),t&&t()}catch(p){s(p.message||"Failed to change password")}finally{o(!1)}};return d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm",children:[d.jsx("h2",{className:"text-sm font-semibold text-slate-900 mb-3",children:"Change password"}),d.jsxs("form",{onSubmit:u,className:"space-y-3",children:[d.jsx(te,{label:"Current password",type:"password",name:"current_password",value:n.current_password,onChange:a,autoComplete:"current-password",withToggle:!0,size:"sm"}),d.jsxs("div",{className:"grid gap-3 sm:grid-cols-2",children:[d.jsx(te,{label:"New password",type:"password",name:"new_password",value:n.new_password,onChange:a,autoComplete:"new-password",withToggle:!0,size:"sm"}),d.jsx(te,{label:"Confirm new password",type:"password",name:"confirm_new_password",value:n.confirm_new_password,onChange:a,autoComplete:"new-password",withToggle:!0,size:"sm"})]}),d.jsx(Nn,{type:"submit",disabled:l,size:"sm",children:l?"Saving…":"Update password"})]}),i&&d.jsx("div",{className:"mt-2 rounded-lg border border-red-200 bg-red-50 px-3 py-1.5 text-xs text-red-700",children:i})]})}function Bh(){const[e,t]=y.useState(null),[n,r]=y.useState(null),[l,o]=y.useState(null),[i,s]=y.useState(!0),[a,u]=y.useState(""),[h,p]=y.useState(!1),v=ys(),w=(l==null?void 0:l.role)==="employee";y.useEffect(()=>{const f=window.localStorage.getItem("hrms_token"),c=window.localStorage.getItem("hrms_refresh_token"),m=window.localStorage.getItem("hrms_user");if(!f){s(!1);return}if(t(f),c&&r(c),m)try{const g=JSON.parse(m);o(g),s(!1);return}catch{window.localStorage.removeItem("hrms_user")}Ch(f).then(g=>{o(g),window.localStorage.setItem("hrms_user",JSON.stringify(g))}).catch(()=>{window.localStorage.removeItem("hrms_token"),window.localStorage.removeItem("hrms_refresh_token"),window.localStorage.removeItem("hrms_user"),t(null),r(null),o(null)}).finally(()=>s(!1))},[]);const S=async(f,c)=>{u("");try{const{access_token:m,refresh_token:g,user:k}=await Eh(f,c);window.localStorage.setItem("hrms_token",m),window.localStorage.setItem("hrms_refresh_token",g),window.localStorage.setItem("hrms_user",JSON.stringify(k)),t(m),r(g),o(k),v(k.role==="employee"?"/attendance":"/employees")}catch(m){u(m.message||"Login failed")}},x=()=>{window.localStorage.removeItem("hrms_token"),window.localStorage.removeItem("hrms_refresh_token"),window.localStorage.removeItem("hrms_user"),t(null),r(null),o(null)};if(i)return d.jsx("div",{className:"min-h-screen flex items-center justify-center bg-slate-50",children:d.jsx("div",{className:"rounded-xl border border-slate-200 bg-white px-8 py-6 shadow-sm",children:d.jsx("p",{className:"text-slate-600 text-sm",children:"Loading your workspace…"})})});if(!e||!l)return d.jsxs(Ma,{children:[d.jsx(De,{path:"/login",element:d.jsx("div",{className:"min-h-screen bg-slate-50 flex items-center justify-center px-4",children:d.jsxs("div",{className:"w-full max-w-5xl",children:[d.jsxs("header",{className:"mb-8 text-center",children:[d.jsx("h1",{className:"text-3xl font-semibold text-slate-900",children:"HRMS Lite"}),d.jsx("p",{className:"mt-2 text-sm text-slate-500",children:"Simple HR management for employees and attendance."})]}),d.jsxs("div",{className:"max-w-md mx-auto rounded-xl border border-slate-200 bg-white p-6 shadow-sm",children:[d.jsx("h2",{className:"text-lg font-semibold text-slate-900 mb-4",children:"Login"}),d.jsx(Uh,{onLogin:S}),a&&d.jsx("div",{className:"mt-4 rounded-lg border border-red-200 bg-red-50 px-3 py-2 text-xs text-red-700",children:a})]})]})})}),d.jsx(De,{path:"*",element:d.jsx(Kt,{to:"/login",replace:!0})})]});const E=w?[{id:"attendance",label:"Attendance"}]:[{id:"employees",label:"Employees"},{id:"attendance",label:"Attendance"},{id:"users",label:"Users"},{id:"departments",label:"Departments"}];return d.jsx("div",{className:"min-h-screen bg-slate-50",children:d.jsxs("div",{className:"flex min-h-screen",children:[d.jsxs("aside",{className:"hidden w-64 flex-shrink-0 flex-col border-r border-slate-200 bg-white px-4 py-6 shadow-sm md:flex",children:[d.jsxs("div",{className:"mb-6",children:[d.jsx("h1",{className:"text-xl font-semibold text-slate-900",children:"HRMS Lite"}),d.jsxs("p",{className:"mt-1 text-xs text-slate-500",children:["Signed in as"," ",d.jsx("span",{className:"font-medium text-slate-800",children:l.full_name||l.username||l.email})]}),l.role&&d.jsx("p",{className:"mt-1",children:d.jsx("span",{className:"inline-flex rounded-full bg-slate-100 px-2 py-0.5 text-[10px] font-medium uppercase tracking-wide text-slate-600",children:l.role})})]}),d.jsx("nav",{className:"flex-1 space-y-1",children:E.map(f=>d.jsx(wi,{to:"/"+f.id,className:({isActive:c})=>`flex w-full items-center rounded-lg px-3 py-2 text-sm font-medium ${c?"bg-sky-600 text-white shadow-sm":"text-slate-700 hover:bg-slate-100"}`,children:f.label},f.id))}),d.jsx("button",{className:"mt-4 inline-flex items-center justify-center rounded-lg border border-slate-300 bg-white px-3 py-1.5 text-xs font-medium text-slate-700 shadow-sm hover:bg-slate-50",onClick:x,children:"Logout"})]}),d.jsxs("div",{className:"flex min-h-screen flex-1 flex-col px-4 py-6 md:px-6",children:[d.jsxs("header",{className:"mb-4 flex flex-col gap-2 border-b border-slate-200 pb-3 md:flex-row md:items-center md:justify-between",children:[d.jsxs("div",{className:"md:hidden",children:[d.jsx("h1",{className:"text-2xl font-semibold text-slate-900",children:"HRMS Lite"}),d.jsxs("p",{className:"mt-1 text-sm text-slate-500",children:["Signed in as"," ",d.jsx("span",{className:"font-medium text-slate-800",children:l.full_name||l.username||l.email}),l.role&&d.jsx("span",{className:"ml-2 inline-flex rounded-full bg-slate-100 px-2 py-0.5 text-xs font-medium uppercase tracking-wide text-slate-600",children:l.role})]})]}),d.jsx("nav",{className:"flex flex-wrap gap-2 md:hidden",children:E.map(f=>d.jsx(wi,{to:"/"+f.id,className:({isActive:c})=>`inline-flex items-center rounded-full px-4 py-1.5 text-sm font-medium ${c?"bg-sky-600 text-white shadow-sm":"bg-white text-slate-700 border border-slate-200 hover:bg-slate-50"}`,children:f.label},f.id))}),d.jsx("div",{className:"hidden md:flex items-center gap-3 ml-auto",children:d.jsxs("div",{className:"relative",children:[d.jsxs("button",{type:"button",className:"inline-flex items-center rounded-full bg-white px-3 py-1.5 text-sm font-medium text-slate-700 border border-slate-300 shadow-sm hover:bg-slate-50",onClick:()=>p(f=>!f),children:[d.jsx("span",{className:"mr-2",children:l.full_name||l.username||l.email}),d.jsx("svg",{className:`h-4 w-4 text-slate-500 transition-transform ${h?"rotate-180":""}`,viewBox:"0 0 20 20",fill:"currentColor","aria-hidden":"true",children:d.jsx("path",{fillRule:"evenodd",d:"M5.23 7.21a.75.75 0 011.06.02L10 11.17l3.71-3.94a.75.75 0 111.08 1.04l-4.25 4.5a.75.75 0 01-1.08 0l-4.25-4.5a.75.75 0 01.02-1.06z",clipRule:"evenodd"})})]}),h&&d.jsxs("div",{className:"absolute right-0 z-20 mt-2 w-44 rounded-lg border border-slate-200 bg-white py-1 text-sm shadow-lg",children:[d.jsx("button",{className:"block w-full px-3 py-1.5 text-left text-slate-700 hover:bg-slate-50",onClick:()=>{v("/profile"),p(!1)},children:"Profile"}),d.jsx("button",{className:"block w-full px-3 py-1.5 text-left text-slate-700 hover:bg-slate-50",onClick:()=>{v("/change-password"),p(!1)},children:"Change password"}),d.jsx("button",{className:"block w-full px-3 py-1.5 text-left text-red-600 hover:bg-red-50",onClick:()=>{p(!1),x()},children:"Logout"})]})]})}),d.jsx("button",{className:"inline-flex items-center justify-center rounded-full border border-slate-300 bg-white px-4 py-1.5 text-sm font-medium text-slate-700 shadow-sm hover:bg-slate-50 md:hidden",onClick:x,children:"Logout"})]}),a&&d.jsx("div",{className:"mb-4 rounded-lg border border-red-200 bg-red-50 px-4 py-2 text-sm text-red-700",children:a}),d.jsx("main",{className:"flex-1 space-y-4",children:d.jsxs(Ma,{children:[d.jsx(De,{path:"/",element:d.jsx(Kt,{to:w?"/attendance":"/employees",replace:!0})}),d.jsx(De,{path:"/employees",element:w?d.jsx(Kt,{to:"/attendance",replace:!0}):d.jsx(Ih,{token:e})}),d.jsx(De,{path:"/attendance",element:d.jsx(Oh,{token:e,currentUser:l})}),d.jsx(De,{path:"/users",element:w?d.jsx(Kt,{to:"/attendance",replace:!0}):d.jsx(Mh,{token:e})}),d.jsx(De,{path:"/departments",element:w?d.jsx(Kt,{to:"/attendance",replace:!0}):d.jsx($h,{token:e})}),d.jsx(De,{path:"/profile",element:d.jsxs("div",{className:"rounded-xl border border-slate-200 bg-white p-4 shadow-sm max-w-xl",children:[d.jsx("h2",{className:"text-base font-semibold text-slate-900 mb-3",children:"Profile"}),d.jsxs("dl",{className:"space-y-2 text-sm text-slate-700",children:[d.jsxs("div",{className:"flex justify-between",children:[d.jsx("dt",{className:"font-medium text-slate-500",children:"Name"}),d.jsx("dd",{children:l.full_name||l.username||l.email})]}),d.jsxs("div",{className:"flex justify-between",children:[d.jsx("dt",{className:"font-medium text-slate-500",children:"Email"}),d.jsx("dd",{children:l.email})]}),l.employee_id&&d.jsxs("div",{className:"flex justify-between",children:[d.jsx("dt",{className:"font-medium text-slate-500",children:"Employee ID"}),d.jsx("dd",{children:l.employee_id})]}),l.department&&d.jsxs("div",{className:"flex justify-between",children:[d.jsx("dt",{className:"font-medium text-slate-500",children:"Department"}),d.jsx("dd",{children:l.department})]}),l.role&&d.jsxs("div",{className:"flex justify-between",children:[d.jsx("dt",{className:"font-medium text-slate-500",children:"Role"}),d.jsx("dd",{children:l.role})]})]})]})}),d.jsx(De,{path:"/change-password",element:d.jsx(Ah,{token:e,onSuccess:()=>u("")})}),d.jsx(De,{path:"*",element:d.jsx(Kt,{to:"/",replace:!0})})]})})]})]})})}No.createRoot(document.getElementById("root")).render(d.jsx(Fd.StrictMode,{children:d.jsx(ph,{children:d.jsx(Bh,{})})}));
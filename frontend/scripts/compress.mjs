@@ -0,0 +1,39 @@
+// Write .br and .gz siblings for every compressible file in dist/ so the
+// backend can serve them without compressing per request.
+import { readdirSync, readFileSync, statSync, writeFileSync } from "node:fs";
+import { join, extname } from "node:path";
+import { fileURLToPath } from "node:url";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+
+// fileURLToPath decodes %20 etc. and drops the leading slash on Windows.
+const DIST = fileURLToPath(new URL("../dist/", import.meta.url));
+const COMPRESSIBLE = new Set([".js", ".css", ".html", ".svg", ".json", ".txt", ".map"]);
+// Smaller files gain nothing worth the extra request negotiation.
+const MIN_BYTES = 1024;
+
+function* walk(dir) {
+  for (const name of readdirSync(dir)) {
+    const path = join(dir, name);
+    if (statSync(path).isDirectory()) {
+      yield* walk(path);
+    } else {
+      yield path;
+    }
+  }
+}
+
+for (const file of walk(DIST)) {
+  if (!COMPRESSIBLE.has(extname(file))) continue;
+  const body = readFileSync(file);
+  if (body.length < MIN_BYTES) continue;
+  writeFileSync(
+    `${file}.br`,
+    brotliCompressSync(body, {
+      params: {
+        [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+        [constants.BROTLI_PARAM_SIZE_HINT]: body.length,
+      },
+    }),
+  );
+  writeFileSync(`${file}.gz`, gzipSync(body, { level: 9 }));
+}
@@ -410,7 +410,11 @@ function App() {
                 element={
                   <ChangePasswordForm
                     token={token}
-                    onSuccess={() => setError("")}
+                    onSuccess={(result) => {
+                      setError("");
+                      setToken(result.access_token);
+                      setRefreshToken(result.refresh_token);
+                    }}
                   />
                 }
               />
@@ -1,10 +1,22 @@
 import { request } from "./httpClient";
 
+export const ATTENDANCE_PAGE_SIZE = 100;
+
 export function markAttendance(data, token) {
   return request("/attendance", { method: "POST", body: data }, token);
 }
 
-export function getAttendanceForEmployee(employeeId, token) {
-  return request(`/attendance/${employeeId}`, {}, token);
+// Fetch one page of an employee's attendance ordered by date:
+// `{ items, next_cursor }`. `range` may carry `from` / `to` (YYYY-MM-DD);
+// pass the previous page's `next_cursor` as `after` to continue.
+export function getAttendancePage(
+  employeeId,
+  token,
+  { after = null, limit = ATTENDANCE_PAGE_SIZE, ...range } = {},
+) {
+  const params = new URLSearchParams({ ...range, limit: String(limit) });
+  if (after !== null) {
+    params.set("after", after);
+  }
+  return request(`/attendance/${employeeId}?${params.toString()}`, {}, token);
 }
-
@@ -23,8 +23,17 @@ export async function updateUser(token, id, data) {
   return request(`/auth/users/${id}`, { method: "PUT", body: data }, token);
 }
 
+// Changing the password revokes existing tokens; persist the fresh pair
+// returned for this session.
 export async function changePassword(token, data) {
-  return request("/auth/change-password", { method: "POST", body: data }, token);
+  const result = await request(
+    "/auth/change-password",
+    { method: "POST", body: data },
+    token,
+  );
+  window.localStorage.setItem("hrms_token", result.access_token);
+  window.localStorage.setItem("hrms_refresh_token", result.refresh_token);
+  return result;
 }
 
 export async function refresh(refreshToken) {
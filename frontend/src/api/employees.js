@@ -1,7 +1,23 @@
 import { request } from "./httpClient";
 
-export function listEmployees(token) {
-  return request("/employees/", {}, token);
+export const EMPLOYEE_PAGE_SIZE = 50;
+
+// Fetch one keyset page of employees ordered by id: `{ items, next_cursor,
+// total }`. Pass the previous page's `next_cursor` as `after` to continue;
+// `total` is only counted on the first page.
+export function listEmployeesPage(
+  token,
+  { after = null, limit = EMPLOYEE_PAGE_SIZE, ...filters } = {},
+) {
+  const params = new URLSearchParams({
+    ...filters,
+    limit: String(limit),
+    include_total: after === null ? "true" : "false",
+  });
+  if (after !== null) {
+    params.set("after", String(after));
+  }
+  return request(`/employees/?${params.toString()}`, {}, token);
 }
 
 export function createEmployee(data, token) {
@@ -11,4 +27,3 @@ export function createEmployee(data, token) {
 export function deleteEmployee(id, token) {
   return request(`/employees/${id}`, { method: "DELETE" }, token);
 }
-
@@ -1,21 +1,34 @@
 import React, { useEffect, useMemo, useState } from "react";
-import { listEmployees } from "../api/employees";
-import {
-  getAttendanceForEmployee,
-  markAttendance,
-} from "../api/attendance";
+import { listEmployeesPage } from "../api/employees";
+import { getAttendancePage, markAttendance } from "../api/attendance";
 import InputField from "./ui/InputField";
 import SelectField from "./ui/SelectField";
 import PrimaryButton from "./ui/PrimaryButton";
 
+// First and last day (YYYY-MM-DD) of the month `offset` months from the
+// month containing `day`.
+function monthWindow(day, offset = 0) {
+  const [year, month] = day.split("-").map(Number);
+  const first = new Date(Date.UTC(year, month - 1 + offset, 1));
+  const last = new Date(Date.UTC(year, month + offset, 0));
+  return {
+    from: first.toISOString().slice(0, 10),
+    to: last.toISOString().slice(0, 10),
+  };
+}
+
 function AttendancePanel({ token, currentUser }) {
   const [employees, setEmployees] = useState([]);
+  const [employeesCursor, setEmployeesCursor] = useState(null);
   const [selectedEmployeeId, setSelectedEmployeeId] = useState("");
   const todayString = new Date().toISOString().slice(0, 10);
   const [date, setDate] = useState(() => todayString);
   const [status, setStatus] = useState("Present");
   const [attendance, setAttendance] = useState([]);
+  // Months loaded so far, counted back from the selected date's month.
+  const [monthsLoaded, setMonthsLoaded] = useState(1);
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState("");
 
   const isEmployee = currentUser?.role === "employee";
@@ -25,18 +38,19 @@ function AttendancePanel({ token, currentUser }) {
     [attendance, date],
   );
 
-  // Admin/user: load all employees and allow selection.
+  // Admin/user: load the first page of employees and allow selection.
   useEffect(() => {
     if (isEmployee) {
       setSelectedEmployeeId(String(currentUser.id));
       return;
     }
 
-    listEmployees(token)
-      .then((emps) => {
-        setEmployees(emps);
-        if (emps.length > 0) {
-          setSelectedEmployeeId(String(emps[0].id));
+    listEmployeesPage(token)
+      .then((page) => {
+        setEmployees(page.items);
+        setEmployeesCursor(page.next_cursor ?? null);
+        if (page.items.length > 0) {
+          setSelectedEmployeeId(String(page.items[0].id));
         }
       })
       .catch((err) =>
@@ -44,17 +58,58 @@ function AttendancePanel({ token, currentUser }) {
       );
   }, [isEmployee, token, currentUser]);
 
+  const loadMoreEmployees = () => {
+    listEmployeesPage(token, { after: employeesCursor })
+      .then((page) => {
+        setEmployees((prev) => [...prev, ...page.items]);
+        setEmployeesCursor(page.next_cursor ?? null);
+      })
+      .catch((err) =>
+        setError(err.message || "Failed to load employees for attendance"),
+      );
+  };
+
+  const selectedMonth = date.slice(0, 7);
+
+  // Load the month containing the selected date; a month always fits in
+  // one page, and todayAlreadyMarked only needs that month.
+  const loadAttendance = () =>
+    getAttendancePage(
+      Number(selectedEmployeeId),
+      token,
+      monthWindow(date),
+    ).then((page) => {
+      setAttendance(page.items);
+      setMonthsLoaded(1);
+    });
+
+  // Prepend the month before the oldest one loaded.
+  const loadMoreAttendance = () => {
+    setLoadingMore(true);
+    setError("");
+    getAttendancePage(
+      Number(selectedEmployeeId),
+      token,
+      monthWindow(date, -monthsLoaded),
+    )
+      .then((page) => {
+        setAttendance((prev) => [...page.items, ...prev]);
+        setMonthsLoaded((n) => n + 1);
+      })
+      .catch((err) => setError(err.message || "Failed to load attendance"))
+      .finally(() => setLoadingMore(false));
+  };
+
   useEffect(() => {
     if (!selectedEmployeeId) return;
     setLoading(true);
     setError("");
-    getAttendanceForEmployee(Number(selectedEmployeeId), token)
-      .then(setAttendance)
+    loadAttendance()
       .catch((err) =>
         setError(err.message || "Failed to load attendance")
       )
       .finally(() => setLoading(false));
-  }, [selectedEmployeeId]);
+  }, [selectedEmployeeId, selectedMonth]);
 
   const handleMark = (e) => {
     e.preventDefault();
@@ -75,11 +130,7 @@ function AttendancePanel({ token, currentUser }) {
       },
       token
     )
-      .then(() =>
-        getAttendanceForEmployee(Number(selectedEmployeeId), token).then(
-          setAttendance
-        )
-      )
+      .then(() => loadAttendance())
       .catch((err) =>
         setError(err.message || "Failed to mark attendance")
       )
@@ -124,6 +175,15 @@ function AttendancePanel({ token, currentUser }) {
                   );
                 })}
               </select>
+              {employeesCursor !== null && (
+                <button
+                  type="button"
+                  className="mt-1 text-xs font-medium text-sky-700 hover:text-sky-800"
+                  onClick={loadMoreEmployees}
+                >
+                  Load more employees
+                </button>
+              )}
             </div>
           )}
           <div className="flex flex-col gap-3 sm:flex-row">
@@ -170,10 +230,11 @@ function AttendancePanel({ token, currentUser }) {
         </h2>
         {loading ? (
           <p className="text-sm text-slate-500">Loading attendance…</p>
-        ) : attendance.length === 0 ? (
-          <p className="text-sm text-slate-500">No attendance records.</p>
         ) : (
           <div className="overflow-x-auto">
+            {attendance.length === 0 && (
+              <p className="text-sm text-slate-500">No attendance records.</p>
+            )}
             <table className="min-w-full border-collapse text-sm">
               <thead>
                 <tr className="bg-slate-50">
@@ -198,6 +259,15 @@ function AttendancePanel({ token, currentUser }) {
                 ))}
               </tbody>
             </table>
+            <div className="mt-3 text-right">
+              <button
+                className="inline-flex items-center rounded-full bg-slate-100 px-3 py-1 text-xs font-medium text-slate-700 hover:bg-slate-200 disabled:opacity-60"
+                onClick={loadMoreAttendance}
+                disabled={loadingMore}
+              >
+                {loadingMore ? "Loading…" : "Load earlier month"}
+              </button>
+            </div>
           </div>
         )}
       </div>
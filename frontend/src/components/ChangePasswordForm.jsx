@@ -28,7 +28,7 @@ function ChangePasswordForm({ token, onSuccess }) {
 
     setSaving(true);
     try {
-      await changePassword(token, {
+      const result = await changePassword(token, {
         current_password: form.current_password,
         new_password: form.new_password,
       });
@@ -38,7 +38,7 @@ function ChangePasswordForm({ token, onSuccess }) {
         confirm_new_password: "",
       });
       if (onSuccess) {
-        onSuccess();
+        onSuccess(result);
       }
     } catch (err) {
       setError(err.message || "Failed to change password");
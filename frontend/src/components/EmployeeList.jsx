@@ -2,7 +2,7 @@ import React, { useEffect, useState } from "react";
 import {
   createEmployee,
   deleteEmployee,
-  listEmployees,
+  listEmployeesPage,
 } from "../api/employees";
 import { listDepartments } from "../api/departments";
 import InputField from "./ui/InputField";
@@ -11,7 +11,11 @@ import PrimaryButton from "./ui/PrimaryButton";
 
 function EmployeeList({ token }) {
   const [employees, setEmployees] = useState([]);
+  // Keyset cursor of the next page (null once every page is shown).
+  const [nextCursor, setNextCursor] = useState(null);
+  const [total, setTotal] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [departments, setDepartments] = useState([]);
   const [form, setForm] = useState({
     first_name: "",
@@ -27,31 +31,31 @@ function EmployeeList({ token }) {
   const [saving, setSaving] = useState(false);
   const [error, setError] = useState("");
 
-  const generateNextEmployeeId = (existingEmployees) => {
-    if (!existingEmployees || existingEmployees.length === 0) {
-      return "EMP-0001";
-    }
-
-    const maxNumber = existingEmployees.reduce((max, e) => {
-      const match = typeof e.employee_id === "string" && e.employee_id.match(/^EMP-(\d+)$/);
-      if (!match) return max;
-      const num = parseInt(match[1], 10);
-      return Number.isNaN(num) ? max : Math.max(max, num);
-    }, 0);
-
-    const next = maxNumber + 1;
-    return `EMP-${String(next).padStart(4, "0")}`;
-  };
-
   const loadEmployees = () => {
     setLoading(true);
     setError("");
-    listEmployees(token)
-      .then(setEmployees)
+    listEmployeesPage(token)
+      .then((page) => {
+        setEmployees(page.items);
+        setNextCursor(page.next_cursor ?? null);
+        setTotal(page.total ?? null);
+      })
       .catch((err) => setError(err.message || "Failed to load employees"))
       .finally(() => setLoading(false));
   };
 
+  const loadMoreEmployees = () => {
+    setLoadingMore(true);
+    setError("");
+    listEmployeesPage(token, { after: nextCursor })
+      .then((page) => {
+        setEmployees((prev) => [...prev, ...page.items]);
+        setNextCursor(page.next_cursor ?? null);
+      })
+      .catch((err) => setError(err.message || "Failed to load employees"))
+      .finally(() => setLoadingMore(false));
+  };
+
   useEffect(() => {
     loadEmployees();
     // Load departments for the dropdown; fall back to defaults if none.
@@ -79,10 +83,8 @@ function EmployeeList({ token }) {
     e.preventDefault();
     setSaving(true);
     setError("");
-    // Generate a sequential employee_id like EMP-0001, EMP-0002, ...
-    const generatedId = generateNextEmployeeId(employees);
-    const payload = { employee_id: generatedId, ...form };
-    createEmployee(payload, token)
+    // No employee_id: the server assigns the next EMP-0001, EMP-0002, ...
+    createEmployee(form, token)
       .then(() => {
         setForm({
           first_name: "",
@@ -169,6 +171,21 @@ function EmployeeList({ token }) {
                 ))}
               </tbody>
             </table>
+            <div className="mt-3 flex items-center justify-between text-xs text-slate-500">
+              <span>
+                Showing {employees.length}
+                {total !== null ? ` of ${total}` : ""} employees
+              </span>
+              {nextCursor !== null && (
+                <button
+                  className="inline-flex items-center rounded-full bg-slate-100 px-3 py-1 font-medium text-slate-700 hover:bg-slate-200 disabled:opacity-60"
+                  onClick={loadMoreEmployees}
+                  disabled={loadingMore}
+                >
+                  {loadingMore ? "Loading…" : "Load more"}
+                </button>
+              )}
+            </div>
           </div>
         )}
         {error && (
@@ -0,0 +1,88 @@
+"""
+Shared fixtures: the app served by TestClient on a fresh SQLite database
+migrated to head, with the seeded admin logged in.
+"""
+
+import itertools
+import os
+import tempfile
+from pathlib import Path
+
+# Settings (and the engines) are built at import time, so the environment
+# must be in place before anything from `app` is imported.
+_DB_DIR = tempfile.mkdtemp(prefix="hrms-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ["DATABASE_REPLICA_URLS"] = ""
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["ASYNC_DB_ENABLED"] = "false"
+os.environ["INIT_DB_ON_STARTUP"] = "false"
+
+import pytest  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+_assigned_codes = itertools.count(1)
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "admin123"
+
+
+@pytest.fixture(scope="session")
+def client():
+    config = Config(str(ROOT_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT_DIR / "alembic"))
+    command.upgrade(config, "head")
+
+    from app.database.seeder import seed_initial_admin
+    from app.main import app
+
+    seed_initial_admin(username=ADMIN_USERNAME, password=ADMIN_PASSWORD)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def login_headers(client, username, password):
+    response = client.post(
+        "/api/v1/auth/login", json={"username": username, "password": password}
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def create_employee(client, employee_id, department="Engineering", **fields):
+    """
+    Create an employee through the API and return its JSON; the email is
+    derived from `employee_id` (or a counter when the server assigns it) and
+    the password is "secret123".
+    """
+    name = employee_id or f"assigned{next(_assigned_codes)}"
+    payload = {
+        "employee_id": employee_id,
+        "first_name": "Test",
+        "last_name": name,
+        "email": f"{name.lower()}@example.com",
+        "department": department,
+        "password": "secret123",
+    }
+    payload.update(fields)
+    response = client.post("/api/v1/employees/", json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def mark_attendance(client, employee_id, day, status="Present"):
+    """
+    Mark attendance through the API and return the response.
+    """
+    return client.post(
+        "/api/v1/attendance",
+        json={"employee_id": employee_id, "date": day, "status": status},
+    )
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    return login_headers(client, ADMIN_USERNAME, ADMIN_PASSWORD)
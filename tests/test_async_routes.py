@@ -0,0 +1,51 @@
+"""
+The ASYNC_DB_ENABLED routes, served from an aiosqlite AsyncSession on the
+test database.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.async_router import router as async_router
+from app.database.async_session import dispose_async_engine
+from tests.conftest import create_employee
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(client):
+    # Mounted the way app.api.router does when ASYNC_DB_ENABLED is set.
+    app = FastAPI()
+    app.include_router(async_router, prefix="/api/v1")
+    with TestClient(app) as test_client:
+        yield test_client
+        # Pooled aiosqlite connections belong to this client's event loop.
+        test_client.portal.call(dispose_async_engine)
+
+
+def test_async_employee_list(client, async_client):
+    employee = create_employee(client, "ASY0001", department="Async")
+    response = async_client.get("/api/v1/employees/?department=Async")
+    assert response.status_code == 200, response.text
+    page = response.json()
+    assert [row["employee_id"] for row in page["items"]] == ["ASY0001"]
+    assert page["items"][0]["id"] == employee["id"]
+    assert page["total"] == 1
+    assert response.headers["ETag"].startswith('W/"employees-')
+
+
+def test_async_mark_attendance(client, async_client):
+    employee_id = create_employee(client, "ASY0002")["id"]
+    mark = {"employee_id": employee_id, "date": "2026-06-01", "status": "Present"}
+    response = async_client.post("/api/v1/attendance", json=mark)
+    assert response.status_code == 201, response.text
+    assert response.json()["status"] == "Present"
+    assert async_client.post("/api/v1/attendance", json=mark).status_code == 409
+
+    # Committed: the sync stack reads it back.
+    response = client.get(f"/api/v1/attendance/{employee_id}")
+    assert [(row["date"], row["status"]) for row in response.json()["items"]] == [
+        ("2026-06-01", "Present")
+    ]
@@ -0,0 +1,79 @@
+"""
+Attendance marking: duplicates and upserts, bulk per-row results.
+"""
+
+from app.config import get_settings
+from tests.conftest import create_employee, mark_attendance
+
+
+def _history(client, employee_id):
+    response = client.get(
+        f"/api/v1/attendance/{employee_id}?from=2026-03-01&to=2026-03-31"
+    )
+    return [(row["date"], row["status"]) for row in response.json()["items"]]
+
+
+def test_duplicate_mark_conflicts(client):
+    employee_id = create_employee(client, "UPS0001")["id"]
+    assert mark_attendance(client, employee_id, "2026-03-09", "Present").status_code == 201
+    assert mark_attendance(client, employee_id, "2026-03-09", "Absent").status_code == 409
+    assert _history(client, employee_id) == [("2026-03-09", "Present")]
+
+
+def test_upsert_overwrites_status(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "attendance_upsert", True)
+    employee_id = create_employee(client, "UPS0002")["id"]
+    assert mark_attendance(client, employee_id, "2026-03-09", "Present").status_code == 201
+    response = mark_attendance(client, employee_id, "2026-03-09", "Absent")
+    assert response.status_code == 201, response.text
+    assert response.json()["status"] == "Absent"
+
+    response = client.post(
+        "/api/v1/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": employee_id, "date": "2026-03-09", "status": "Present"}
+            ]
+        },
+    )
+    assert [row["result"] for row in response.json()["results"]] == ["updated"]
+    assert _history(client, employee_id) == [("2026-03-09", "Present")]
+
+
+def test_bulk_mark_reports_each_row(client):
+    first = create_employee(client, "BLK0001", department="Bulk")["id"]
+    second = create_employee(client, "BLK0002", department="Bulk")["id"]
+    assert mark_attendance(client, first, "2026-03-02", "Present").status_code == 201
+
+    response = client.post(
+        "/api/v1/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": first, "date": "2026-03-02", "status": "Absent"},
+                {"employee_id": first, "date": "2026-03-03", "status": "Present"},
+                {"employee_id": 999999, "date": "2026-03-03", "status": "Present"},
+                {"employee_id": second, "date": "2026-03-03", "status": "Late"},
+            ],
+            "department": "Bulk",
+            "date": "2026-03-04",
+            "status": "Absent",
+        },
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [(row["employee_id"], row["date"], row["result"]) for row in body["results"]] == [
+        (first, "2026-03-02", "duplicate"),
+        (first, "2026-03-03", "created"),
+        (999999, "2026-03-03", "employee_not_found"),
+        (second, "2026-03-03", "invalid_status"),
+        (first, "2026-03-04", "created"),
+        (second, "2026-03-04", "created"),
+    ]
+    assert body["created"] == 3
+
+    assert _history(client, second) == [("2026-03-04", "Absent")]
+
+
+def test_bulk_department_needs_date(client):
+    response = client.post("/api/v1/attendance/bulk", json={"department": "Bulk"})
+    assert response.status_code == 422
@@ -0,0 +1,48 @@
+"""
+Archived days stay readable but can no longer be marked.
+"""
+
+from tests.conftest import create_employee, mark_attendance
+
+
+def test_archived_days_are_read_but_closed(client, admin_headers):
+    employee_id = create_employee(client, "ARC0001")["id"]
+    for day in ("2023-06-01", "2023-06-02"):
+        response = mark_attendance(client, employee_id, day)
+        assert response.status_code == 201, response.text
+
+    response = client.post(
+        "/api/v1/attendance/archive?before=2023-07-01", headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["archived"] >= 2
+    assert response.json()["complete"] is True
+
+    response = client.get(
+        f"/api/v1/attendance/{employee_id}?from=2023-06-01&to=2023-06-30"
+    )
+    assert [row["date"] for row in response.json()["items"]] == [
+        "2023-06-01",
+        "2023-06-02",
+    ]
+
+    response = mark_attendance(client, employee_id, "2023-06-03", "Absent")
+    assert response.status_code == 409
+
+    response = client.post(
+        "/api/v1/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": employee_id, "date": "2023-06-03", "status": "Absent"}
+            ]
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert [row["result"] for row in response.json()["results"]] == ["archived"]
+
+
+def test_archive_rejects_recent_days(client, admin_headers):
+    response = client.post(
+        "/api/v1/attendance/archive?before=2999-01-01", headers=admin_headers
+    )
+    assert response.status_code == 422
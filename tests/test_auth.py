@@ -0,0 +1,51 @@
+"""
+Access tokens are checked against the user's token_version, so changing
+the password revokes every token issued before. Logins are shed with 503
+when the password hashing queue is full.
+"""
+
+from app.service.password_hasher import password_hasher
+from tests.conftest import (
+    ADMIN_PASSWORD,
+    ADMIN_USERNAME,
+    create_employee,
+    login_headers,
+)
+
+
+def test_password_change_revokes_old_tokens(client):
+    email = create_employee(client, "TOK0001")["email"]
+    response = client.post(
+        "/api/v1/auth/login", json={"username": email, "password": "secret123"}
+    )
+    assert response.status_code == 200, response.text
+    old_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    old_refresh = response.json()["refresh_token"]
+    assert client.get("/api/v1/auth/me", headers=old_headers).status_code == 200
+
+    response = client.post(
+        "/api/v1/auth/change-password",
+        json={"current_password": "secret123", "new_password": "secret456"},
+        headers=old_headers,
+    )
+    assert response.status_code == 200, response.text
+    new_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    assert client.get("/api/v1/auth/me", headers=old_headers).status_code == 401
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": old_refresh})
+    assert response.status_code == 401
+    assert client.get("/api/v1/auth/me", headers=new_headers).status_code == 200
+    login_headers(client, email, "secret456")
+
+
+def test_login_returns_503_when_hash_queue_is_full(client, monkeypatch):
+    monkeypatch.setattr(password_hasher, "max_pending", 2)
+    monkeypatch.setattr(password_hasher, "_pending", 2)
+    credentials = {"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}
+
+    response = client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    monkeypatch.setattr(password_hasher, "_pending", 1)
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 200
@@ -0,0 +1,69 @@
+"""
+The read cache: LRU/TTL behaviour of the memory backend, and writers
+invalidating what readers cached.
+"""
+
+import time
+
+from app.utils.cache import MemoryBackend
+from tests.conftest import create_employee, login_headers
+
+
+def test_memory_backend_evicts_least_recently_used_and_expired():
+    backend = MemoryBackend(maxsize=2)
+    backend.set("a", 1, ttl=60)
+    backend.set("b", 2, ttl=60)
+    assert backend.get("a") == 1  # "b" is now the least recently used
+    backend.set("c", 3, ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+
+    backend.set("short", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert backend.get("short") is None
+
+
+def test_current_user_is_cached_until_updated(client, admin_headers, query_budget):
+    response = client.post(
+        "/api/v1/auth/users",
+        json={
+            "username": "cached",
+            "email": "cached@example.com",
+            "password": "secret123",
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 201, response.text
+    user_id = response.json()["id"]
+    headers = login_headers(client, "cached", "secret123")
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    with query_budget(0):
+        response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.json()["email"] == "cached@example.com"
+
+    response = client.put(
+        f"/api/v1/auth/users/{user_id}",
+        json={"email": "renamed@example.com"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.json()["email"] == "renamed@example.com"
+
+
+def test_employee_lookup_cached_until_deleted(client, admin_headers, query_budget):
+    employee = create_employee(client, "CACHE01")
+    by_id = f"/api/v1/employees/{employee['id']}"
+    by_code = "/api/v1/employees/by-code/CACHE01"
+    assert client.get(by_id).json() == employee
+    assert client.get(by_code).json() == employee
+
+    with query_budget(0):
+        assert client.get(by_id).json() == employee
+        assert client.get(by_code).json() == employee
+
+    response = client.delete(by_id, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert client.get(by_id).status_code == 404
+    assert client.get(by_code).status_code == 404
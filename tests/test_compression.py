@@ -0,0 +1,137 @@
+"""
+CompressionMiddleware: encoding negotiation, the size threshold, responses
+that are already encoded, and streamed bodies compressed chunk by chunk.
+"""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.utils import compression
+from app.utils.compression import CompressionMiddleware
+from app.utils.static import PrecompressedStaticFiles, SpaIndex
+
+MIN_SIZE = 256
+ROWS = [{"id": i, "name": f"employee {i}"} for i in range(50)]
+CHUNKS = [f'{{"id": {i}}}\n'.encode() * 40 for i in range(3)]
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "app.js").write_text("console.log('app');\n" * 100)
+    (tmp_path / "app.js.gz").write_bytes(
+        gzip.compress((tmp_path / "app.js").read_bytes())
+    )
+    (tmp_path / "index.html").write_text("<html>" + "<p>hrms</p>" * 100 + "</html>")
+    return tmp_path
+
+
+@pytest.fixture
+def compressed_client(static_dir):
+    app = FastAPI()
+    index = SpaIndex(static_dir / "index.html")
+
+    @app.get("/rows")
+    def rows():
+        return JSONResponse(ROWS)
+
+    @app.get("/small")
+    def small():
+        return JSONResponse({"ok": True})
+
+    @app.get("/")
+    def spa(request: Request) -> Response:
+        return index.response(request)
+
+    app.mount("/static", PrecompressedStaticFiles(directory=static_dir))
+    app.add_middleware(CompressionMiddleware, minimum_size=MIN_SIZE)
+    return TestClient(app)
+
+
+def test_json_list_is_gzipped(compressed_client):
+    response = compressed_client.get("/rows", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json() == ROWS
+
+
+def test_brotli_preferred_when_available(compressed_client, monkeypatch):
+    headers = {"Accept-Encoding": "gzip, br"}
+    monkeypatch.setattr(compression, "brotli", None)
+    response = compressed_client.get("/rows", headers=headers)
+    assert response.headers["Content-Encoding"] == "gzip"
+
+    monkeypatch.undo()
+    pytest.importorskip("brotli")
+    response = compressed_client.get("/rows", headers=headers)
+    assert response.headers["Content-Encoding"] == "br"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json() == ROWS
+
+
+def test_identity_when_not_accepted_or_below_minimum_size(compressed_client):
+    response = compressed_client.get("/rows", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in response.headers
+    assert response.json() == ROWS
+
+    response = compressed_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+def test_already_encoded_responses_pass_through(compressed_client, static_dir):
+    headers = {"Accept-Encoding": "gzip"}
+    response = compressed_client.get("/static/app.js", headers=headers)
+    assert response.headers["Content-Encoding"] == "gzip"
+    # Decoded once: the precompressed file was not gzipped a second time.
+    assert response.content == (static_dir / "app.js").read_bytes()
+
+    response = compressed_client.get("/", headers=headers)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.content == (static_dir / "index.html").read_bytes()
+
+
+def test_streamed_body_is_compressed_chunk_by_chunk():
+    async def chunks():
+        for chunk in CHUNKS:
+            yield chunk
+
+    async def app(scope, receive, send):
+        response = StreamingResponse(chunks(), media_type="application/x-ndjson")
+        await response(scope, receive, send)
+
+    async def receive():
+        # The client never disconnects; the finished response cancels this.
+        await asyncio.Event().wait()
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    asyncio.run(CompressionMiddleware(app, minimum_size=MIN_SIZE)(scope, receive, send))
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert b"Accept-Encoding" in headers[b"vary"]
+
+    # Every chunk is flushed on its own and decodes without the rest.
+    decoder = zlib.decompressobj(31)
+    streamed = [m for m in bodies if m.get("more_body")]
+    assert len(streamed) >= len(CHUNKS)
+    for message, chunk in zip(streamed, CHUNKS):
+        assert decoder.decompress(message["body"]) == chunk
+    assert decoder.decompress(bodies[-1]["body"]) + decoder.flush() == b""
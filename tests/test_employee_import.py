@@ -0,0 +1,65 @@
+"""
+Bulk CSV import: admins only, blank cells kept, saturated hashing reported
+per row.
+"""
+
+import asyncio
+
+from fastapi import HTTPException
+
+from app.database import SessionLocal
+from app.service import employee_import
+from tests.conftest import create_employee, login_headers
+
+HEADER = "employee_id,first_name,email,department,password\n"
+
+
+def _upload(client, headers, body):
+    return client.post(
+        "/api/v1/employees/import",
+        files={"file": ("employees.csv", HEADER + body, "text/csv")},
+        headers=headers,
+    )
+
+
+def test_import_requires_admin(client):
+    employee = create_employee(client, "IMP0001")
+    headers = login_headers(client, employee["email"], "secret123")
+    response = _upload(client, headers, "IMP0002,Ann,imp0002@example.com,HR,secret123\n")
+    assert response.status_code == 403
+
+
+def test_blank_department_is_accepted(client, admin_headers):
+    response = _upload(
+        client, admin_headers, "IMP0003,Ann,imp0003@example.com,,secret123\n"
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"processed": 1, "created": 1, "errors": []}
+
+
+def test_saturated_hashing_reports_rows_not_imported(client, monkeypatch):
+    hash_many = employee_import.password_hasher.hash_many
+    calls = []
+
+    async def saturated_after_first_batch(passwords):
+        calls.append(passwords)
+        if len(calls) > 1:
+            raise HTTPException(status_code=503, detail="Too many requests")
+        return await hash_many(passwords)
+
+    monkeypatch.setattr(
+        employee_import.password_hasher, "hash_many", saturated_after_first_batch
+    )
+    lines = [HEADER] + [
+        f"IMP01{n:02d},Ann,imp01{n:02d}@example.com,HR,secret123\n" for n in range(3)
+    ]
+    db = SessionLocal()
+    try:
+        result = asyncio.run(employee_import.import_employees(db, lines, batch_size=1))
+    finally:
+        db.close()
+
+    assert result["processed"] == 3
+    assert result["created"] == 1
+    assert [error["row"] for error in result["errors"]] == [3, 4]
+    assert all(error["error"].startswith("not imported") for error in result["errors"])
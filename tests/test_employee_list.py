@@ -0,0 +1,36 @@
+"""
+Keyset-paginated employee listing.
+"""
+
+from tests.conftest import create_employee
+
+
+def test_keyset_pages_and_total(client):
+    ids = [
+        create_employee(client, f"KEY{n:04d}", department="Keyset")["id"]
+        for n in range(3)
+    ]
+
+    response = client.get("/api/v1/employees/?department=Keyset&limit=2")
+    assert response.status_code == 200, response.text
+    page = response.json()
+    assert [row["id"] for row in page["items"]] == ids[:2]
+    assert page["total"] == 3
+    assert page["next_cursor"] == ids[1]
+
+    response = client.get(
+        f"/api/v1/employees/?department=Keyset&limit=2&after={page['next_cursor']}"
+        "&include_total=false"
+    )
+    page = response.json()
+    assert [row["id"] for row in page["items"]] == ids[2:]
+    assert page["next_cursor"] is None
+    assert page["total"] is None
+
+
+def test_employee_code_is_assigned_when_omitted(client):
+    create_employee(client, "EMP-0041")
+    first = create_employee(client, None)
+    second = create_employee(client, "")
+    assert first["employee_id"] == "EMP-0042"
+    assert second["employee_id"] == "EMP-0043"
@@ -0,0 +1,101 @@
+"""
+Streamed CSV / NDJSON exports of employees and attendance.
+"""
+
+import csv
+import io
+import json
+
+from app.database import crud
+from tests.conftest import create_employee, mark_attendance
+
+ATTENDANCE_RANGE = "from=2026-05-01&to=2026-05-31"
+
+
+def _csv_rows(response):
+    return list(csv.reader(io.StringIO(response.text)))
+
+
+def _ndjson_rows(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_employee_export_csv_and_ndjson(client, admin_headers):
+    first = create_employee(client, "EXP0001", department="Exports", city="Pune")
+    second = create_employee(client, "EXP0002", department="Exports")
+    url = "/api/v1/employees/export?department=Exports"
+
+    response = client.get(url, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="employees.csv"'
+    )
+    header, *rows = _csv_rows(response)
+    assert header == list(crud.EMPLOYEE_EXPORT_FIELDS)
+    assert [dict(zip(header, row))["employee_id"] for row in rows] == [
+        "EXP0001",
+        "EXP0002",
+    ]
+    assert dict(zip(header, rows[0]))["city"] == "Pune"
+
+    response = client.get(f"{url}&format=ndjson", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="employees.ndjson"'
+    )
+    rows = _ndjson_rows(response)
+    assert [row["id"] for row in rows] == [first["id"], second["id"]]
+    assert rows[0]["email"] == first["email"]
+    assert rows[0]["department"] == "Exports"
+    assert set(rows[0]) == set(crud.EMPLOYEE_EXPORT_FIELDS)
+
+
+def test_attendance_export_includes_departed_employees(client, admin_headers):
+    staying = create_employee(client, "EXP0101", department="Exports")["id"]
+    leaving = create_employee(client, "EXP0102", department="Exports")["id"]
+    for employee_id, day, status in (
+        (staying, "2026-05-04", "Present"),
+        (leaving, "2026-05-05", "Absent"),
+    ):
+        response = mark_attendance(client, employee_id, day, status)
+        assert response.status_code == 201, response.text
+    # Offboarding moves the leaver's attendance into the archive.
+    response = client.delete(f"/api/v1/employees/{leaving}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    url = f"/api/v1/attendance/export?{ATTENDANCE_RANGE}"
+    response = client.get(url, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-disposition"] == (
+        'attachment; filename="attendance_2026-05-01_2026-05-31.csv"'
+    )
+    header, *rows = _csv_rows(response)
+    assert header == list(crud.ATTENDANCE_EXPORT_FIELDS)
+    assert [row[2:] for row in rows] == [
+        ["EXP0101", "Test EXP0101", "Exports", "2026-05-04", "Present"],
+        ["EXP0102", "", "", "2026-05-05", "Absent"],
+    ]
+
+    response = client.get(f"{url}&format=ndjson", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-disposition"] == (
+        'attachment; filename="attendance_2026-05-01_2026-05-31.ndjson"'
+    )
+    rows = _ndjson_rows(response)
+    assert [(row["employee_code"], row["full_name"]) for row in rows] == [
+        ("EXP0101", "Test EXP0101"),
+        ("EXP0102", None),
+    ]
+    assert rows[1]["employee_id"] == leaving
+
+
+def test_exports_require_authentication(client):
+    for url in (
+        "/api/v1/employees/export",
+        f"/api/v1/attendance/export?{ATTENDANCE_RANGE}",
+    ):
+        assert client.get(url).status_code == 401
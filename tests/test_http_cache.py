@@ -0,0 +1,45 @@
+"""
+List endpoints answer If-None-Match with 304 until their table changes.
+"""
+
+from tests.conftest import create_employee
+
+
+def _revalidate(client, url, etag, headers=None):
+    return client.get(url, headers={**(headers or {}), "If-None-Match": etag})
+
+
+def test_employee_list_not_modified_until_an_employee_changes(client):
+    url = "/api/v1/employees/?limit=5"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"employees-')
+
+    response = _revalidate(client, url, etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    create_employee(client, "ETG0001")
+    response = _revalidate(client, url, etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_department_list_not_modified_until_a_department_changes(
+    client, admin_headers
+):
+    url = "/api/v1/departments/"
+    response = client.get(url, headers=admin_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Vary"] == "Authorization"
+
+    assert _revalidate(client, url, etag, admin_headers).status_code == 304
+
+    response = client.post(url, json={"name": "ETag Dept"}, headers=admin_headers)
+    assert response.status_code == 201, response.text
+    response = _revalidate(client, url, etag, admin_headers)
+    assert response.status_code == 200
+    assert "ETag Dept" in {row["name"] for row in response.json()}
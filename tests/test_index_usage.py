@@ -0,0 +1,22 @@
+"""
+The hot user/employee lookups must be served by indexes: every SELECT they
+issue is EXPLAINed and a full table scan fails the test.
+"""
+
+import pytest
+
+from app.check_indexes import CHECKS, full_scans, query_plans
+
+
+@pytest.mark.parametrize(
+    "call", [call for _, call in CHECKS], ids=[description for description, _ in CHECKS]
+)
+def test_lookup_uses_indexes(client, call):
+    plans = query_plans(call)
+    assert plans, "issued no SELECT to check"
+    scans = [
+        f"{scan}: {' '.join(statement.split())}"
+        for statement, plan in plans
+        for scan in full_scans(plan)
+    ]
+    assert not scans, "\n".join(scans)
@@ -0,0 +1,81 @@
+"""
+Metrics from several worker processes are merged through the shared
+multiprocess directory.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+from app.utils.metrics import (
+    MetricsRegistry,
+    clear_multiprocess_directory,
+    mark_process_dead,
+)
+from tests.conftest import ROOT_DIR
+
+INCREMENTS = 2000
+
+# A worker: one live gauge, then a counter and a histogram updated in a loop.
+WORKER = f"""
+from app.utils.metrics import registry
+
+requests = registry.counter("requests_total", "Requests.", ("route",))
+latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+in_flight = registry.gauge("in_flight", "In flight.")
+in_flight.set(1)
+for _ in range({INCREMENTS}):
+    requests.inc(route="/a")
+    latency.observe(0.05)
+"""
+
+
+def _start_worker(directory):
+    env = dict(os.environ, METRICS_MULTIPROC_DIR=str(directory))
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    return subprocess.Popen([sys.executable, "-c", WORKER], cwd=ROOT_DIR, env=env)
+
+
+def _requests_total(text):
+    match = re.search(r'^requests_total\{route="/a"\} (\S+)$', text, re.MULTILINE)
+    return float(match.group(1)) if match else 0
+
+
+def test_scrapes_during_writes_see_growing_totals(tmp_path):
+    clear_multiprocess_directory(str(tmp_path))
+    scraper = MetricsRegistry(str(tmp_path))
+    workers = [_start_worker(tmp_path) for _ in range(2)]
+
+    seen = []
+    while any(worker.poll() is None for worker in workers):
+        seen.append(_requests_total(scraper.render()))
+    assert [worker.returncode for worker in workers] == [0, 0]
+    assert seen == sorted(seen)
+
+    text = scraper.render()
+    assert _requests_total(text) == 2 * INCREMENTS
+    assert f'latency_seconds_bucket{{le="0.1"}} {2 * INCREMENTS}.0' in text
+    assert f"latency_seconds_count {2 * INCREMENTS}.0" in text
+
+
+def test_dead_worker_keeps_totals_but_not_gauges(tmp_path):
+    clear_multiprocess_directory(str(tmp_path))
+    scraper = MetricsRegistry(str(tmp_path))
+    workers = [_start_worker(tmp_path) for _ in range(2)]
+    for worker in workers:
+        assert worker.wait() == 0
+
+    text = scraper.render()
+    assert text.count("in_flight{pid=") == 2
+
+    mark_process_dead(str(tmp_path), workers[0].pid)
+    text = scraper.render()
+    assert f'in_flight{{pid="{workers[0].pid}"}}' not in text
+    assert f'in_flight{{pid="{workers[1].pid}"}} 1.0' in text
+    assert _requests_total(text) == 2 * INCREMENTS
+
+
+def test_metrics_endpoint_is_off_by_default(client):
+    response = client.get("/metrics")
+    assert "http_request_duration_seconds" not in response.text
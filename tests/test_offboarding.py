@@ -0,0 +1,52 @@
+"""
+Offboarding archives an employee's attendance under their employee_id, so
+a new employee who is given the same user id starts with no history.
+"""
+
+from app import models
+from app.database import SessionLocal
+from tests.conftest import create_employee, mark_attendance
+
+
+def test_offboard_stamps_archive_and_reused_id_starts_clean(client, admin_headers):
+    departed = create_employee(client, "OFF0001")
+    for day, status in (("2026-02-02", "Present"), ("2026-02-03", "Absent")):
+        response = mark_attendance(client, departed["id"], day, status)
+        assert response.status_code == 201, response.text
+
+    response = client.post(
+        "/api/v1/employees/offboard",
+        json={"employee_ids": [departed["id"], 999999]},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"deleted": 1, "not_found": [999999]}
+
+    db = SessionLocal()
+    try:
+        codes = {
+            row.employee_code
+            for row in db.query(models.AttendanceArchive).filter(
+                models.AttendanceArchive.employee_id == departed["id"]
+            )
+        }
+    finally:
+        db.close()
+    assert codes == {"OFF0001"}
+
+    # SQLite hands out the highest deleted rowid again.
+    successor = create_employee(client, "OFF0002")
+    assert successor["id"] == departed["id"]
+    response = client.get(
+        f"/api/v1/attendance/{successor['id']}?from=2026-01-01&to=2026-12-31"
+    )
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+def test_offboard_requires_admin(client):
+    employee = create_employee(client, "OFF0003")
+    response = client.post(
+        "/api/v1/employees/offboard", json={"employee_ids": [employee["id"]]}
+    )
+    assert response.status_code == 401
@@ -0,0 +1,52 @@
+"""
+Pool telemetry: only checkouts that find the pool exhausted count as
+waiting.
+"""
+
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.database.pool_metrics import (
+    InstrumentedQueuePool,
+    _in_use,
+    _timeouts,
+    _waiting,
+    instrument_engine,
+)
+
+
+def test_waiting_counts_only_queued_checkouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.5,
+    )
+    instrument_engine(engine, "test_pool")
+
+    held = engine.connect()
+    assert _in_use.value(pool="test_pool") == 1
+    assert _waiting.value(pool="test_pool") == 0
+
+    def queued_checkout():
+        try:
+            engine.connect()
+        except PoolTimeoutError:
+            pass
+
+    thread = threading.Thread(target=queued_checkout)
+    thread.start()
+    deadline = time.monotonic() + 0.4
+    while not _waiting.value(pool="test_pool") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _waiting.value(pool="test_pool") == 1
+    thread.join()
+
+    assert _waiting.value(pool="test_pool") == 0
+    assert _timeouts.value(pool="test_pool") == 1
+    held.close()
+    engine.dispose()
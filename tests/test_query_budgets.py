@@ -0,0 +1,75 @@
+"""
+Query budgets for the hot endpoints. A failure lists every statement the
+request issued; raise a budget only together with the change that needs it.
+"""
+
+import itertools
+
+import pytest
+
+from tests.conftest import (
+    ADMIN_PASSWORD,
+    ADMIN_USERNAME,
+    create_employee,
+    mark_attendance,
+)
+
+
+@pytest.fixture(scope="module")
+def employee_ids(client):
+    ids = [create_employee(client, f"QB{number:04d}")["id"] for number in (1, 2, 3)]
+    ids.append(create_employee(client, "QB0004", department="Sales")["id"])
+    for day, employee_id in itertools.product(("2026-01-05", "2026-01-06"), ids):
+        response = mark_attendance(client, employee_id, day)
+        assert response.status_code == 201, response.text
+    return ids
+
+
+def test_list_employees(client, employee_ids, query_budget):
+    with query_budget(3):
+        response = client.get("/api/v1/employees/?limit=2")
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+
+def test_list_employees_is_independent_of_page_size(client, employee_ids, query_budget):
+    with query_budget(3):
+        response = client.get("/api/v1/employees/?limit=500")
+    assert response.status_code == 200
+    assert len(response.json()["items"]) >= len(employee_ids)
+
+
+def test_mark_attendance(client, employee_ids, query_budget):
+    with query_budget(3):
+        response = mark_attendance(client, employee_ids[0], "2026-01-07", "Absent")
+    assert response.status_code == 201, response.text
+
+
+def test_login(client, query_budget):
+    with query_budget(1):
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD},
+        )
+    assert response.status_code == 200, response.text
+
+
+# Reports may also read the caller's token_version when it is not cached.
+def test_employee_report(client, employee_ids, admin_headers, query_budget):
+    with query_budget(3):
+        response = client.get(
+            "/api/v1/reports/attendance/employees?from=2026-01-01&to=2026-01-31",
+            headers=admin_headers,
+        )
+    assert response.status_code == 200
+    assert len(response.json()) >= len(employee_ids)
+
+
+def test_department_report(client, employee_ids, admin_headers, query_budget):
+    with query_budget(3):
+        response = client.get(
+            "/api/v1/reports/attendance/departments?from=2026-01-01&to=2026-01-31",
+            headers=admin_headers,
+        )
+    assert response.status_code == 200
+    assert {row["department"] for row in response.json()} >= {"Engineering", "Sales"}
@@ -0,0 +1,57 @@
+"""
+Read-only crud calls go to a replica and fall back to the primary when the
+replica is unreachable.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.database import get_db
+from app.database.routing import ReplicaSet, RoutingSession, _failures, _reads
+from app.database.session import engine
+from app.main import app
+
+
+@pytest.fixture
+def replicas(client, tmp_path):
+    replica_set = ReplicaSet(
+        {
+            # Same database as the primary, so its answers can be compared.
+            "replica1": create_engine(str(engine.url)),
+            # The directory does not exist, so every connection attempt fails.
+            "replica2": create_engine(f"sqlite:///{tmp_path / 'missing' / 'db'}"),
+        },
+        retry_seconds=60,
+    )
+
+    def routed_db():
+        db = RoutingSession(bind=engine, replicas=replica_set)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = routed_db
+    yield replica_set
+    del app.dependency_overrides[get_db]
+    replica_set.dispose()
+
+
+def test_failed_replica_falls_back_to_primary(client, replicas):
+    assert not os.path.exists(replicas.engines["replica2"].url.database)
+    served = _reads.value(target="replica1")
+    failed = _failures.value(replica="replica2")
+
+    # Round-robin: the first request reads replica1, the second replica2.
+    first = client.get("/api/v1/employees/?limit=5")
+    second = client.get("/api/v1/employees/?limit=5")
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert _reads.value(target="replica1") > served
+    # One failure pins the rest of that request to the primary.
+    assert _failures.value(replica="replica2") == failed + 1
+
+    # replica2 is skipped until its cooldown expires.
+    assert [replicas.choose() for _ in range(3)] == ["replica1"] * 3
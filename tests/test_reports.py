@@ -0,0 +1,113 @@
+"""
+Attendance reports, and the daily summary kept up to date by marks.
+"""
+
+import json
+
+from app.config import get_settings
+from tests.conftest import create_employee, mark_attendance
+
+RANGE = "from=2026-04-01&to=2026-04-30"
+
+
+def _department_totals(client, headers, department):
+    response = client.get(
+        f"/api/v1/reports/attendance/departments?{RANGE}", headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return next(row for row in response.json() if row["department"] == department)
+
+
+def test_summary_follows_marks_and_matches_rebuild(client, admin_headers, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "attendance_summary_enabled", True)
+    monkeypatch.setattr(settings, "attendance_upsert", True)
+    first = create_employee(client, "SUM0001", department="Summary")["id"]
+    second = create_employee(client, "SUM0002", department="Summary")["id"]
+    for employee_id, day, status in (
+        (first, "2026-04-01", "Present"),
+        (second, "2026-04-01", "Absent"),
+        (first, "2026-04-02", "Absent"),
+        # Re-marking moves the count to the other column.
+        (first, "2026-04-02", "Present"),
+    ):
+        response = mark_attendance(client, employee_id, day, status)
+        assert response.status_code == 201, response.text
+
+    expected = {
+        "department": "Summary",
+        "present": 2,
+        "absent": 1,
+        "attendance_rate": 0.6667,
+    }
+    assert _department_totals(client, admin_headers, "Summary") == expected
+
+    response = client.get(
+        f"/api/v1/reports/attendance/employees?{RANGE}&department=Summary",
+        headers=admin_headers,
+    )
+    totals = [(row["present"], row["absent"]) for row in response.json()]
+    assert totals == [(2, 0), (0, 1)]
+
+    response = client.post(
+        f"/api/v1/reports/attendance/summary/rebuild?{RANGE}", headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    assert _department_totals(client, admin_headers, "Summary") == expected
+
+
+def test_rebuild_range_is_bounded(client, admin_headers):
+    response = client.post(
+        "/api/v1/reports/attendance/summary/rebuild?from=2025-01-01&to=2026-12-31",
+        headers=admin_headers,
+    )
+    assert response.status_code == 422
+
+
+def test_offboarding_removes_counts_from_summary(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(get_settings(), "attendance_summary_enabled", True)
+    staying = create_employee(client, "SUM0101", department="Departing")["id"]
+    leaving = create_employee(client, "SUM0102", department="Departing")["id"]
+    for employee_id, day, status in (
+        (staying, "2026-04-06", "Present"),
+        (leaving, "2026-04-06", "Absent"),
+        # A day only the departing employee was marked on.
+        (leaving, "2026-04-07", "Present"),
+    ):
+        response = mark_attendance(client, employee_id, day, status)
+        assert response.status_code == 201, response.text
+    assert _department_totals(client, admin_headers, "Departing")["absent"] == 1
+
+    response = client.delete(f"/api/v1/employees/{leaving}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    before = client.get(
+        f"/api/v1/reports/attendance/departments?{RANGE}", headers=admin_headers
+    ).json()
+    assert _department_totals(client, admin_headers, "Departing") == {
+        "department": "Departing",
+        "present": 1,
+        "absent": 0,
+        "attendance_rate": 1.0,
+    }
+
+    response = client.post(
+        f"/api/v1/reports/attendance/summary/rebuild?{RANGE}", headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    after = client.get(
+        f"/api/v1/reports/attendance/departments?{RANGE}", headers=admin_headers
+    ).json()
+    assert after == before
+
+
+def test_employee_report_streams_ndjson(client, admin_headers):
+    employee_id = create_employee(client, "SUM0201", department="Streamed")["id"]
+    response = mark_attendance(client, employee_id, "2026-04-08")
+    assert response.status_code == 201, response.text
+
+    url = f"/api/v1/reports/attendance/employees?{RANGE}&department=Streamed"
+    expected = client.get(url, headers=admin_headers).json()
+    response = client.get(f"{url}&format=ndjson", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == expected
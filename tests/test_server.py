@@ -0,0 +1,85 @@
+"""
+The production launcher: worker count, the settings handed to gunicorn, and
+the post-fork hook that drops connections inherited from the master.
+"""
+
+import os
+from types import SimpleNamespace
+
+from app import config, server
+from app.database import async_session, session
+from app.utils.cache import get_cache_backend
+
+
+def _settings(**overrides):
+    values = dict(
+        server_host="0.0.0.0",
+        server_port=8000,
+        server_workers=3,
+        server_keepalive=5,
+        server_backlog=2048,
+        server_max_requests=1000,
+        server_max_requests_jitter=100,
+        server_graceful_timeout=30,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_worker_count_defaults_to_available_cpus(monkeypatch):
+    assert server.worker_count(3) == 3
+
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+    assert server.worker_count(0) == 2
+
+    monkeypatch.delattr(os, "sched_getaffinity", raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 6)
+    assert server.worker_count(0) == 6
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert server.worker_count(0) == 1
+
+
+def test_gunicorn_options_follow_settings():
+    options = server.gunicorn_options(_settings())
+    assert options == {
+        "bind": "0.0.0.0:8000",
+        "workers": 3,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "keepalive": 5,
+        "backlog": 2048,
+        "max_requests": 1000,
+        "max_requests_jitter": 100,
+        "graceful_timeout": 30,
+        "accesslog": "-",
+        "post_fork": server.post_fork,
+        "child_exit": server.child_exit,
+    }
+
+
+def test_post_fork_drops_inherited_pools_and_clients():
+    pool = session.engine.pool
+    async_session.get_async_engine()
+    backend = get_cache_backend()
+
+    server.post_fork(server=None, worker=None)
+
+    assert session.engine.pool is not pool
+    assert async_session._async_engine is None
+    assert get_cache_backend() is not backend
+
+
+def test_hash_workers_default_splits_cpus_between_server_workers(monkeypatch):
+    monkeypatch.setattr(config, "available_cpus", lambda: 8)
+    monkeypatch.delenv("PASSWORD_HASH_WORKERS", raising=False)
+
+    monkeypatch.setenv("SERVER_WORKERS", "2")
+    assert config.Settings().password_hash_workers == 4
+    monkeypatch.setenv("SERVER_WORKERS", "16")
+    assert config.Settings().password_hash_workers == 1
+    # One server worker per CPU.
+    monkeypatch.setenv("SERVER_WORKERS", "0")
+    assert config.Settings().password_hash_workers == 1
+
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "3")
+    assert config.Settings().password_hash_workers == 3
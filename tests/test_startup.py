@@ -0,0 +1,22 @@
+"""
+Application startup runs no schema work unless INIT_DB_ON_STARTUP is set.
+"""
+
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+def test_startup_skips_init_db_unless_enabled(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "init_db", lambda: calls.append("init_db"))
+
+    monkeypatch.setattr(main.settings, "init_db_on_startup", False)
+    with TestClient(main.app) as test_client:
+        assert test_client.get("/api/v1/employees/?limit=1").status_code == 200
+    assert calls == []
+
+    monkeypatch.setattr(main.settings, "init_db_on_startup", True)
+    with TestClient(main.app):
+        pass
+    assert calls == ["init_db"]
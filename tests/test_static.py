@@ -0,0 +1,101 @@
+"""
+Built frontend serving: precompressed siblings chosen by Accept-Encoding,
+cache lifetimes for hashed assets and index.html, and revalidation.
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from app.utils.static import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    PrecompressedStaticFiles,
+    SpaIndex,
+)
+
+BUNDLE = b"console.log('bundle');\n" * 100
+INDEX = b"<html><body><div id='root'></div></body></html>"
+
+
+@pytest.fixture
+def dist(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "index-3f2a9c.js").write_bytes(BUNDLE)
+    # Distinct bodies show which sibling was served.
+    (assets / "index-3f2a9c.js.br").write_bytes(b"brotli bytes")
+    (assets / "index-3f2a9c.js.gz").write_bytes(gzip.compress(BUNDLE))
+    (tmp_path / "favicon.svg").write_bytes(b"<svg></svg>")
+    (tmp_path / "index.html").write_bytes(INDEX)
+    return tmp_path
+
+
+@pytest.fixture
+def static_client(dist):
+    app = FastAPI()
+    index = SpaIndex(dist / "index.html")
+
+    @app.get("/")
+    def spa(request: Request) -> Response:
+        return index.response(request)
+
+    app.mount("/static", PrecompressedStaticFiles(directory=dist))
+    return TestClient(app)
+
+
+def _get(client, url, encoding, **headers):
+    # Undecoded, so the served bytes can be compared with the sibling files.
+    with client.stream(
+        "GET", url, headers={"Accept-Encoding": encoding, **headers}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_precompressed_sibling_follows_accept_encoding(static_client, dist):
+    url = "/static/assets/index-3f2a9c.js"
+
+    response, body = _get(static_client, url, "gzip, br")
+    assert response.headers["Content-Encoding"] == "br"
+    assert body == b"brotli bytes"
+    assert response.headers["Content-Type"].startswith("text/javascript")
+
+    response, body = _get(static_client, url, "gzip, br;q=0")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == BUNDLE
+
+    response, body = _get(static_client, url, "identity")
+    assert "Content-Encoding" not in response.headers
+    assert body == BUNDLE
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_hashed_assets_are_immutable_and_others_revalidate(static_client):
+    response = static_client.get("/static/assets/index-3f2a9c.js")
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+
+    response = static_client.get("/static/favicon.svg")
+    assert response.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+
+    response = static_client.get("/")
+    assert response.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+    assert response.content == INDEX
+
+
+def test_matching_etag_gets_not_modified(static_client):
+    url = "/static/assets/index-3f2a9c.js"
+    etag = static_client.get(url, headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response = static_client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    # One ETag covers both encodings of index.html.
+    etag = static_client.get("/", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response, body = _get(static_client, "/", "identity", **{"If-None-Match": etag})
+    assert response.status_code == 304
+    assert body == b""
+    assert response.headers["ETag"] == etag